@@ -0,0 +1,13 @@
+"""Benchmarks for the efu package.
+
+Run the suite from the repository root with ``python -m benchmarks``; see
+:mod:`benchmarks.run` for the options and :mod:`benchmarks.synthetic` for
+the generated input data.
+"""
+
+import pathlib
+import sys
+
+_SRC = str(pathlib.Path(__file__).resolve().parents[1] / "src")
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
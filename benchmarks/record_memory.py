@@ -0,0 +1,57 @@
+"""Compare the memory footprint of EfuRecord and CompactEfuRecord.
+
+Run from the repository root::
+
+    python benchmarks/record_memory.py [COUNT]
+
+Prints one JSON object with the traced bytes per record for each type.
+The same comparison is part of the ``python -m benchmarks`` report.
+"""
+
+import json
+import pathlib
+import sys
+import tracemalloc
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from efu import CompactEfuRecord, EfuRecord, EfuSchema  # noqa: E402
+
+HEADERS = ["Filename", "Size", "Date Modified", "Date Created", "Attributes"]
+
+
+def _values(i):
+    return {
+        "Filename": f"C:\\data\\dir{i % 100}\\file{i}.txt",
+        "Size": i * 7,
+        "Date Modified": 133262362720000000 + i,
+        "Date Created": 133262362720000000 + i,
+        "Attributes": 32,
+    }
+
+
+def measure(factory, count):
+    """Return traced bytes per record for ``count`` records built by ``factory``."""
+    payload = [_values(i) for i in range(count)]
+    tracemalloc.start()
+    records = [factory(values) for values in payload]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return current / count
+
+
+def run(count=100_000):
+    schema = EfuSchema(HEADERS)
+    results = {
+        "count": count,
+        "EfuRecord": measure(lambda v: EfuRecord(HEADERS, v), count),
+        "CompactEfuRecord": measure(lambda v: CompactEfuRecord(schema, v), count),
+    }
+    results["ratio"] = results["EfuRecord"] / results["CompactEfuRecord"]
+    return results
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(json.dumps(run(count), indent=2))
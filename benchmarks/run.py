@@ -0,0 +1,211 @@
+"""Throughput and peak memory of the main efu entry points.
+
+Run from the repository root::
+
+    python -m benchmarks [--rows N] [--files N] [--repeat N] [--only NAME ...]
+
+A synthetic EFU file (see :mod:`benchmarks.synthetic`) and a synthetic
+directory tree are generated in a temporary directory, then each benchmark
+is timed ``repeat`` times and run once more under :mod:`tracemalloc`. The
+result is one JSON object on stdout (or in ``--output``) with the Python
+version, platform, git commit and inputs, and per benchmark the best time,
+rows per second, input megabytes per second and the traced peak of memory
+allocated during the call. Save the output of two commits and compare the
+``rows_per_second`` and ``peak_memory`` values.
+"""
+
+import argparse
+import json
+import os
+import pathlib
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from efu import (
+    EfuRecords,
+    array_to_efu,
+    efu_to_array,
+    efu_to_objects,
+    objects_to_efu,
+)
+
+from . import record_memory
+from .synthetic import HEADER_FIELDS, generate_efu, generate_tree
+
+BENCHMARKS = (
+    "efu_to_array",
+    "efu_to_objects",
+    "array_to_efu",
+    "objects_to_efu",
+    "extend_from_directory",
+)
+
+_ROOT = pathlib.Path(__file__).resolve().parents[1]
+
+
+def _commit() -> Optional[str]:
+    """Return the checked out git commit, or ``None`` outside a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=str(_ROOT),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def measure(func: Callable[[], Any], count: int, size: int, repeat: int = 3) -> Dict[str, Any]:
+    """Time ``func`` over ``count`` rows and ``size`` input bytes.
+
+    Returns the best of ``repeat`` timings and the peak traced memory of
+    one extra call; tracing slows the code down, so it is kept out of the
+    timed calls.
+    """
+    best = float("inf")
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "rows": count,
+        "seconds": best,
+        "rows_per_second": count / best if best else None,
+        "mb_per_second": size / best / 1e6 if best else None,
+        "peak_memory": peak,
+    }
+
+
+def run(
+    rows: int = 100_000,
+    files: int = 5_000,
+    repeat: int = 3,
+    seed: int = 0,
+    newline: str = "\r\n",
+    only: Optional[Sequence[str]] = None,
+    record_count: Optional[int] = None,
+    tmp_dir: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Run the benchmarks and return the report as a dictionary.
+
+    ``rows`` sets the size of the generated EFU file and ``files`` the
+    number of entries in the generated tree. ``only`` selects benchmarks by
+    name from :data:`BENCHMARKS`; ``"record_memory"`` may be listed too. The
+    record memory comparison of :mod:`benchmarks.record_memory` uses
+    ``record_count`` records, by default ``min(rows, 100000)``.
+    """
+    selected = list(only) if only is not None else list(BENCHMARKS) + ["record_memory"]
+    unknown = [name for name in selected if name not in BENCHMARKS and name != "record_memory"]
+    if unknown:
+        raise ValueError(f"unknown benchmarks: {', '.join(unknown)}")
+
+    report: Dict[str, Any] = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "commit": _commit(),
+        "seed": seed,
+        "rows": rows,
+        "files": files,
+        "newline": "crlf" if newline == "\r\n" else "lf",
+        "input_bytes": 0,
+        "results": {},
+    }
+    results: Dict[str, Any] = report["results"]
+
+    with tempfile.TemporaryDirectory(prefix="efu-bench-", dir=tmp_dir) as tmp:
+        efu_path = os.path.join(tmp, "input.efu")
+        out_path = os.path.join(tmp, "output.efu")
+        generate_efu(efu_path, rows, seed=seed, newline=newline)
+        size = os.path.getsize(efu_path)
+        report["input_bytes"] = size
+
+        if "efu_to_array" in selected:
+            results["efu_to_array"] = measure(lambda: efu_to_array(efu_path), rows, size, repeat)
+        if "efu_to_objects" in selected:
+            results["efu_to_objects"] = measure(lambda: efu_to_objects(efu_path), rows, size, repeat)
+        if "array_to_efu" in selected:
+            array, _, _ = efu_to_array(efu_path)
+            results["array_to_efu"] = measure(
+                lambda: array_to_efu(array, HEADER_FIELDS, out_path, newline=newline),
+                rows, size, repeat,
+            )
+            del array
+        if "objects_to_efu" in selected:
+            objects = efu_to_objects(efu_path)
+            results["objects_to_efu"] = measure(
+                lambda: objects_to_efu(objects, out_path, newline=newline, headers=HEADER_FIELDS),
+                rows, size, repeat,
+            )
+            del objects
+        if "extend_from_directory" in selected:
+            tree = os.path.join(tmp, "tree")
+            entries = generate_tree(tree, files, seed=seed)
+            results["extend_from_directory"] = measure(
+                lambda: EfuRecords().extend_from_directory(tree, HEADER_FIELDS),
+                entries, 0, repeat,
+            )
+            del results["extend_from_directory"]["mb_per_second"]
+
+    if "record_memory" in selected:
+        results["record_memory"] = record_memory.run(
+            record_count if record_count is not None else min(rows, 100_000)
+        )
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark efu on synthetic data and print a JSON report.",
+    )
+    parser.add_argument(
+        "--rows", type=int, default=100_000, help="rows in the generated EFU file (default 100000)"
+    )
+    parser.add_argument(
+        "--files", type=int, default=5_000, help="entries in the generated directory tree (default 5000)"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per benchmark (default 3)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default 0)")
+    parser.add_argument(
+        "--newline", choices=["crlf", "lf"], default="crlf",
+        help="line endings of the generated file (default crlf)",
+    )
+    parser.add_argument(
+        "--only", nargs="+", metavar="NAME", choices=list(BENCHMARKS) + ["record_memory"],
+        help="run only these benchmarks",
+    )
+    parser.add_argument("--tmp-dir", help="directory for the generated data")
+    parser.add_argument("-o", "--output", help="write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    report = run(
+        rows=args.rows,
+        files=args.files,
+        repeat=args.repeat,
+        seed=args.seed,
+        newline="\r\n" if args.newline == "crlf" else "\n",
+        only=args.only,
+        tmp_dir=args.tmp_dir,
+    )
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
@@ -0,0 +1,208 @@
+"""Deterministic synthetic EFU data for benchmarks.
+
+The generator walks an imaginary drive in pre-order, the way Everything
+lists a folder before its contents, and emits one row per folder or file.
+Its defaults follow the shape of ``samples/sample1.efu``: about 6% folders,
+most entries five to seven levels deep, folder sizes ``0``, 18-digit
+FILETIME dates and the common attribute values. On top of that a small
+share of names contain quotes, commas, spaces or non-ASCII letters, and
+some Size values are empty, so the quoting and empty-field paths of the
+parser and writer are exercised.
+
+The same ``seed`` and options always give the same rows. Rows are produced
+lazily and written through :class:`efu.EfuWriter`, so memory use does not
+depend on the row count and files of 10M rows or more can be generated.
+
+Generate a file from the repository root with::
+
+    python -m benchmarks.synthetic OUTPUT ROWS [--seed N] [--newline lf]
+"""
+
+import argparse
+import os
+import random
+from typing import Iterator, List, Optional
+
+from efu import EfuWriter
+
+HEADER_FIELDS = ["Filename", "Size", "Date Modified", "Date Created", "Attributes"]
+
+# 2021-05-01 and about three years of ticks after it.
+_FIRST_FILETIME = 132642720000000000
+_FILETIME_SPAN = 3 * 365 * 24 * 3600 * 10_000_000
+
+_FOLDER_WORDS = [
+    "Users", "Documents", "Projects", "Photos", "Music", "Videos", "Downloads",
+    "Archive", "Backup", "src", "build", "lib", "include", "assets", "data",
+    "reports", "config", "cache", "logs", "tests", "docs", "images", "2022",
+    "2023", "2024", "Q1", "Q2", "Q3", "Q4", "clients", "drafts", "shared",
+]
+_FILE_WORDS = [
+    "report", "invoice", "notes", "summary", "photo", "IMG", "track", "scan",
+    "budget", "readme", "index", "main", "utils", "setup", "draft", "export",
+    "backup", "letter", "chart", "thumbnail", "config", "module", "schema",
+]
+_EXTENSIONS = [
+    ".txt", ".docx", ".xlsx", ".pdf", ".jpg", ".png", ".mp3", ".mp4", ".py",
+    ".js", ".dll", ".exe", ".json", ".xml", ".zip", ".log", ".csv", ".h",
+]
+_NON_ASCII = ["é", "ü", "ñ", "ø", "日本", "Москва", "ß"]
+# Attribute values and weights for files: archive, read-only and hidden
+# archive files, plain files and not-content-indexed archive files.
+_FILE_ATTRIBUTES = ["32", "33", "34", "128", "8224"]
+_FILE_ATTRIBUTE_WEIGHTS = [93, 3, 2, 1, 1]
+
+
+def _name(
+    rng: random.Random,
+    words: List[str],
+    quote_rate: float,
+    comma_rate: float,
+    space_rate: float,
+    non_ascii_rate: float,
+) -> str:
+    name = rng.choice(words)
+    if rng.random() < non_ascii_rate:
+        name += rng.choice(_NON_ASCII)
+    if rng.random() < space_rate:
+        name += " " + rng.choice(words)
+    if rng.random() < comma_rate:
+        name += ", " + rng.choice(words)
+    if rng.random() < quote_rate:
+        name = f'"{name}"'
+    return f"{name}{rng.randrange(1000)}"
+
+
+def iter_synthetic_rows(
+    count: int,
+    seed: int = 0,
+    drive: str = "C:",
+    mean_depth: int = 6,
+    max_depth: int = 16,
+    folder_rate: float = 0.06,
+    quote_rate: float = 0.003,
+    comma_rate: float = 0.005,
+    space_rate: float = 0.1,
+    non_ascii_rate: float = 0.02,
+    empty_size_rate: float = 0.01,
+) -> Iterator[List[str]]:
+    """Yield ``count`` synthetic string rows with :data:`HEADER_FIELDS`.
+
+    ``mean_depth`` is the typical number of path separators, ``folder_rate``
+    the share of folder rows, and the ``*_rate`` options the share of names
+    with a quote, a comma, a space or a non-ASCII letter and of rows with an
+    empty Size. Name rates apply to each path component, so the share of
+    paths containing such a name is several times higher.
+    """
+    if count < 0:
+        raise ValueError("count must not be negative")
+    rng = random.Random(seed)
+    # Folder paths from the drive down to the current folder.
+    stack = [drive]
+    for _ in range(count):
+        depth = len(stack)
+        is_folder = depth < max_depth and rng.random() < folder_rate
+        words = _FOLDER_WORDS if is_folder else _FILE_WORDS
+        name = _name(rng, words, quote_rate, comma_rate, space_rate, non_ascii_rate)
+        if not is_folder:
+            name += rng.choice(_EXTENSIONS)
+        path = stack[-1] + "\\" + name
+
+        modified = _FIRST_FILETIME + rng.randrange(_FILETIME_SPAN)
+        created = modified - rng.randrange(modified - _FIRST_FILETIME + 1)
+        if rng.random() < empty_size_rate:
+            size = ""
+        elif is_folder:
+            size = "0"
+        else:
+            size = str(int(rng.lognormvariate(9.0, 2.5)))
+        if is_folder:
+            attributes = "16"
+        else:
+            attributes = rng.choices(_FILE_ATTRIBUTES, _FILE_ATTRIBUTE_WEIGHTS)[0]
+        yield [path, size, str(modified), str(created), attributes]
+
+        if is_folder:
+            stack.append(path)
+        elif depth > 1:
+            # Leave folders more readily the deeper they are, which keeps
+            # most entries around ``mean_depth``.
+            leave = folder_rate * (2.0 if depth > mean_depth else 0.5)
+            while len(stack) > 1 and rng.random() < leave:
+                stack.pop()
+
+
+def generate_efu(
+    file_path: str,
+    count: int,
+    seed: int = 0,
+    newline: str = "\r\n",
+    encoding: str = "utf-8",
+    **options: float,
+) -> int:
+    """Write ``count`` synthetic rows to ``file_path`` and return the row count.
+
+    ``options`` are passed to :func:`iter_synthetic_rows`. The file may end
+    in ``.gz``, ``.bz2`` or ``.xz`` like any other EFU output.
+    """
+    with EfuWriter(file_path, newline=newline, encoding=encoding) as writer:
+        writer.write_header(HEADER_FIELDS)
+        writer.write_rows(iter_synthetic_rows(count, seed=seed, **options))  # type: ignore[arg-type]
+        return writer.rows_written
+
+
+def generate_tree(
+    dir_path: str,
+    count: int,
+    seed: int = 0,
+    files_per_folder: int = 20,
+    max_depth: int = 4,
+) -> int:
+    """Create a directory tree with ``count`` entries under ``dir_path``.
+
+    Files are empty and names avoid quotes so the tree can be created on
+    any platform. Returns the number of files and folders created.
+    """
+    rng = random.Random(seed)
+    os.makedirs(dir_path, exist_ok=True)
+    folders = [(dir_path, 0)]
+    created = 0
+    while created < count:
+        parent, depth = folders[rng.randrange(len(folders))]
+        if depth < max_depth and rng.randrange(files_per_folder) == 0:
+            name = _name(rng, _FOLDER_WORDS, 0.0, 0.02, 0.1, 0.02)
+            path = os.path.join(parent, name)
+            if os.path.exists(path):
+                continue
+            os.mkdir(path)
+            folders.append((path, depth + 1))
+        else:
+            name = _name(rng, _FILE_WORDS, 0.0, 0.02, 0.1, 0.02) + rng.choice(_EXTENSIONS)
+            path = os.path.join(parent, name)
+            if os.path.exists(path):
+                continue
+            open(path, "wb").close()
+        created += 1
+    return created
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.synthetic",
+        description="Write a deterministic synthetic EFU file.",
+    )
+    parser.add_argument("output", help="EFU file to write")
+    parser.add_argument("rows", type=int, help="number of rows")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default 0)")
+    parser.add_argument(
+        "--newline", choices=["crlf", "lf"], default="crlf",
+        help="line endings of the output (default crlf)",
+    )
+    args = parser.parse_args(argv)
+    newline = "\r\n" if args.newline == "crlf" else "\n"
+    generate_efu(args.output, args.rows, seed=args.seed, newline=newline)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
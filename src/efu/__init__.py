@@ -9,19 +9,87 @@ identical to the original.
 __version__ = "0.1.1"
 
 from .efu_record import EfuRecord
+from .compact_efu_record import CompactEfuRecord, EfuSchema
 from .efu_records import EfuRecords
+from .scan_directory import iter_scan, scan_directory
+from .rescan_directory import rescan_directory
+from .efu_watcher import EfuWatcher
+from .scan_to_efu import scan_to_efu
+from .scan_roots import RootStats, iter_scan_roots, scan_roots_to_efu
 from .efu_to_array import efu_to_array
 from .efu_to_objects import efu_to_objects
+from .efu_row import EfuRow, make_row_class
+from .iter_efu_rows import iter_efu_rows
+from .iter_efu_objects import iter_efu_objects
+from .mapped_efu import MappedEfu, MappedEfuRecords
+from .efu_table import EfuTable, EfuTableRow
+from .packed_strings import PackedStrings
+from .efu_cache import cache_path_for, load_efu_table, read_efu_cache, write_efu_cache
+from .path_store import PathStore
+from .efu_tree import EfuTree
+from .rollup import FolderTotals, iter_folder_totals, rollup_efu
+from .efu_sort import merge_efu, sort_efu
+from .efu_diff import DeltaCounts, apply_delta, diff_efu, iter_efu_diff
+from .query import EfuQuery, datetime_to_filetime, filter_efu, parse_attributes, query_efu
 from .objects_to_efu import objects_to_efu
 from .array_to_efu import array_to_efu
+from .efu_writer import EfuWriter
+from .open_efu import compression_for, open_efu
+from .efu_stats import EfuStats
+from .verify_efu import VerifyResult, verify_efu
 from .cli import main
 
 __all__ = [
     "EfuRecord",
+    "CompactEfuRecord",
+    "EfuSchema",
     "EfuRecords",
+    "iter_scan",
+    "scan_directory",
+    "rescan_directory",
+    "EfuWatcher",
+    "scan_to_efu",
+    "RootStats",
+    "iter_scan_roots",
+    "scan_roots_to_efu",
     "efu_to_array",
     "efu_to_objects",
+    "EfuRow",
+    "make_row_class",
+    "iter_efu_rows",
+    "iter_efu_objects",
+    "MappedEfu",
+    "MappedEfuRecords",
+    "EfuTable",
+    "EfuTableRow",
+    "PackedStrings",
+    "cache_path_for",
+    "load_efu_table",
+    "read_efu_cache",
+    "write_efu_cache",
+    "PathStore",
+    "EfuTree",
+    "FolderTotals",
+    "iter_folder_totals",
+    "rollup_efu",
+    "merge_efu",
+    "sort_efu",
+    "DeltaCounts",
+    "apply_delta",
+    "diff_efu",
+    "iter_efu_diff",
+    "EfuQuery",
+    "datetime_to_filetime",
+    "filter_efu",
+    "parse_attributes",
+    "query_efu",
     "array_to_efu",
     "objects_to_efu",
+    "EfuWriter",
+    "compression_for",
+    "open_efu",
+    "EfuStats",
+    "VerifyResult",
+    "verify_efu",
     "main",
 ]
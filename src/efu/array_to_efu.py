@@ -1,29 +1,22 @@
-from typing import List, Optional
+from typing import Iterable, List, Optional, Sequence
+
+from .efu_stats import EfuStats
+from .efu_writer import EfuWriter
+from .open_efu import EfuFile
 
 
 def array_to_efu(
-    rows: List[List[str]],
+    rows: Iterable[Sequence[str]],
     header_fields: List[str],
-    file_path: str,
+    file_path: EfuFile,
     newline: Optional[str] = None,
     encoding: str = "utf-8",
+    stats: Optional[EfuStats] = None,
 ) -> None:
-    """Serialize rows to an EFU file preserving newline style."""
-    nl = newline or "\n"
-
-    def needs_quote(value: str) -> bool:
-        if value == "":
-            return False
-        return not value.isdigit()
+    """Serialize rows to an EFU file preserving newline style.
 
-    with open(file_path, "w", encoding=encoding, newline="") as f:
-        f.write(",".join(header_fields) + nl)
-        for row in rows:
-            out_fields: List[str] = []
-            for field in row:
-                if needs_quote(field):
-                    esc = field.replace('"', '""')
-                    out_fields.append(f'"{esc}"')
-                else:
-                    out_fields.append(field)
-            f.write(",".join(out_fields) + nl)
+    ``stats`` collects counters and phase timings, see :class:`EfuStats`.
+    """
+    with EfuWriter(file_path, newline=newline, encoding=encoding, stats=stats) as writer:
+        writer.write_header(header_fields)
+        writer.write_rows(rows)
@@ -1,26 +1,316 @@
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+import sys
 
-from .array_to_efu import array_to_efu
-from .efu_to_array import efu_to_array
+from .efu_stats import EfuStats
+from .query import EfuQuery, datetime_to_filetime, filter_efu
+from .scan_roots import scan_roots_to_efu
+from .scan_to_efu import scan_to_efu
+from .verify_efu import verify_efu
 
+_NEWLINES = {"crlf": "\r\n", "lf": "\n"}
+_SIZE_UNITS = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
 
-def main(argv: Optional[List[str]] = None) -> None:
-    """Command line interface for parsing and writing EFU files."""
+
+def _size_arg(text: str) -> int:
+    """Parse a byte count with an optional binary unit, e.g. ``1G`` or ``512K``."""
+    number = text.strip().upper().rstrip("B")
+    unit = number[-1:] if number[-1:] in _SIZE_UNITS else ""
+    try:
+        value = float(number[:len(number) - len(unit)])
+    except ValueError:
+        raise ValueError(f"invalid size: {text!r}") from None
+    return int(value * _SIZE_UNITS[unit])
+
+
+def _filetime_arg(text: str) -> int:
+    """Parse a raw FILETIME or an ISO 8601 date/time (UTC unless an offset is given)."""
+    if text.isdigit():
+        return int(text)
+    return datetime_to_filetime(datetime.fromisoformat(text))
+
+
+def _add_instrumentation_arguments(parser: Any) -> None:
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print counters and per-phase timings to stderr when done",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="FILE",
+        help="Run under cProfile and save the statistics to FILE ('-' prints the top entries)",
+    )
+
+
+def _show_progress(stats: EfuStats) -> None:
+    parts = [
+        f"{stats[name]} {label}"
+        for name, label in (("entries", "entries"), ("rows_read", "rows read"),
+                            ("rows_written", "rows written"))
+        if stats[name]
+    ]
+    if stats["bytes_read"]:
+        parts.append(f"{stats['bytes_read'] / 1e6:.1f} MB read")
+    print("\r" + ", ".join(parts), end="", file=sys.stderr, flush=True)
+
+
+def _instrumented(args: Any, command: Callable[[Optional[EfuStats]], None]) -> None:
+    """Run ``command`` with the ``--stats`` and ``--profile`` options of ``args``."""
+    stats = None
+    if args.stats:
+        stats = EfuStats(progress=_show_progress if sys.stderr.isatty() else None)
+    if not args.profile:
+        command(stats)
+    else:
+        import cProfile
+        import pstats
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            command(stats)
+        finally:
+            profiler.disable()
+            if args.profile == "-":
+                pstats.Stats(profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(25)
+            else:
+                profiler.dump_stats(args.profile)
+    if stats is not None:
+        if stats.progress is not None:
+            print(file=sys.stderr)
+        print(stats.format(), file=sys.stderr)
+
+
+def _roundtrip(argv: List[str]) -> None:
     import argparse
 
-    parser = argparse.ArgumentParser(description="Parse and write EFU files")
+    parser = argparse.ArgumentParser(
+        description="Parse and write EFU files",
+        epilog=(
+            "Subcommands: 'scan ROOT [ROOT ...] OUTPUT' writes an EFU file from "
+            "directory trees, 'filter INPUT OUTPUT' keeps matching rows."
+        ),
+    )
     parser.add_argument("input", help="Path to the input EFU file")
-    parser.add_argument("output", help="Path to write the output EFU file")
+    parser.add_argument(
+        "output",
+        nargs="?",
+        help="Path to write the output EFU file (omit to only verify)",
+    )
+    parser.add_argument(
+        "--no-output",
+        action="store_true",
+        help="Only verify the round trip, without writing an output file",
+    )
+    parser.add_argument(
+        "--hash",
+        metavar="ALGO",
+        help="Compare digests (e.g. sha256) instead of bytes, reading the input once",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes used to parse the input (holds all rows in memory)",
+    )
+    _add_instrumentation_arguments(parser)
     args = parser.parse_args(argv)
+    if args.no_output and args.output is not None:
+        parser.error("--no-output cannot be combined with an OUTPUT file")
+
+    def run(stats: Optional[EfuStats]) -> None:
+        try:
+            result = verify_efu(
+                args.input, args.output, hash_name=args.hash, workers=args.jobs, stats=stats
+            )
+        except ValueError as exc:
+            parser.error(str(exc))
+        if result.digest is not None:
+            print(f"{args.hash} {result.digest}")
+        if result.identical:
+            print("Round-trip successful: files are identical")
+        elif result.offset is None:
+            print("Round-trip failed: files differ")
+        else:
+            print(
+                f"Round-trip failed: files differ at byte {result.offset} (row {result.row})"
+            )
+
+    _instrumented(args, run)
+
+
+def _scan(argv: List[str]) -> None:
+    import argparse
 
-    rows, header_fields, nl = efu_to_array(args.input)
-    array_to_efu(rows, header_fields, args.output, newline=nl)
+    parser = argparse.ArgumentParser(
+        prog="efu scan",
+        usage="efu scan [options] ROOT [ROOT ...] OUTPUT",
+        description="Scan one or more directory trees into an EFU file",
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        metavar="PATH",
+        help="Directories to scan followed by the output EFU file (or directory with --shard)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of threads used to list directories of each root",
+    )
+    parser.add_argument(
+        "--shard",
+        action="store_true",
+        help="Write one EFU file per root into the OUTPUT directory",
+    )
+    parser.add_argument(
+        "--newline",
+        choices=sorted(_NEWLINES),
+        default="crlf",
+        help="Line ending of the written file",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=16,
+        help="Maximum number of entry batches buffered between scanner and writer",
+    )
+    _add_instrumentation_arguments(parser)
+    args = parser.parse_args(argv)
+    if len(args.paths) < 2:
+        parser.error("at least one ROOT and an OUTPUT are required")
+    roots, output = args.paths[:-1], args.paths[-1]
+
+    def run(stats: Optional[EfuStats]) -> None:
+        if len(roots) == 1 and not args.shard:
+            count = scan_to_efu(
+                roots[0],
+                output,
+                newline=_NEWLINES[args.newline],
+                workers=args.jobs,
+                queue_size=args.queue_size,
+                stats=stats,
+            )
+            print(f"Wrote {count} entries to {output}")
+            return
+
+        root_stats = scan_roots_to_efu(
+            roots,
+            file_path=None if args.shard else output,
+            out_dir=output if args.shard else None,
+            newline=_NEWLINES[args.newline],
+            workers_per_root=args.jobs,
+            queue_size=args.queue_size,
+            stats=stats,
+        )
+        for item in root_stats:
+            print(
+                f"{item.root}: {item.entries} entries in {item.seconds:.2f}s "
+                f"({item.entries_per_second:.0f}/s) -> {item.file_path}"
+            )
+
+    _instrumented(args, run)
+
+
+def _filter(argv: List[str]) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="efu filter", description="Write the rows of an EFU file that match a query"
+    )
+    parser.add_argument("input", help="Path to the input EFU file")
+    parser.add_argument("output", help="Path to write the matching rows")
+    parser.add_argument("--min-size", type=_size_arg, help="Minimum Size, e.g. 1G")
+    parser.add_argument("--max-size", type=_size_arg, help="Maximum Size")
+    for column in ("modified", "created"):
+        parser.add_argument(
+            f"--{column}-after",
+            type=_filetime_arg,
+            metavar="WHEN",
+            help=f"Earliest Date {column.title()} (FILETIME or ISO 8601, UTC)",
+        )
+        parser.add_argument(
+            f"--{column}-before",
+            type=_filetime_arg,
+            metavar="WHEN",
+            help=f"Latest Date {column.title()} (FILETIME or ISO 8601, UTC)",
+        )
+    parser.add_argument(
+        "--modified-within",
+        type=float,
+        metavar="DAYS",
+        help="Only rows modified in the last DAYS days",
+    )
+    parser.add_argument(
+        "--attributes", default="", help="Attribute letters that must be set, e.g. HA"
+    )
+    parser.add_argument(
+        "--not-attributes", default="", help="Attribute letters that must be clear, e.g. D"
+    )
+    parser.add_argument("--prefix", help="Filename prefix")
+    parser.add_argument("--glob", help="Filename glob matched against the full path")
+    parser.add_argument("--regex", help="Regular expression searched in Filename")
+    parser.add_argument(
+        "--case-sensitive", action="store_true", help="Match Filename case-sensitively"
+    )
+    parser.add_argument(
+        "--columns", help="Comma-separated columns to write, in order (default: all)"
+    )
+    _add_instrumentation_arguments(parser)
+    args = parser.parse_args(argv)
+
+    min_modified = args.modified_after
+    if args.modified_within is not None:
+        since = datetime_to_filetime(
+            datetime.now(timezone.utc) - timedelta(days=args.modified_within)
+        )
+        min_modified = since if min_modified is None else max(min_modified, since)
+    try:
+        query = EfuQuery(
+            min_size=args.min_size,
+            max_size=args.max_size,
+            min_modified=min_modified,
+            max_modified=args.modified_before,
+            min_created=args.created_after,
+            max_created=args.created_before,
+            attributes=args.attributes,
+            not_attributes=args.not_attributes,
+            prefix=args.prefix,
+            glob=args.glob,
+            regex=args.regex,
+            case_sensitive=args.case_sensitive,
+        )
+        columns = args.columns.split(",") if args.columns else None
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    def run(stats: Optional[EfuStats]) -> None:
+        try:
+            count = filter_efu(args.input, args.output, query, columns=columns, stats=stats)
+        except ValueError as exc:
+            parser.error(str(exc))
+        print(f"Wrote {count} matching rows to {args.output}")
+
+    _instrumented(args, run)
+
+
+_COMMANDS: Dict[str, Callable[[List[str]], None]] = {"scan": _scan, "filter": _filter}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line interface for parsing and writing EFU files.
 
-    with open(args.input, "rb") as f:
-        orig = f.read()
-    with open(args.output, "rb") as f:
-        new = f.read()
-    if orig == new:
-        print("Round-trip successful: files are identical")
+    ``efu INPUT [OUTPUT]`` verifies that an EFU file round-trips, ``efu scan ROOT OUTPUT``
+    writes one from a directory tree and ``efu filter INPUT OUTPUT`` keeps
+    the rows matching a query.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] in _COMMANDS:
+        _COMMANDS[argv[0]](argv[1:])
     else:
-        print("Round-trip failed: files differ")
+        _roundtrip(argv)
@@ -0,0 +1,153 @@
+from functools import lru_cache
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from .efu_record import _populate_from_path
+
+
+class EfuSchema:
+    """Header layout shared by many :class:`CompactEfuRecord` objects.
+
+    Use :meth:`for_headers` to obtain the shared instance for a header list.
+    """
+
+    __slots__ = ("headers", "index", "slots", "record_class")
+
+    def __init__(self, headers: Iterable[str]) -> None:
+        self.headers: Tuple[str, ...] = tuple(headers)
+        self.index = {name: i for i, name in enumerate(self.headers)}
+        self.slots = tuple(f"_v{i}" for i in range(len(self.headers)))
+        self.record_class: Type["CompactEfuRecord"] = type(
+            "CompactEfuRecord",
+            (CompactEfuRecord,),
+            {"__slots__": self.slots, "_schema": self},
+        )
+
+    @staticmethod
+    def for_headers(headers: Iterable[str]) -> "EfuSchema":
+        """Return the cached schema for ``headers``."""
+        return _schema_for(tuple(headers))
+
+    def __len__(self) -> int:
+        return len(self.headers)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.headers)
+
+    def __repr__(self) -> str:
+        return f"EfuSchema({list(self.headers)!r})"
+
+
+@lru_cache(maxsize=None)
+def _schema_for(headers: Tuple[str, ...]) -> EfuSchema:
+    return EfuSchema(headers)
+
+
+def _rebuild(headers: Tuple[str, ...], values: List[Any], meta: Tuple[Any, ...]) -> "CompactEfuRecord":
+    record = CompactEfuRecord(headers, dict(zip(headers, values)))
+    record.last_seen, record.first_seen, record.last_lost, record.root = meta
+    return record
+
+
+class CompactEfuRecord(MutableMapping[str, Any]):
+    """Memory-compact alternative to :class:`EfuRecord`.
+
+    Records are instances of a slotted class generated once per
+    :class:`EfuSchema`; each field value occupies one slot, so no
+    per-record dictionary or copy of the header keys is kept. The record is
+    a mapping restricted to the schema's keys and carries the same
+    ``last_seen``/``first_seen``/``last_lost``/``root`` metadata as
+    :class:`EfuRecord`.
+    """
+
+    __slots__ = ("last_seen", "first_seen", "last_lost", "root")
+
+    _schema: EfuSchema
+
+    def __new__(cls, schema: Union[EfuSchema, Iterable[str]], *args: Any, **kwargs: Any) -> Any:
+        if not isinstance(schema, EfuSchema):
+            schema = EfuSchema.for_headers(schema)
+        return object.__new__(schema.record_class)
+
+    def __init__(
+        self,
+        schema: Union[EfuSchema, Iterable[str]],
+        data: Optional[Mapping[str, Any]] = None,
+        *,
+        last_seen: Optional[int] = None,
+        first_seen: Optional[int] = None,
+        last_lost: Optional[int] = None,
+        root: Optional[Union[str, int]] = None,
+        **kwargs: Any,
+    ) -> None:
+        for slot in self._schema.slots:
+            setattr(self, slot, None)
+        if data:
+            self.update(data)
+        if kwargs:
+            self.update(kwargs)
+        self.last_seen = last_seen
+        self.first_seen = first_seen
+        self.last_lost = last_lost
+        self.root = root
+
+    @property
+    def schema(self) -> EfuSchema:
+        return self._schema
+
+    def _slot(self, key: str) -> str:
+        schema = self._schema
+        try:
+            return schema.slots[schema.index[key]]
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, self._slot(key))
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        setattr(self, self._slot(key), value)
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError("CompactEfuRecord fields cannot be deleted")
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._schema.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._schema.headers)
+
+    def __len__(self) -> int:
+        return len(self._schema.headers)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        schema = self._schema
+        index = schema.index.get(key)
+        return default if index is None else getattr(self, schema.slots[index])
+
+    def _values(self) -> List[Any]:
+        return [getattr(self, slot) for slot in self._schema.slots]
+
+    def __repr__(self) -> str:
+        return f"CompactEfuRecord({dict(zip(self._schema.headers, self._values()))!r})"
+
+    def __reduce__(self) -> Any:
+        meta = (self.last_seen, self.first_seen, self.last_lost, self.root)
+        return _rebuild, (self._schema.headers, self._values(), meta)
+
+    def populate_from_path(self, file_path: str) -> None:
+        """Populate record fields using metadata from ``file_path``.
+
+        Behaves exactly like :meth:`EfuRecord.populate_from_path`.
+        """
+        _populate_from_path(self, file_path)
@@ -0,0 +1,277 @@
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+
+from .efu_table import EfuTable, _IntColumn, _StrColumn
+from .packed_strings import PackedStrings
+
+_MAGIC = b"EFUCACHE"
+_VERSION = 1
+# Magic, format version and length of the JSON metadata that follows.
+_PREFIX = struct.Struct("<8sIQ")
+# Bytes hashed at the start and at the end of the source file.
+_HASH_SPAN = 64 << 10
+# Text buffers start on a mapping boundary so each can be mapped on its own.
+_PAGE = mmap.ALLOCATIONGRANULARITY
+
+
+def _align(offset: int, alignment: int) -> int:
+    return -(-offset // alignment) * alignment
+
+
+def cache_path_for(file_path: str) -> str:
+    """Return the default cache location, ``file_path + ".cache"``."""
+    return file_path + ".cache"
+
+
+def _source_signature(file_path: str) -> Dict[str, Any]:
+    """Return size, mtime and a hash of the first and last 64 KiB of ``file_path``."""
+    with open(file_path, "rb") as f:
+        st = os.fstat(f.fileno())
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f.read(_HASH_SPAN))
+        if st.st_size > _HASH_SPAN:
+            f.seek(max(st.st_size - _HASH_SPAN, _HASH_SPAN))
+            digest.update(f.read(_HASH_SPAN))
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "hash": digest.hexdigest()}
+
+
+def write_efu_cache(
+    table: EfuTable,
+    file_path: str,
+    cache_path: Optional[str] = None,
+    encoding: str = "utf-8",
+    _signature: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Write ``table``, parsed from ``file_path``, to a binary cache file.
+
+    The cache holds the header, the newline, numeric columns as raw typed
+    arrays with their null bitmaps and text columns as packed UTF-8 with
+    offsets, described by a small JSON block. It is written to a temporary
+    file and moved into place. Returns the cache path.
+    """
+    cache_path = cache_path or cache_path_for(file_path)
+    signature = _signature or _source_signature(file_path)
+    buffers: List[Any] = []
+    placements: List[int] = []
+    end = 0
+
+    def place(buffer: Any, alignment: int) -> List[int]:
+        nonlocal end
+        size = memoryview(buffer).nbytes
+        start = _align(end, alignment)
+        buffers.append(buffer)
+        placements.append(start)
+        end = start + size
+        return [start, size]
+
+    columns: List[Dict[str, Any]] = []
+    for column in table._columns:
+        if isinstance(column, _IntColumn):
+            values = column.values
+            columns.append({
+                "kind": "int",
+                "typecode": getattr(values, "typecode", None) or values.format,
+                "values": place(values, 8),
+                "nulls": place(column.nulls, 8),
+            })
+        else:
+            strings = column.values
+            if not isinstance(strings, PackedStrings):
+                strings = PackedStrings(strings)
+            columns.append({
+                "kind": "str",
+                "data": place(strings._data, _PAGE),
+                "offsets": place(strings._offsets, 8),
+            })
+
+    meta = json.dumps({
+        "byteorder": sys.byteorder,
+        "encoding": encoding,
+        "source": signature,
+        "header_fields": table.header_fields,
+        "newline": table.newline,
+        "rows": len(table),
+        "columns": columns,
+    }).encode("utf-8")
+    data_start = _align(_PREFIX.size + len(meta), _PAGE)
+
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_PREFIX.pack(_MAGIC, _VERSION, len(meta)))
+        f.write(meta)
+        for buffer, start in zip(buffers, placements):
+            f.seek(data_start + start)
+            f.write(buffer)
+        f.truncate(data_start + end)
+    os.replace(tmp_path, cache_path)
+    return cache_path
+
+
+def _read_meta(f: BinaryIO) -> Optional[Tuple[Dict[str, Any], int]]:
+    """Return the JSON metadata of an open cache file and its length."""
+    prefix = f.read(_PREFIX.size)
+    if len(prefix) != _PREFIX.size:
+        return None
+    magic, version, meta_length = _PREFIX.unpack(prefix)
+    if magic != _MAGIC or version != _VERSION:
+        return None
+    try:
+        meta = json.loads(f.read(meta_length).decode("utf-8"))
+    except ValueError:
+        return None
+    return (meta, meta_length) if isinstance(meta, dict) else None
+
+
+def _is_placement(value: Any, limit: int) -> bool:
+    return (
+        isinstance(value, list)
+        and len(value) == 2
+        and all(isinstance(n, int) and n >= 0 for n in value)
+        and value[0] + value[1] <= limit
+    )
+
+
+def _valid_column(column: Any, limit: int) -> bool:
+    if not isinstance(column, dict):
+        return False
+    if column.get("kind") == "int":
+        names = ("values", "nulls")
+        typecode = column.get("typecode")
+        if not isinstance(typecode, str) or len(typecode) != 1 or typecode not in "bBhHiIlLqQ":
+            return False
+    elif column.get("kind") == "str":
+        names = ("data", "offsets")
+    else:
+        return False
+    return all(_is_placement(column.get(name), limit) for name in names)
+
+
+def _valid_meta(meta: Dict[str, Any], encoding: str, limit: int) -> bool:
+    """Check the layout described by ``meta``; ``limit`` is the data size."""
+    header_fields = meta.get("header_fields")
+    columns = meta.get("columns")
+    rows = meta.get("rows")
+    return (
+        meta.get("byteorder") == sys.byteorder
+        and meta.get("encoding") == encoding
+        and isinstance(header_fields, list)
+        and all(isinstance(field, str) for field in header_fields)
+        and isinstance(meta.get("newline"), str)
+        and isinstance(rows, int) and rows >= 0
+        and isinstance(columns, list)
+        and len(columns) == len(header_fields)
+        and all(_valid_column(column, limit) for column in columns)
+    )
+
+
+def _map_columns(f: BinaryIO, meta: Dict[str, Any], data_start: int) -> List[Any]:
+    """Build the table columns as views of the mapped cache file ``f``.
+
+    Raises ``ValueError`` or ``TypeError`` if a buffer does not fit its
+    type or the row count.
+    """
+    view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    rows = meta["rows"]
+
+    def segment(placement: List[int], typecode: str = "B") -> memoryview:
+        start = data_start + placement[0]
+        return view[start:start + placement[1]].cast(typecode)
+
+    def text(placement: List[int]) -> Any:
+        start, length = placement
+        if not length:
+            return b""
+        return mmap.mmap(f.fileno(), length, offset=data_start + start, access=mmap.ACCESS_READ)
+
+    columns: List[Any] = []
+    for column in meta["columns"]:
+        if column["kind"] == "int":
+            int_column = _IntColumn.__new__(_IntColumn)
+            int_column.values = segment(column["values"], column["typecode"])  # type: ignore[assignment]
+            int_column.nulls = segment(column["nulls"])  # type: ignore[assignment]
+            if len(int_column.values) != rows or len(int_column.nulls) < -(-rows // 8):
+                raise ValueError("column does not match the row count")
+            columns.append(int_column)
+        else:
+            offsets = segment(column["offsets"], "Q")
+            if len(offsets) != rows + 1:
+                raise ValueError("column does not match the row count")
+            str_column = _StrColumn.__new__(_StrColumn)
+            str_column.values = PackedStrings._from_buffers(text(column["data"]), offsets)
+            columns.append(str_column)
+    return columns
+
+
+def read_efu_cache(
+    file_path: str,
+    cache_path: Optional[str] = None,
+    encoding: str = "utf-8",
+) -> Optional[EfuTable]:
+    """Map the cache of ``file_path`` as a read-only :class:`EfuTable`.
+
+    Returns ``None`` if the cache is missing or cannot be opened, is
+    damaged, was written by another format version, byte order or
+    encoding, or does not match the size, mtime and hash of ``file_path``.
+    Columns are memoryviews of the mapped file, so loading does not depend
+    on the number of rows; appending to the returned table is not
+    supported.
+    """
+    cache_path = cache_path or cache_path_for(file_path)
+    try:
+        f = open(cache_path, "rb")
+    except OSError:
+        return None
+    with f:
+        try:
+            found = _read_meta(f)
+            if found is None:
+                return None
+            meta, meta_length = found
+            data_start = _align(_PREFIX.size + meta_length, _PAGE)
+            limit = os.fstat(f.fileno()).st_size - data_start
+            if not _valid_meta(meta, encoding, limit):
+                return None
+            if meta.get("source") != _source_signature(file_path):
+                return None
+            columns = _map_columns(f, meta, data_start)
+        except (OSError, ValueError, TypeError):
+            return None
+
+    table = EfuTable(meta["header_fields"], meta["newline"])
+    table._columns = columns
+    table._length = meta["rows"]
+    return table
+
+
+def load_efu_table(
+    file_path: str,
+    cache_path: Optional[str] = None,
+    encoding: str = "utf-8",
+    engine: str = "fast",
+    write_cache: bool = True,
+) -> EfuTable:
+    """Return ``file_path`` as an :class:`EfuTable`, using its cache when valid.
+
+    A valid cache is mapped with :func:`read_efu_cache`. Otherwise the file
+    is parsed in full and, with ``write_cache``, a fresh cache is written;
+    failing to write it (for example in a read-only directory) is not an
+    error.
+    """
+    table = read_efu_cache(file_path, cache_path, encoding)
+    if table is not None:
+        return table
+    # Take the signature first so that a file changing during the parse
+    # leaves a cache that no longer validates.
+    signature = _source_signature(file_path)
+    table = EfuTable.from_file(file_path, encoding=encoding, engine=engine)
+    if write_cache:
+        try:
+            write_efu_cache(table, file_path, cache_path, encoding, _signature=signature)
+        except OSError:
+            pass
+    return table
@@ -0,0 +1,195 @@
+from typing import Iterator, List, NamedTuple, Optional, Sequence, Tuple
+import os
+import tempfile
+
+from .efu_sort import sort_efu
+from .efu_writer import EfuWriter
+from .iter_efu_rows import iter_efu_rows
+
+# Operation codes of the leading "Delta" column.
+ADDED = "+"
+REMOVED = "-"
+CHANGED = "~"
+DELTA_COLUMN = "Delta"
+
+
+class DeltaCounts(NamedTuple):
+    """Number of entries added, removed and changed by a delta."""
+
+    added: int
+    removed: int
+    changed: int
+
+
+def _filename_column(header_fields: Sequence[str]) -> int:
+    try:
+        return list(header_fields).index("Filename")
+    except ValueError:
+        raise ValueError("EFU data has no Filename column") from None
+
+
+def _checked(rows: Iterator[List[str]], column: int, label: str) -> Iterator[List[str]]:
+    """Pass ``rows`` through, raising ``ValueError`` unless Filename strictly increases."""
+    previous: Optional[str] = None
+    for number, row in enumerate(rows, 1):
+        key = row[column] if column < len(row) else ""
+        if previous is not None and key <= previous:
+            problem = "duplicate" if key == previous else "out of order"
+            raise ValueError(
+                f"{label} must be sorted by Filename: row {number} {key!r} is {problem}"
+            )
+        previous = key
+        yield row
+
+
+def _merge(
+    old: Iterator[List[str]], new: Iterator[List[str]], column: int
+) -> Iterator[Tuple[str, List[str]]]:
+    old_row = next(old, None)
+    new_row = next(new, None)
+    while old_row is not None or new_row is not None:
+        if new_row is None or (old_row is not None and old_row[column] < new_row[column]):
+            yield REMOVED, old_row  # type: ignore[misc]
+            old_row = next(old, None)
+        elif old_row is None or new_row[column] < old_row[column]:
+            yield ADDED, new_row
+            new_row = next(new, None)
+        else:
+            if old_row != new_row:
+                yield CHANGED, new_row
+            old_row = next(old, None)
+            new_row = next(new, None)
+
+
+def iter_efu_diff(
+    old_path: str,
+    new_path: str,
+    encoding: str = "utf-8",
+    engine: str = "fast",
+) -> Tuple[Iterator[Tuple[str, List[str]]], List[str], str]:
+    """Stream the differences between two EFU files sorted by Filename.
+
+    Returns an iterator of ``(operation, row)`` pairs in Filename order,
+    the header fields and the newline of ``new_path``. The operation is
+    ``"+"`` for an added row (the new row), ``"-"`` for a removed row (the
+    old row) and ``"~"`` for a row whose fields differ (the new row). Both
+    files are read once, side by side, so memory use does not depend on
+    their size.
+
+    Both files must have the same header and list Filenames in strictly
+    increasing order, otherwise ``ValueError`` is raised; :func:`sort_efu`
+    puts a file in that order.
+    """
+    old_rows, old_fields, _ = iter_efu_rows(old_path, encoding=encoding, engine=engine)
+    new_rows, new_fields, newline = iter_efu_rows(new_path, encoding=encoding, engine=engine)
+    if old_fields != new_fields:
+        old_rows.close()  # type: ignore[attr-defined]
+        new_rows.close()  # type: ignore[attr-defined]
+        raise ValueError("EFU files have different header fields")
+    column = _filename_column(new_fields)
+    changes = _merge(
+        _checked(old_rows, column, old_path), _checked(new_rows, column, new_path), column
+    )
+    return changes, new_fields, newline
+
+
+def diff_efu(
+    old_path: str,
+    new_path: str,
+    delta_path: str,
+    encoding: str = "utf-8",
+    engine: str = "fast",
+    sort: bool = False,
+    tmp_dir: Optional[str] = None,
+) -> DeltaCounts:
+    """Write the differences between two sorted EFU files to ``delta_path``.
+
+    The delta is itself an EFU file whose header is ``Delta`` followed by
+    the snapshot's header fields. Added and changed rows carry the full new
+    row after their ``+`` or ``~`` code; removed rows carry only the code
+    and the Filename. Unchanged rows are omitted.
+
+    With ``sort`` the inputs are first sorted by Filename with
+    :func:`sort_efu` into temporary files under ``tmp_dir``.
+    """
+    if sort:
+        with tempfile.TemporaryDirectory(prefix="efu-diff-", dir=tmp_dir) as tmp:
+            old_sorted = os.path.join(tmp, "old.efu")
+            new_sorted = os.path.join(tmp, "new.efu")
+            sort_efu(old_path, old_sorted, tmp_dir=tmp, encoding=encoding, engine=engine)
+            sort_efu(new_path, new_sorted, tmp_dir=tmp, encoding=encoding, engine=engine)
+            return diff_efu(old_sorted, new_sorted, delta_path, encoding=encoding, engine=engine)
+    changes, header_fields, newline = iter_efu_diff(
+        old_path, new_path, encoding=encoding, engine=engine
+    )
+    column = _filename_column(header_fields)
+    counts = {ADDED: 0, REMOVED: 0, CHANGED: 0}
+    with EfuWriter(delta_path, newline=newline, encoding=encoding) as writer:
+        writer.write_header([DELTA_COLUMN] + header_fields)
+        for op, row in changes:
+            counts[op] += 1
+            if op == REMOVED:
+                writer.write_row([op] + [""] * column + [row[column]])
+            else:
+                writer.write_row([op] + row)
+    return DeltaCounts(counts[ADDED], counts[REMOVED], counts[CHANGED])
+
+
+def apply_delta(
+    old_path: str,
+    delta_path: str,
+    out_path: str,
+    encoding: str = "utf-8",
+    engine: str = "fast",
+    sort: bool = False,
+    tmp_dir: Optional[str] = None,
+) -> int:
+    """Write the snapshot obtained by applying ``delta_path`` to ``old_path``.
+
+    The output uses the delta's newline, so applying the delta produced by
+    :func:`diff_efu` to the old file reproduces the new file, in Filename
+    order. Raises ``ValueError`` if the headers do not match or the delta
+    does not fit the old snapshot. Returns the number of rows written.
+
+    With ``sort`` an unsorted ``old_path`` is first sorted by Filename into
+    a temporary file under ``tmp_dir``.
+    """
+    if sort:
+        with tempfile.TemporaryDirectory(prefix="efu-diff-", dir=tmp_dir) as tmp:
+            old_sorted = os.path.join(tmp, "old.efu")
+            sort_efu(old_path, old_sorted, tmp_dir=tmp, encoding=encoding, engine=engine)
+            return apply_delta(old_sorted, delta_path, out_path, encoding=encoding, engine=engine)
+    old_rows, old_fields, _ = iter_efu_rows(old_path, encoding=encoding, engine=engine)
+    delta_rows, delta_fields, newline = iter_efu_rows(delta_path, encoding=encoding, engine=engine)
+    if delta_fields[:1] != [DELTA_COLUMN] or delta_fields[1:] != old_fields:
+        old_rows.close()  # type: ignore[attr-defined]
+        delta_rows.close()  # type: ignore[attr-defined]
+        raise ValueError("delta header does not match the EFU file")
+    column = _filename_column(old_fields)
+    old = _checked(old_rows, column, old_path)
+    delta = _checked((row[1:] + row[:1] for row in delta_rows), column, delta_path)
+
+    with EfuWriter(out_path, newline=newline, encoding=encoding) as writer:
+        writer.write_header(old_fields)
+        old_row = next(old, None)
+        for change in delta:
+            op = change.pop()
+            key = change[column]
+            while old_row is not None and old_row[column] < key:
+                writer.write_row(old_row)
+                old_row = next(old, None)
+            present = old_row is not None and old_row[column] == key
+            if op == ADDED and not present:
+                writer.write_row(change)
+            elif op == CHANGED and present:
+                writer.write_row(change)
+                old_row = next(old, None)
+            elif op == REMOVED and present:
+                old_row = next(old, None)
+            else:
+                state = "present" if present else "missing"
+                raise ValueError(f"cannot apply {op!r} to {state} entry {key!r}")
+        while old_row is not None:
+            writer.write_row(old_row)
+            old_row = next(old, None)
+        return writer.rows_written
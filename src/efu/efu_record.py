@@ -6,6 +6,9 @@ import time
 
 FILETIME_EPOCH = 116444736000000000
 
+# Columns written by Everything's default EFU export.
+DEFAULT_HEADERS = ["Filename", "Size", "Date Modified", "Date Created", "Attributes"]
+
 
 def _to_filetime(timestamp: float) -> int:
     """Convert POSIX timestamp to Windows FILETIME."""
@@ -44,39 +47,52 @@ class EfuRecord(dict):
         Updates ``last_seen`` when metadata is successfully retrieved and
         ``last_lost`` when retrieval fails.
         """
-        try:
-            st = os.stat(file_path)
-        except OSError:
-            self.last_lost = int(time.time())
-            raise
-        else:
-            now = int(time.time())
-            self.last_seen = now
-            if self.first_seen is None:
-                self.first_seen = now
-
-        if "Filename" in self:
-            self["Filename"] = file_path
-        if "Size" in self:
-            self["Size"] = st.st_size
-        if "Date Modified" in self:
-            self["Date Modified"] = _to_filetime(st.st_mtime)
-        if "Date Created" in self:
-            self["Date Created"] = _to_filetime(st.st_ctime)
-        if "Attributes" in self:
-            attr = 16 if stat.S_ISDIR(st.st_mode) else 32
-            if not os.access(file_path, os.W_OK):
-                attr |= 1
-            self["Attributes"] = attr
-
-        # populate additional fields generically
-        for key in self.keys():
-            if key not in {
-                "Filename",
-                "Size",
-                "Date Modified",
-                "Date Created",
-                "Attributes",
-            }:
-                # For unknown fields, leave as-is (None)
-                pass
+        _populate_from_path(self, file_path)
+
+
+def _attributes(st: os.stat_result) -> int:
+    """Derive EFU attributes from a stat result without extra system calls.
+
+    Read-only is taken from the owner write bit, which on Windows mirrors
+    ``FILE_ATTRIBUTE_READONLY``; like that attribute it describes the file,
+    not whether the current user may write to it.
+    """
+    attributes = 16 if stat.S_ISDIR(st.st_mode) else 32
+    if not st.st_mode & stat.S_IWUSR:
+        attributes |= 1
+    return attributes
+
+
+def _populate_from_path(record: Any, file_path: str) -> None:
+    """Fill the known fields of ``record`` from ``os.stat(file_path)``."""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        record.last_lost = int(time.time())
+        raise
+    else:
+        now = int(time.time())
+        record.last_seen = now
+        if record.first_seen is None:
+            record.first_seen = now
+
+    _fill_from_stat(record, file_path, st, _attributes(st))
+
+
+def _fill_from_stat(
+    record: Any, file_path: str, st: os.stat_result, attributes: Optional[int]
+) -> None:
+    """Set the known EFU fields present in ``record`` from ``st``.
+
+    Unknown fields are left as-is (None).
+    """
+    if "Filename" in record:
+        record["Filename"] = file_path
+    if "Size" in record:
+        record["Size"] = st.st_size
+    if "Date Modified" in record:
+        record["Date Modified"] = _to_filetime(st.st_mtime)
+    if "Date Created" in record:
+        record["Date Created"] = _to_filetime(st.st_ctime)
+    if "Attributes" in record:
+        record["Attributes"] = attributes
@@ -1,25 +1,57 @@
-from typing import Iterable
+from typing import Iterable, Optional, Union
 from collections import UserList
-import os
 
+from .compact_efu_record import CompactEfuRecord, EfuSchema
 from .efu_record import EfuRecord
+from .efu_stats import EfuStats
+from .scan_directory import scan_directory
+from .scan_roots import iter_scan_roots
 
 
 class EfuRecords(UserList[EfuRecord]):
-    """List-like collection for :class:`EfuRecord` objects."""
+    """List-like collection for :class:`EfuRecord` objects.
+
+    Passing an :class:`EfuSchema` instead of a list of headers to the
+    ``*_from_*`` helpers creates :class:`CompactEfuRecord` objects that share
+    that schema.
+    """
 
     def __init__(self, records: Iterable[EfuRecord] = ()) -> None:
         super().__init__(list(records))
 
-    def append_from_path(self, file_path: str, headers: Iterable[str]) -> None:
+    def append_from_path(self, file_path: str, headers: Union[Iterable[str], EfuSchema]) -> None:
         """Create an :class:`EfuRecord` from ``file_path`` and append it."""
-        record = EfuRecord(headers)
+        if isinstance(headers, EfuSchema):
+            record = CompactEfuRecord(headers)
+        else:
+            record = EfuRecord(headers)
         record.populate_from_path(file_path)
         self.append(record)
 
-    def extend_from_directory(self, dir_path: str, headers: Iterable[str]) -> None:
-        """Recursively append records for all entries under ``dir_path``."""
-        for root, dirs, files in os.walk(dir_path):
-            self.append_from_path(root, headers)
-            for name in files:
-                self.append_from_path(os.path.join(root, name), headers)
+    def extend_from_directory(
+        self,
+        dir_path: str,
+        headers: Union[Iterable[str], EfuSchema],
+        workers: int = 1,
+        stats: Optional[EfuStats] = None,
+    ) -> None:
+        """Recursively append records for all entries under ``dir_path``.
+
+        Entries are gathered by :func:`scan_directory`; ``workers`` sets how
+        many directories are listed concurrently and ``stats`` collects scan
+        counters and timings.
+        """
+        self.extend(scan_directory(dir_path, headers, workers=workers, stats=stats))
+
+    def extend_from_roots(
+        self,
+        roots: Iterable[str],
+        headers: Union[Iterable[str], EfuSchema],
+        workers_per_root: int = 1,
+    ) -> None:
+        """Append records for several roots scanned concurrently.
+
+        See :func:`iter_scan_roots`; each record's ``root`` names the root
+        it was found under.
+        """
+        self.extend(iter_scan_roots(roots, headers, workers_per_root=workers_per_root))
@@ -0,0 +1,75 @@
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Type
+import keyword
+import re
+
+
+class EfuRow(tuple):
+    """Compact, tuple-based row produced by ``efu_to_objects(compact=True)``.
+
+    Values are stored positionally in header order. Subclasses generated by
+    :func:`make_row_class` add attribute access (``row.date_modified``) and
+    the row also supports lookup by header name (``row["Date Modified"]``),
+    ``keys()``, ``get()`` and ``dict(row)``.
+    """
+
+    __slots__ = ()
+
+    _headers: Tuple[str, ...] = ()
+    _index: Dict[str, int] = {}
+
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, str):
+            return tuple.__getitem__(self, self._index[key])
+        return tuple.__getitem__(self, key)
+
+    def keys(self) -> Tuple[str, ...]:
+        return self._headers
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        return zip(self._headers, self)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        index = self._index.get(key)
+        return default if index is None else tuple.__getitem__(self, index)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(zip(self._headers, self))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name!r}: {value!r}" for name, value in self.items())
+        return f"{type(self).__name__}({{{fields}}})"
+
+
+def _attribute_names(header_fields: Iterable[str]) -> List[str]:
+    """Turn header names such as ``Date Modified`` into ``date_modified``."""
+    names: List[str] = []
+    for header in header_fields:
+        name = re.sub(r"\W+", "_", header.strip().lower()).strip("_") or "field"
+        if name[0].isdigit() or keyword.iskeyword(name):
+            name = "f_" + name
+        base = name
+        suffix = 2
+        while name in names or hasattr(EfuRow, name):
+            name = f"{base}_{suffix}"
+            suffix += 1
+        names.append(name)
+    return names
+
+
+@lru_cache(maxsize=None)
+def _row_class(header_fields: Tuple[str, ...]) -> Type[EfuRow]:
+    namespace: Dict[str, Any] = {
+        "__slots__": (),
+        "_headers": header_fields,
+        "_index": {name: i for i, name in enumerate(header_fields)},
+    }
+    for i, name in enumerate(_attribute_names(header_fields)):
+        namespace[name] = property(itemgetter(i), doc=f"Value of {header_fields[i]!r}")
+    return type("EfuRow", (EfuRow,), namespace)
+
+
+def make_row_class(header_fields: Iterable[str]) -> Type[EfuRow]:
+    """Return the (cached) :class:`EfuRow` subclass for ``header_fields``."""
+    return _row_class(tuple(header_fields))
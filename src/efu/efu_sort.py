@@ -0,0 +1,279 @@
+from contextlib import ExitStack
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence
+import heapq
+import os
+import re
+import tempfile
+
+from .efu_writer import EfuWriter
+from .iter_efu_objects import NUMERIC_COLUMNS
+from .iter_efu_rows import iter_efu_rows
+
+# Rows are spilled to a sorted run once their estimated size reaches the
+# memory limit. At most this many runs are merged at once.
+_MEMORY_LIMIT = 64 << 20
+_FAN_IN = 64
+
+_POLICIES = {"newest", "first", "last"}
+
+# Sort key comparing Filename one path component at a time.
+_PATH_KEY = "path"
+_SEPARATOR = re.compile(r"[\\/]")
+
+Row = List[str]
+
+
+def _row_size(row: Row) -> int:
+    """Rough number of bytes a parsed row occupies in memory."""
+    return 56 + 8 * len(row) + sum(49 + len(field) for field in row)
+
+
+def _sort_key(header_fields: Sequence[str], key: str) -> Callable[[Row], Any]:
+    """Return the sort key function for column ``key``.
+
+    Well-known numeric columns compare as integers, with empty values first
+    and non-numeric values last; other columns compare as strings.
+    ``"path"`` compares Filename split at ``\\`` and ``/``.
+    """
+    fields = list(header_fields)
+    if key == _PATH_KEY and "Filename" in fields:
+        name = fields.index("Filename")
+        split = _SEPARATOR.split
+        return lambda row: split(row[name]) if name < len(row) else [""]
+    if key not in fields:
+        raise ValueError(f"unknown sort column: {key!r}")
+    index = fields.index(key)
+    if key not in NUMERIC_COLUMNS:
+        return lambda row: row[index] if index < len(row) else ""
+
+    def numeric(row: Row) -> Any:
+        text = row[index] if index < len(row) else ""
+        if text.isdigit():
+            return (1, int(text), "")
+        return (0 if text == "" else 2, 0, text)
+
+    return numeric
+
+
+class _RunSorter:
+    """Collect rows, spill sorted runs to ``tmp_dir`` and merge them back.
+
+    Runs are written with the ``newline`` and ``encoding`` of the input, so
+    quoted fields containing the other line break survive the round trip.
+    """
+
+    def __init__(
+        self,
+        header_fields: List[str],
+        sort_key: Callable[[Row], Any],
+        reverse: bool,
+        memory_limit: int,
+        tmp_dir: Optional[str],
+        stack: ExitStack,
+        newline: str = "\n",
+        encoding: str = "utf-8",
+    ) -> None:
+        self.header_fields = header_fields
+        self.sort_key = sort_key
+        self.reverse = reverse
+        self.memory_limit = memory_limit
+        self.tmp_dir = tmp_dir
+        self.stack = stack
+        self.newline = newline
+        self.encoding = encoding
+        self._dir: Optional[str] = None
+        self._runs: List[str] = []
+        self._run_count = 0
+        self._batch: List[Row] = []
+        self._used = 0
+
+    def _run_path(self) -> str:
+        if self._dir is None:
+            self._dir = self.stack.enter_context(
+                tempfile.TemporaryDirectory(prefix="efu-sort-", dir=self.tmp_dir)
+            )
+        self._run_count += 1
+        return os.path.join(self._dir, f"run{self._run_count}.efu")
+
+    def _write_run(self, rows: Iterable[Row]) -> str:
+        path = self._run_path()
+        with EfuWriter(path, newline=self.newline, encoding=self.encoding) as writer:
+            writer.write_header(self.header_fields)
+            writer.write_rows(rows)
+        return path
+
+    def add(self, rows: Iterable[Row]) -> None:
+        batch = self._batch
+        for row in rows:
+            batch.append(row)
+            self._used += _row_size(row)
+            if self._used >= self.memory_limit:
+                batch.sort(key=self.sort_key, reverse=self.reverse)
+                self._runs.append(self._write_run(batch))
+                batch.clear()
+                self._used = 0
+
+    def _merge(self, sources: List[Iterator[Row]]) -> Iterator[Row]:
+        return heapq.merge(*sources, key=self.sort_key, reverse=self.reverse)
+
+    def _open(self, path: str) -> Iterator[Row]:
+        rows, _, _ = iter_efu_rows(path, encoding=self.encoding)
+        return rows
+
+    def sorted_rows(self) -> Iterator[Row]:
+        """Return all added rows in order; equal keys keep their input order."""
+        self._batch.sort(key=self.sort_key, reverse=self.reverse)
+        runs = self._runs
+        # Merge consecutive groups of runs per pass so that ties stay in
+        # input order and every row is rewritten once per pass.
+        while len(runs) + 1 > _FAN_IN:
+            merged_runs = []
+            for start in range(0, len(runs), _FAN_IN):
+                group = runs[start:start + _FAN_IN]
+                if len(group) == 1:
+                    merged_runs.append(group[0])
+                    continue
+                merged_runs.append(
+                    self._write_run(self._merge([self._open(path) for path in group]))
+                )
+                for path in group:
+                    os.remove(path)
+            runs[:] = merged_runs
+        if not runs:
+            return iter(self._batch)
+        return self._merge([self._open(path) for path in runs] + [iter(self._batch)])
+
+
+def sort_efu(
+    file_path: str,
+    out_path: str,
+    key: str = "Filename",
+    reverse: bool = False,
+    memory_limit: int = _MEMORY_LIMIT,
+    tmp_dir: Optional[str] = None,
+    encoding: str = "utf-8",
+    engine: str = "fast",
+) -> int:
+    """Sort the rows of ``file_path`` by column ``key`` into ``out_path``.
+
+    Rows are collected until their estimated size reaches ``memory_limit``
+    bytes, sorted and spilled as a run to a temporary directory under
+    ``tmp_dir``; the runs are then combined with a heap-based k-way merge.
+    The sort is stable. Filename and other text columns sort as plain
+    strings, Size and the date and attribute columns as integers. With
+    ``key="path"`` Filename is compared one path component at a time, so
+    every folder is directly followed by its whole subtree, the order
+    :func:`rollup_efu` needs; in plain string order ``C:\\a-b.txt`` comes
+    between ``C:\\a`` and ``C:\\a\\x.txt``. Field text and the newline
+    style are preserved. Returns the number of rows.
+    """
+    rows, header_fields, newline = iter_efu_rows(file_path, encoding=encoding, engine=engine)
+    try:
+        sort_key = _sort_key(header_fields, key)
+    except ValueError:
+        rows.close()  # type: ignore[attr-defined]
+        raise
+    with ExitStack() as stack:
+        sorter = _RunSorter(
+            header_fields, sort_key, reverse, memory_limit, tmp_dir, stack, newline, encoding
+        )
+        sorter.add(rows)
+        with EfuWriter(out_path, newline=newline, encoding=encoding) as writer:
+            writer.write_header(header_fields)
+            writer.write_rows(sorter.sorted_rows())
+            return writer.rows_written
+
+
+def _newest(group: List[Row], index: Optional[int]) -> Row:
+    """Return the row with the latest Date Modified; later rows win ties."""
+    if index is None:
+        return group[-1]
+    best = group[0]
+    best_value = -1
+    for row in group:
+        text = row[index] if index < len(row) else ""
+        value = int(text) if text.isdigit() else -1
+        if value >= best_value:
+            best, best_value = row, value
+    return best
+
+
+def _pick(group: List[Row], policy: str, date: Optional[int]) -> Row:
+    if policy == "first":
+        return group[0]
+    if policy == "last":
+        return group[-1]
+    return _newest(group, date)
+
+
+def _dedupe(
+    rows: Iterator[Row], sort_key: Callable[[Row], Any], policy: str, date: Optional[int]
+) -> Iterator[Row]:
+    """Yield one row per run of equal keys in the sorted ``rows``."""
+    group: List[Row] = []
+    group_key = None
+    for row in rows:
+        row_key = sort_key(row)
+        if group and row_key != group_key:
+            yield _pick(group, policy, date)
+            group = []
+        group.append(row)
+        group_key = row_key
+    if group:
+        yield _pick(group, policy, date)
+
+
+def merge_efu(
+    file_paths: Sequence[str],
+    out_path: str,
+    dedupe: bool = True,
+    policy: str = "newest",
+    memory_limit: int = _MEMORY_LIMIT,
+    tmp_dir: Optional[str] = None,
+    encoding: str = "utf-8",
+    engine: str = "fast",
+) -> int:
+    """Merge several EFU files into one file sorted by Filename.
+
+    The inputs need not be sorted; they are sorted externally as in
+    :func:`sort_efu` and combined in one k-way merge. All inputs must have
+    the same header, and the output uses the newline of the first one.
+
+    With ``dedupe`` only one row is kept per Filename, chosen by
+    ``policy``: ``"newest"`` keeps the latest Date Modified (on ties, or
+    without that column, the row from the later input), ``"first"`` the
+    row from the earliest input and ``"last"`` the one from the latest
+    input. Returns the number of rows written.
+    """
+    if policy not in _POLICIES:
+        raise ValueError(f"unknown merge policy: {policy!r}")
+    if not file_paths:
+        raise ValueError("no EFU files to merge")
+    with ExitStack() as stack:
+        sources: List[Iterator[Row]] = []
+        header_fields: List[str] = []
+        newline = "\n"
+        for i, path in enumerate(file_paths):
+            rows, fields, file_newline = iter_efu_rows(path, encoding=encoding, engine=engine)
+            stack.callback(rows.close)  # type: ignore[attr-defined]
+            if i == 0:
+                header_fields, newline = fields, file_newline
+            elif fields != header_fields:
+                raise ValueError(f"{path} has different header fields")
+            sources.append(rows)
+        sort_key = _sort_key(header_fields, "Filename")
+        date = header_fields.index("Date Modified") if "Date Modified" in header_fields else None
+
+        sorter = _RunSorter(
+            header_fields, sort_key, False, memory_limit, tmp_dir, stack, newline, encoding
+        )
+        for rows in sources:
+            sorter.add(rows)
+        merged = sorter.sorted_rows()
+
+        with EfuWriter(out_path, newline=newline, encoding=encoding) as writer:
+            writer.write_header(header_fields)
+            if dedupe:
+                merged = _dedupe(merged, sort_key, policy, date)
+            writer.write_rows(merged)
+            return writer.rows_written
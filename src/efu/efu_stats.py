@@ -0,0 +1,100 @@
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+import threading
+import time
+
+
+class EfuStats:
+    """Counters, phase timers and progress reports of an instrumented operation.
+
+    Pass an instance as ``stats`` to the parse, write and scan functions to
+    collect what they do; without it they run their uninstrumented code.
+    Counters include ``rows_read``, ``rows_written``, ``bytes_read``,
+    ``bytes_written``, ``reads`` and ``writes`` (I/O calls), and for parsing
+    ``rows_skipped`` (blank lines), ``quoted_fields`` and
+    ``unquoted_fields``; scans count ``entries``, ``scandir_calls``,
+    ``stat_calls`` and ``unreadable_dirs``. Phase timers
+    accumulate seconds spent in ``read``, ``decode``, ``split``,
+    ``convert``, ``format``, ``encode``, ``write`` and ``list``; work done
+    by other code while consuming a lazy iterator is not included.
+
+    ``progress`` is called with this object at most every ``interval``
+    seconds while an operation runs, possibly from a worker thread. One
+    instance may be shared by several operations; its totals add up.
+    """
+
+    def __init__(
+        self,
+        progress: Optional[Callable[["EfuStats"], None]] = None,
+        interval: float = 0.5,
+    ) -> None:
+        self.counters: Dict[str, int] = {}
+        self.timings: Dict[str, float] = {}
+        self.progress = progress
+        self.interval = interval
+        self.started = time.perf_counter()
+        self._next_progress = self.started + interval
+        self._lock = threading.Lock()
+
+    def add(self, name: str, amount: int = 1) -> None:
+        """Increase counter ``name`` by ``amount``."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def add_time(self, name: str, seconds: float) -> None:
+        """Add ``seconds`` to phase ``name``."""
+        with self._lock:
+            self.timings[name] = self.timings.get(name, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the ``with`` block as part of phase ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def tick(self) -> None:
+        """Call ``progress`` if ``interval`` seconds passed since the last call."""
+        if self.progress is None:
+            return
+        now = time.perf_counter()
+        if now >= self._next_progress:
+            self._next_progress = now + self.interval
+            self.progress(self)
+
+    def __getitem__(self, name: str) -> int:
+        """Return counter ``name``, zero if it was never increased."""
+        return self.counters.get(name, 0)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the object was created."""
+        return time.perf_counter() - self.started
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return elapsed seconds, counters and timings as plain data."""
+        with self._lock:
+            return {
+                "elapsed": self.elapsed,
+                "counters": dict(sorted(self.counters.items())),
+                "timings": dict(sorted(self.timings.items())),
+            }
+
+    def format(self) -> str:
+        """Return a readable multi-line report."""
+        data = self.as_dict()
+        elapsed = data["elapsed"]
+        names = list(data["counters"]) + list(data["timings"])
+        width = max([len(name) for name in names] + [len("elapsed")])
+        lines = [f"{'elapsed':<{width}}  {elapsed:.3f}s"]
+        for name, value in data["counters"].items():
+            lines.append(f"{name:<{width}}  {value}")
+        for name, seconds in data["timings"].items():
+            share = seconds / elapsed * 100 if elapsed > 0 else 0.0
+            lines.append(f"{name:<{width}}  {seconds:.3f}s  {share:5.1f}%")
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return f"EfuStats(counters={self.counters!r}, timings={self.timings!r})"
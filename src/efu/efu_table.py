@@ -0,0 +1,276 @@
+from array import array
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+    overload,
+)
+
+from .array_to_efu import array_to_efu
+from .efu_record import EfuRecord
+from .efu_records import EfuRecords
+from .iter_efu_objects import NUMERIC_COLUMNS, _convert_value
+from .iter_efu_rows import iter_efu_rows
+from .packed_strings import PackedStrings
+from .path_store import PathStore
+
+
+class _IntColumn:
+    """Integer column stored in a typed array with a null bitmap."""
+
+    __slots__ = ("values", "nulls")
+
+    def __init__(self, typecode: str) -> None:
+        self.values = array(typecode)
+        self.nulls = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def is_null(self, index: int) -> bool:
+        return bool(self.nulls[index >> 3] & (1 << (index & 7)))
+
+    def append_text(self, text: str) -> bool:
+        """Append ``text`` and return ``False`` if it cannot be stored losslessly."""
+        count = len(self.values)
+        if text == "":
+            value = 0
+        elif text.isascii() and text.isdigit() and (text == "0" or text[0] != "0"):
+            value = int(text)
+        else:
+            return False
+        try:
+            self.values.append(value)
+        except OverflowError:
+            return False
+        if not count & 7:
+            self.nulls.append(0)
+        if text == "":
+            self.nulls[count >> 3] |= 1 << (count & 7)
+        return True
+
+    def get(self, index: int) -> Optional[int]:
+        return None if self.is_null(index) else self.values[index]
+
+    def get_text(self, index: int) -> str:
+        return "" if self.is_null(index) else str(self.values[index])
+
+
+class _StrColumn:
+    """Text column stored as packed UTF-8."""
+
+    __slots__ = ("values",)
+
+    def __init__(self, values: Iterable[str] = ()) -> None:
+        self.values = PackedStrings(values)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def append_text(self, text: str) -> bool:
+        self.values.append(text)
+        return True
+
+    def get(self, index: int) -> Any:
+        return _convert_value(self.values[index])
+
+    def get_text(self, index: int) -> str:
+        return self.values[index]
+
+
+class _PathColumn(_StrColumn):
+    """Path column stored in a prefix-compressed :class:`PathStore`."""
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        self.values = PathStore()  # type: ignore[assignment]
+
+
+class EfuTableRow(Mapping[str, Any]):
+    """Read-only mapping view of one :class:`EfuTable` row."""
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "EfuTable", index: int) -> None:
+        self._table = table
+        self._index = index
+
+    def __getitem__(self, key: str) -> Any:
+        return self._table._columns[self._table._positions[key]].get(self._index)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table.header_fields)
+
+    def __len__(self) -> int:
+        return len(self._table.header_fields)
+
+    def __repr__(self) -> str:
+        return f"EfuTableRow({dict(self)!r})"
+
+
+class EfuTable(Sequence[EfuTableRow]):
+    """Columnar, memory-compact representation of EFU data.
+
+    Well-known numeric columns are kept in ``array('q')``/``array('Q')`` with
+    a null bitmap for empty values; every other column, including
+    ``Filename``, is packed into a single UTF-8 buffer with an offset array.
+    A numeric column that receives a value which cannot be written back
+    verbatim (for example a leading zero) is converted to text storage, so
+    :meth:`iter_rows` always reproduces the original field strings.
+
+    With ``compress_paths`` the ``Filename`` column is kept in a
+    :class:`PathStore`, which interns shared directory prefixes.
+    """
+
+    def __init__(
+        self,
+        header_fields: Iterable[str],
+        newline: str = "\n",
+        compress_paths: bool = False,
+    ) -> None:
+        self.header_fields = list(header_fields)
+        self.newline = newline
+        self._positions = {name: i for i, name in enumerate(self.header_fields)}
+        self._columns: List[Any] = []
+        for name in self.header_fields:
+            if name in NUMERIC_COLUMNS:
+                self._columns.append(_IntColumn(NUMERIC_COLUMNS[name]))
+            elif name == "Filename" and compress_paths:
+                self._columns.append(_PathColumn())
+            else:
+                self._columns.append(_StrColumn())
+        self._length = 0
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Sequence[str]],
+        header_fields: Iterable[str],
+        newline: str = "\n",
+        compress_paths: bool = False,
+    ) -> "EfuTable":
+        """Build a table from parsed string rows such as ``efu_to_array`` output."""
+        table = cls(header_fields, newline, compress_paths)
+        table.extend_rows(rows)
+        return table
+
+    @classmethod
+    def from_file(
+        cls,
+        file_path: str,
+        encoding: str = "utf-8",
+        engine: str = "fast",
+        compress_paths: bool = False,
+    ) -> "EfuTable":
+        """Stream ``file_path`` into a new table without materializing rows."""
+        rows, header_fields, newline = iter_efu_rows(file_path, encoding=encoding, engine=engine)
+        return cls.from_rows(rows, header_fields, newline, compress_paths)
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Mapping[str, Any]],
+        header_fields: Optional[Iterable[str]] = None,
+        newline: str = "\n",
+        compress_paths: bool = False,
+    ) -> "EfuTable":
+        """Build a table from :class:`EfuRecords` or other row mappings.
+
+        Header fields default to the keys of the first record.
+        """
+        iterator = iter(records)
+        first = None
+        if header_fields is None:
+            first = next(iterator, None)
+            header_fields = list(first.keys()) if first is not None else []
+        table = cls(header_fields, newline, compress_paths)
+        if first is not None:
+            table.append_record(first)
+        for record in iterator:
+            table.append_record(record)
+        return table
+
+    def append_row(self, row: Sequence[str]) -> None:
+        """Append one row of field strings; missing trailing fields are empty."""
+        count = len(row)
+        for i, column in enumerate(self._columns):
+            text = row[i] if i < count else ""
+            if not column.append_text(text):
+                column = self._columns[i] = _StrColumn(
+                    column.get_text(j) for j in range(self._length)
+                )
+                column.append_text(text)
+        self._length += 1
+
+    def extend_rows(self, rows: Iterable[Sequence[str]]) -> None:
+        for row in rows:
+            self.append_row(row)
+
+    def append_record(self, record: Mapping[str, Any]) -> None:
+        """Append a mapping, converting ``None`` to empty and values with ``str``."""
+        row: List[str] = []
+        for name in self.header_fields:
+            value = record.get(name)
+            row.append("" if value is None else str(value))
+        self.append_row(row)
+
+    def column(self, name: str) -> List[Any]:
+        """Return the typed values of column ``name``."""
+        column = self._columns[self._positions[name]]
+        return [column.get(i) for i in range(self._length)]
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> EfuTableRow: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[EfuTableRow]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [EfuTableRow(self, i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("EfuTable index out of range")
+        return EfuTableRow(self, index)
+
+    def iter_rows(self) -> Iterator[List[str]]:
+        """Yield rows of field strings suitable for :func:`array_to_efu`."""
+        columns = self._columns
+        for i in range(self._length):
+            yield [column.get_text(i) for column in columns]
+
+    def iter_objects(self) -> Iterator[Dict[str, Any]]:
+        """Yield row dictionaries as produced by :func:`efu_to_objects`."""
+        for i in range(self._length):
+            yield dict(EfuTableRow(self, i))
+
+    def to_records(self) -> EfuRecords:
+        """Return the table contents as an :class:`EfuRecords` list."""
+        headers = self.header_fields
+        return EfuRecords(EfuRecord(headers, obj) for obj in self.iter_objects())
+
+    def to_efu(
+        self,
+        file_path: str,
+        newline: Optional[str] = None,
+        encoding: str = "utf-8",
+    ) -> None:
+        """Write the table to ``file_path`` using the table's newline by default."""
+        array_to_efu(
+            self.iter_rows(),
+            self.header_fields,
+            file_path,
+            newline=newline or self.newline,
+            encoding=encoding,
+        )
@@ -1,43 +1,44 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+import os
 
+from .efu_stats import EfuStats
+from .iter_efu_rows import _fewer_collections, iter_efu_rows
+from .open_efu import EfuFile
+from .parse_parallel import _can_parse_parallel, _parse_parallel
 
-def efu_to_array(file_path: str, encoding: str = "utf-8") -> Tuple[List[List[str]], List[str], str]:
-    """Parse an Everything EFU file and return rows, header fields, and newline."""
-    with open(file_path, 'rb') as f:
-        raw = f.read()
-    newline = '\r\n' if b'\r\n' in raw else '\n'
 
-    with open(file_path, 'r', encoding=encoding, newline='') as f:
-        header_raw = f.readline()
-        header_fields = header_raw.rstrip('\r\n').split(',')
-        rest = f.read()
+def efu_to_array(
+    file_path: EfuFile,
+    encoding: str = "utf-8",
+    engine: str = "fast",
+    workers: Optional[int] = None,
+    stats: Optional[EfuStats] = None,
+) -> Tuple[List[List[str]], List[str], str]:
+    """Parse an Everything EFU file and return rows, header fields, and newline.
 
-    lines = rest.split(newline)
-    rows: List[List[str]] = []
-    for line in lines:
-        if line == '':
-            continue
-        row: List[str] = []
-        field: List[str] = []
-        in_quote = False
-        i = 0
-        length = len(line)
-        while i < length:
-            ch = line[i]
-            if ch == '"':
-                if in_quote and i + 1 < length and line[i + 1] == '"':
-                    field.append('"')
-                    i += 2
-                else:
-                    in_quote = not in_quote
-                    i += 1
-            elif ch == ',' and not in_quote:
-                row.append(''.join(field))
-                field = []
-                i += 1
-            else:
-                field.append(ch)
-                i += 1
-        row.append(''.join(field))
-        rows.append(row)
-    return rows, header_fields, newline
+    With ``workers`` greater than one the file is split into newline-aligned
+    byte ranges that are parsed in a process pool. Compressed files, file
+    objects and encodings that are not ASCII-compatible, such as UTF-16,
+    cannot be split and are parsed sequentially.
+
+    ``stats`` collects counters and phase timings, see :class:`EfuStats`;
+    a parallel parse is timed as a whole as the ``parse`` phase.
+
+    While the rows are collected, the garbage collector's first-generation
+    threshold is raised so that collections do not keep traversing the
+    growing result; it is restored when the call returns. Other threads
+    see the raised threshold meanwhile.
+    """
+    if workers is not None and workers > 1 and _can_parse_parallel(file_path, encoding):
+        if stats is None:
+            return _parse_parallel(file_path, encoding, engine, workers)  # type: ignore[arg-type]
+        with stats.phase("parse"):
+            result = _parse_parallel(file_path, encoding, engine, workers)  # type: ignore[arg-type]
+        stats.add("rows_read", len(result[0]))
+        stats.add("bytes_read", os.path.getsize(file_path))  # type: ignore[arg-type]
+        return result
+    rows, header_fields, newline = iter_efu_rows(
+        file_path, encoding=encoding, engine=engine, stats=stats
+    )
+    with _fewer_collections():
+        return list(rows), header_fields, newline
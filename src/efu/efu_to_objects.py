@@ -1,23 +1,43 @@
-from typing import Any, Dict, List
+from typing import Any, List, Optional
+import os
 
-from .efu_to_array import efu_to_array
+from .efu_stats import EfuStats
+from .iter_efu_objects import iter_efu_objects
+from .iter_efu_rows import _fewer_collections
+from .open_efu import EfuFile
+from .parse_parallel import _can_parse_parallel, _parse_parallel
 
 
-def efu_to_objects(file_path: str, encoding: str = "utf-8") -> List[Dict[str, Any]]:
-    """Parse an EFU file and return a list of row dictionaries."""
-    rows, header_fields, _ = efu_to_array(file_path, encoding=encoding)
+def efu_to_objects(
+    file_path: EfuFile,
+    encoding: str = "utf-8",
+    engine: str = "fast",
+    workers: Optional[int] = None,
+    compact: bool = False,
+    stats: Optional[EfuStats] = None,
+) -> List[Any]:
+    """Parse an EFU file and return a list of row dictionaries.
 
-    objects: List[Dict[str, Any]] = []
-    for row in rows:
-        obj: Dict[str, Any] = {}
-        for i, header in enumerate(header_fields):
-            value = row[i] if i < len(row) else ""
-            if value == "":
-                obj[header] = None
-            elif value.isdigit():
-                obj[header] = int(value)
-            else:
-                obj[header] = value
-        objects.append(obj)
-
-    return objects
+    With ``compact`` the rows are :class:`EfuRow` tuples generated for the
+    file's header instead of dictionaries, which needs far less memory.
+    ``stats`` and the garbage collector threshold work as in
+    :func:`efu_to_array`.
+    """
+    if workers is not None and workers > 1 and _can_parse_parallel(file_path, encoding):
+        if stats is None:
+            objects, _, _ = _parse_parallel(
+                file_path, encoding, engine, workers, objects=True, compact=compact  # type: ignore[arg-type]
+            )
+            return objects
+        with stats.phase("parse"):
+            objects, _, _ = _parse_parallel(
+                file_path, encoding, engine, workers, objects=True, compact=compact  # type: ignore[arg-type]
+            )
+        stats.add("rows_read", len(objects))
+        stats.add("bytes_read", os.path.getsize(file_path))  # type: ignore[arg-type]
+        return objects
+    objects_iter, _, _ = iter_efu_objects(
+        file_path, encoding=encoding, engine=engine, compact=compact, stats=stats
+    )
+    with _fewer_collections():
+        return list(objects_iter)
@@ -0,0 +1,161 @@
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
+
+from .path_store import _last_separator
+
+
+class EfuTree(Mapping[str, Any]):
+    """Hierarchical index over the paths of parsed EFU data.
+
+    Paths are hashed once, so looking up a full path is a dictionary access,
+    and every entry is linked to its parent, first child and next sibling in
+    flat arrays. Both ``\\`` and ``/`` separate path components and trailing
+    separators are ignored. With ``case_sensitive=False`` keys are compared
+    casefolded, as on Windows.
+
+    The parent of an entry is its nearest ancestor present in the data;
+    entries without one are roots. Children are listed in input order. If a
+    path occurs more than once, the last occurrence wins.
+
+    Mapping access returns the item the path came from: the record or row
+    for :meth:`from_records` and :meth:`from_rows`, otherwise the path
+    string as given.
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[str],
+        items: Optional[Sequence[Any]] = None,
+        case_sensitive: bool = True,
+    ) -> None:
+        self.case_sensitive = case_sensitive
+        self._paths: List[str] = list(paths)
+        self.items: Sequence[Any] = self._paths if items is None else items
+        if len(self.items) != len(self._paths):
+            raise ValueError("items and paths must have the same length")
+        count = len(self._paths)
+        keys = [self._key(path) for path in self._paths]
+        self._index: Dict[str, int] = {key: node for node, key in enumerate(keys)}
+
+        self._parent = array("l", [-1]) * count
+        self._first_child = array("l", [-1]) * count
+        self._next_sibling = array("l", [-1]) * count
+        self._roots: List[int] = []
+        index = self._index
+        parents = self._parent
+        for node, key in enumerate(keys):
+            if index[key] != node:
+                continue
+            cut = _last_separator(key, len(key))
+            while cut != -1:
+                parent = index.get(key[:cut] or key[:1])
+                if parent is not None and parent != node:
+                    parents[node] = parent
+                    break
+                cut = _last_separator(key, cut)
+        # Link children back to front so each list ends up in input order.
+        first = self._first_child
+        siblings = self._next_sibling
+        for node in range(count - 1, -1, -1):
+            parent = parents[node]
+            if parent != -1:
+                siblings[node] = first[parent]
+                first[parent] = node
+            elif index[keys[node]] == node:
+                self._roots.append(node)
+        self._roots.reverse()
+
+    @classmethod
+    def from_records(
+        cls, records: Sequence[Mapping[str, Any]], case_sensitive: bool = True
+    ) -> "EfuTree":
+        """Index :class:`EfuRecords` or other mappings by their ``Filename``."""
+        return cls([record["Filename"] for record in records], records, case_sensitive)
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Sequence[Sequence[str]],
+        header_fields: Sequence[str],
+        case_sensitive: bool = True,
+    ) -> "EfuTree":
+        """Index parsed rows such as ``efu_to_array`` output by their ``Filename``."""
+        column = list(header_fields).index("Filename")
+        return cls([row[column] for row in rows], rows, case_sensitive)
+
+    def _key(self, path: str) -> str:
+        key = path.rstrip("\\/") or path
+        return key if self.case_sensitive else key.casefold()
+
+    def _node(self, path: str) -> int:
+        node = self._index.get(self._key(path))
+        if node is None:
+            raise KeyError(path)
+        return node
+
+    def index(self, path: str) -> int:
+        """Return the position of ``path`` in the input."""
+        return self._node(path)
+
+    def __getitem__(self, path: str) -> Any:
+        return self.items[self._node(path)]
+
+    def __contains__(self, path: object) -> bool:
+        return isinstance(path, str) and self._key(path) in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        paths = self._paths
+        for node in self._index.values():
+            yield paths[node]
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def parent(self, path: str) -> Optional[str]:
+        """Return the path of the parent of ``path``, or ``None`` for a root."""
+        parent = self._parent[self._node(path)]
+        return None if parent == -1 else self._paths[parent]
+
+    def _child_nodes(self, node: int) -> Iterator[int]:
+        child = self._first_child[node]
+        siblings = self._next_sibling
+        while child != -1:
+            yield child
+            child = siblings[child]
+
+    def children(self, path: str) -> List[str]:
+        """Return the paths of the direct children of ``path``."""
+        paths = self._paths
+        return [paths[child] for child in self._child_nodes(self._node(path))]
+
+    def roots(self) -> List[str]:
+        """Return the paths that have no ancestor in the data."""
+        return [self._paths[node] for node in self._roots]
+
+    def _walk_nodes(self, node: int) -> Iterator[int]:
+        first = self._first_child
+        siblings = self._next_sibling
+        parents = self._parent
+        yield node
+        current = first[node]
+        while current != -1:
+            yield current
+            if first[current] != -1:
+                current = first[current]
+                continue
+            while current != node and siblings[current] == -1:
+                current = parents[current]
+            if current == node:
+                return
+            current = siblings[current]
+
+    def walk(self, path: Optional[str] = None) -> Iterator[str]:
+        """Yield ``path`` and everything below it in depth-first pre-order.
+
+        Without ``path`` every root and its subtree are walked.
+        """
+        paths = self._paths
+        starts = self._roots if path is None else [self._node(path)]
+        for start in starts:
+            for node in self._walk_nodes(start):
+                yield paths[node]
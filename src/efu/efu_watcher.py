@@ -0,0 +1,346 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import stat
+import struct
+import sys
+import threading
+import time
+
+from .efu_record import DEFAULT_HEADERS, EfuRecord, _fill_from_stat
+from .efu_records import EfuRecords
+from .objects_to_efu import objects_to_efu
+from .open_efu import compression_for
+from .rescan_directory import _is_lost, rescan_directory
+from .scan_directory import _attributes, iter_scan
+
+# inotify(7) constants.
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+)
+_ENTRY_CHANGES = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO
+_EVENT = struct.Struct("iIII")
+
+
+def _load_libc() -> Any:
+    if not sys.platform.startswith("linux"):
+        raise OSError(errno.ENOSYS, "inotify is only available on Linux")
+    libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+    libc.inotify_init1.argtypes = [ctypes.c_int]
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    return libc
+
+
+class EfuWatcher:
+    """Keep an :class:`EfuRecords` collection current using Linux inotify.
+
+    The watcher adds a watch for every directory under ``dir_path``. Events
+    are read in bursts: after the first event arrives, reading continues
+    until the stream has been quiet for ``settle`` seconds. Duplicate events
+    for the same path are coalesced, so each changed path is stat-ed once
+    per burst no matter how many writes it received.
+
+    Existing entries get ``last_seen`` refreshed, new ones also get
+    ``first_seen``, and removed ones get ``last_lost`` and stay in
+    ``records``. If the kernel queue overflows, the tree is reconciled with
+    :func:`rescan_directory`.
+
+    Lost records are kept until :meth:`forget_lost` drops them, so on a tree
+    where many uniquely named files come and go ``records`` keeps growing.
+    With ``forget_lost_after`` every :meth:`flush` first forgets the records
+    lost at least that many seconds ago.
+    """
+
+    def __init__(
+        self,
+        dir_path: str,
+        records: Optional[EfuRecords] = None,
+        headers: Optional[Iterable[str]] = None,
+        settle: float = 0.05,
+        forget_lost_after: Optional[float] = None,
+    ) -> None:
+        self.dir_path = dir_path
+        self.settle = settle
+        self.forget_lost_after = forget_lost_after
+        self._libc = _load_libc()
+        if records is None:
+            self.headers = list(headers) if headers is not None else list(DEFAULT_HEADERS)
+            records = EfuRecords()
+            records.extend_from_directory(dir_path, self.headers)
+        elif headers is not None:
+            self.headers = list(headers)
+        else:
+            self.headers = list(records[0].keys()) if records else list(DEFAULT_HEADERS)
+        self.records = records
+        self._watches: Dict[int, str] = {}
+        self._watched: Dict[str, int] = {}
+        self._index_records()
+        self._pending: Set[str] = set()
+        self._overflow = False
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        try:
+            self._watch_tree(dir_path)
+        except BaseException:
+            self.close()
+            raise
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def _index_records(self) -> None:
+        self._index: Dict[str, Any] = {}
+        # Child paths per directory, over indexed and watched paths alike.
+        self._children: Dict[str, Set[str]] = {}
+        for record in self.records:
+            self._add_index(record["Filename"], record)
+        for path in self._watched:
+            self._link(path)
+        self._lost: Set[str] = {path for path, rec in self._index.items() if _is_lost(rec)}
+
+    def _link(self, path: str) -> None:
+        self._children.setdefault(os.path.dirname(path), set()).add(path)
+
+    def _add_index(self, path: str, record: Any) -> None:
+        self._index[path] = record
+        self._link(path)
+
+    def _subtree(self, path: str) -> Iterator[str]:
+        """Yield ``path`` and every known path below it."""
+        stack = [path]
+        while stack:
+            current = stack.pop()
+            yield current
+            stack.extend(self._children.get(current, ()))
+
+    def _add_watch(self, path: str) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), _WATCH_MASK)
+        if wd < 0:
+            return
+        self._watches[wd] = path
+        self._watched[path] = wd
+        self._link(path)
+
+    def _watch_tree(self, path: str) -> None:
+        for entry_path, st, _ in iter_scan(path):
+            if stat.S_ISDIR(st.st_mode):
+                self._add_watch(entry_path)
+
+    def _drop_watches(self, path: str) -> None:
+        for watched in self._subtree(path):
+            wd = self._watched.pop(watched, None)
+            if wd is not None:
+                self._watches.pop(wd, None)
+                self._libc.inotify_rm_watch(self._fd, wd)
+
+    def _read_events(self) -> int:
+        try:
+            data = os.read(self._fd, 1 << 16)
+        except BlockingIOError:
+            return 0
+        count = 0
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            count += 1
+            self._handle_event(wd, mask, name)
+        return count
+
+    def _handle_event(self, wd: int, mask: int, name: bytes) -> None:
+        if mask & IN_Q_OVERFLOW:
+            self._overflow = True
+            return
+        if mask & IN_IGNORED:
+            path = self._watches.pop(wd, None)
+            if path is not None and self._watched.get(path) == wd:
+                del self._watched[path]
+            return
+        base = self._watches.get(wd)
+        if base is None:
+            return
+        if name:
+            path = os.path.join(base, os.fsdecode(name))
+            if mask & _ENTRY_CHANGES:
+                # Adding or removing an entry also changes the directory's mtime.
+                self._pending.add(base)
+        else:
+            path = base
+        if mask & IN_MOVED_FROM and mask & IN_ISDIR:
+            self._drop_watches(path)
+        self._pending.add(path)
+
+    def poll(self, timeout: Optional[float] = None) -> int:
+        """Wait up to ``timeout`` seconds for events and apply them.
+
+        Returns the number of distinct paths that were refreshed.
+        """
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return 0
+        while self._read_events():
+            ready, _, _ = select.select([self._fd], [], [], self.settle)
+            if not ready:
+                break
+        return self.apply_pending()
+
+    def apply_pending(self) -> int:
+        """Stat every path with pending events once and update the records."""
+        if self._overflow:
+            self._overflow = False
+            self._pending.clear()
+            self._resync()
+            return len(self.records)
+        pending = sorted(self._pending)
+        self._pending.clear()
+        now = int(time.time())
+        for path in pending:
+            self._refresh(path, now)
+        return len(pending)
+
+    def _refresh(self, path: str, now: int) -> None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._mark_lost(path, now)
+            return
+        record = self._index.get(path)
+        if record is None:
+            record = EfuRecord(self.headers)
+            record.first_seen = now
+            self.records.append(record)
+            self._add_index(path, record)
+        elif record.first_seen is None:
+            record.first_seen = now
+        record.last_seen = now
+        self._lost.discard(path)
+        _fill_from_stat(record, path, st, _attributes(st))
+        if stat.S_ISDIR(st.st_mode) and path not in self._watched:
+            # A directory created or moved in: watch it and pick up its contents.
+            self._watch_tree(path)
+            for entry_path, entry_stat, _ in iter_scan(path):
+                if entry_path != path:
+                    self._refresh_from_stat(entry_path, entry_stat, now)
+
+    def _refresh_from_stat(self, path: str, st: os.stat_result, now: int) -> None:
+        record = self._index.get(path)
+        if record is None:
+            record = EfuRecord(self.headers)
+            record.first_seen = now
+            self.records.append(record)
+            self._add_index(path, record)
+        record.last_seen = now
+        self._lost.discard(path)
+        _fill_from_stat(record, path, st, _attributes(st))
+
+    def _mark_lost(self, path: str, now: int) -> None:
+        for candidate in self._subtree(path):
+            record = self._index.get(candidate)
+            if record is not None and candidate not in self._lost:
+                record.last_lost = now
+                self._lost.add(candidate)
+        self._drop_watches(path)
+
+    def _resync(self) -> None:
+        self.records = rescan_directory(self.records, self.dir_path, headers=self.headers)
+        self._drop_watches(self.dir_path)
+        self._index_records()
+        self._watch_tree(self.dir_path)
+
+    def live_records(self) -> List[Any]:
+        """Return the records that are currently present on disk."""
+        lost = self._lost
+        return [rec for rec in self.records if rec["Filename"] not in lost]
+
+    def forget_lost(self, older_than: float = 0.0) -> int:
+        """Drop records lost at least ``older_than`` seconds ago.
+
+        Returns the number of records removed from ``records``.
+        """
+        cutoff = time.time() - older_than
+        forget = {path for path in self._lost if self._index[path].last_lost <= cutoff}
+        if not forget:
+            return 0
+        self.records[:] = [rec for rec in self.records if rec["Filename"] not in forget]
+        for path in forget:
+            del self._index[path]
+            self._lost.discard(path)
+            if not self._children.get(path):
+                self._children.pop(path, None)
+            siblings = self._children.get(os.path.dirname(path))
+            if siblings is not None and path not in self._watched:
+                siblings.discard(path)
+        return len(forget)
+
+    def flush(self, file_path: str, newline: Optional[str] = None, encoding: str = "utf-8") -> None:
+        """Atomically write the live records to ``file_path`` as an EFU snapshot.
+
+        The snapshot is compressed by the extension of ``file_path`` like
+        any other EFU output. Lost records are forgotten first if
+        ``forget_lost_after`` is set.
+        """
+        if self.forget_lost_after is not None:
+            self.forget_lost(self.forget_lost_after)
+        # Keep the compression suffix last so the temporary file gets it too.
+        suffix = compression_for(file_path) or ""
+        tmp_path = file_path[:len(file_path) - len(suffix)] + ".tmp" + suffix
+        objects_to_efu(
+            self.live_records(), tmp_path, newline=newline, encoding=encoding, headers=self.headers
+        )
+        os.replace(tmp_path, file_path)
+
+    def run(
+        self,
+        stop: threading.Event,
+        snapshot_path: Optional[str] = None,
+        flush_interval: float = 60.0,
+        newline: Optional[str] = None,
+    ) -> None:
+        """Process events until ``stop`` is set, flushing snapshots periodically."""
+        last_flush = time.monotonic()
+        dirty = False
+        while not stop.is_set():
+            if self.poll(timeout=min(1.0, flush_interval)):
+                dirty = True
+            if snapshot_path and dirty and time.monotonic() - last_flush >= flush_interval:
+                self.flush(snapshot_path, newline=newline)
+                last_flush = time.monotonic()
+                dirty = False
+        if snapshot_path and dirty:
+            self.flush(snapshot_path, newline=newline)
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def __enter__(self) -> "EfuWatcher":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
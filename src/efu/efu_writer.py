@@ -0,0 +1,182 @@
+from itertools import islice
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Sequence
+import codecs
+import io
+
+from .efu_stats import EfuStats
+from .open_efu import EfuFile, _open_output
+
+
+def _format_field(value: str) -> str:
+    """Quote ``value`` unless it is empty or consists only of digits."""
+    if value == "" or value.isdigit():
+        return value
+    return '"' + value.replace('"', '""') + '"'
+
+
+def _format_value(value: Any) -> str:
+    """Format a typed value; ``None`` is empty and others go through ``str``."""
+    if value is None:
+        return ""
+    if type(value) is int and value >= 0:
+        return str(value)
+    return _format_field(str(value))
+
+
+def _format_row(row: Sequence[str], newline: str) -> str:
+    return ",".join([_format_field(field) for field in row]) + newline
+
+
+def _format_object(obj: Mapping[str, Any], header_fields: Sequence[str], newline: str) -> str:
+    get = obj.get
+    return ",".join([_format_value(get(key)) for key in header_fields]) + newline
+
+
+class EfuWriter:
+    """Incrementally write an EFU file using the quoting rules of ``array_to_efu``.
+
+    Lines are collected into batches of ``batch_size`` and written with a
+    single call, so rows can be streamed from generators without
+    materializing them.
+
+    ``file_path`` may end in ``.gz``, ``.bz2`` or ``.xz`` to compress while
+    writing, or be an open binary or text file object, which is flushed but
+    not closed by :meth:`close`.
+
+    With an :class:`EfuStats` as ``stats`` the writer counts rows, bytes
+    and write calls and times formatting, encoding and writing.
+    """
+
+    def __init__(
+        self,
+        file_path: EfuFile,
+        newline: Optional[str] = None,
+        encoding: str = "utf-8",
+        batch_size: int = 8192,
+        stats: Optional[EfuStats] = None,
+    ) -> None:
+        self.newline = newline or "\n"
+        self.encoding = encoding
+        self.batch_size = batch_size
+        self.rows_written = 0
+        self.header_fields: List[str] = []
+        self._buffer: List[str] = []
+        self._file, self._owns_file = _open_output(file_path)
+        self._text = isinstance(self._file, io.TextIOBase)
+        # Stateful, so a byte order mark is written once rather than per batch.
+        self._encode = codecs.getincrementalencoder(encoding)().encode
+        self._closed = False
+        self.stats = stats
+
+    def write_header(self, header_fields: Iterable[str]) -> None:
+        """Write the header line; header fields are never quoted."""
+        self.header_fields = list(header_fields)
+        self._buffer.append(",".join(self.header_fields) + self.newline)
+
+    def _write_stats(self, items: Iterable[Any], format_line: Callable[[Any], str]) -> None:
+        """Instrumented writing: format one batch at a time under the ``format`` timer.
+
+        Items are pulled before the timer starts, so the time spent
+        producing them is not counted as formatting.
+        """
+        stats: EfuStats = self.stats  # type: ignore[assignment]
+        items = iter(items)
+        while True:
+            batch = list(islice(items, self.batch_size))
+            if not batch:
+                return
+            with stats.phase("format"):
+                lines = [format_line(item) for item in batch]
+            self._buffer.extend(lines)
+            self.rows_written += len(lines)
+            stats.add("rows_written", len(lines))
+            if len(self._buffer) >= self.batch_size:
+                self.flush()
+            stats.tick()
+
+    def write_row(self, row: Sequence[str]) -> None:
+        if self.stats is not None:
+            self.write_rows([row])
+            return
+        self._buffer.append(_format_row(row, self.newline))
+        self.rows_written += 1
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def write_rows(self, rows: Iterable[Sequence[str]]) -> None:
+        newline = self.newline
+        if self.stats is not None:
+            self._write_stats(rows, lambda row: _format_row(row, newline))
+            return
+        batch_size = self.batch_size
+        buffer = self._buffer
+        for row in rows:
+            buffer.append(_format_row(row, newline))
+            self.rows_written += 1
+            if len(buffer) >= batch_size:
+                self.flush()
+
+    def write_object(self, obj: Mapping[str, Any]) -> None:
+        """Write a mapping keyed by the header fields, as ``objects_to_efu`` does."""
+        if self.stats is not None:
+            self.write_objects([obj])
+            return
+        self._buffer.append(_format_object(obj, self.header_fields, self.newline))
+        self.rows_written += 1
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def write_objects(self, objects: Iterable[Mapping[str, Any]]) -> None:
+        newline = self.newline
+        header_fields = self.header_fields
+        if self.stats is not None:
+            self._write_stats(objects, lambda obj: _format_object(obj, header_fields, newline))
+            return
+        batch_size = self.batch_size
+        buffer = self._buffer
+        for obj in objects:
+            buffer.append(_format_object(obj, header_fields, newline))
+            self.rows_written += 1
+            if len(buffer) >= batch_size:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write buffered lines to the underlying file."""
+        if self.stats is not None:
+            self._flush_stats(self.stats)
+            return
+        if self._buffer:
+            data = "".join(self._buffer)
+            self._buffer.clear()
+            self._file.write(data if self._text else self._encode(data))
+        self._file.flush()
+
+    def _flush_stats(self, stats: EfuStats) -> None:
+        if self._buffer:
+            data: Any = "".join(self._buffer)
+            self._buffer.clear()
+            if not self._text:
+                with stats.phase("encode"):
+                    data = self._encode(data)
+            with stats.phase("write"):
+                self._file.write(data)
+            stats.add("writes")
+            stats.add("bytes_written", len(data))
+        with stats.phase("write"):
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self.flush()
+        finally:
+            if self._owns_file:
+                self._file.close()
+
+    def __enter__(self) -> "EfuWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
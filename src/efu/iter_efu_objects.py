@@ -0,0 +1,110 @@
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .efu_row import make_row_class
+from .efu_stats import EfuStats
+from .iter_efu_rows import iter_efu_rows
+from .open_efu import EfuFile
+
+# Array type codes of the well-known numeric EFU columns.
+NUMERIC_COLUMNS = {
+    "Size": "q",
+    "Date Modified": "Q",
+    "Date Created": "Q",
+    "Attributes": "Q",
+}
+
+
+def _convert_value(value: str) -> Optional[Any]:
+    """Return ``None`` for empty fields and ``int`` for digit-only fields."""
+    if value == "":
+        return None
+    if value.isdigit():
+        return int(value)
+    return value
+
+
+def _convert_numeric(value: str) -> Optional[Any]:
+    """Same result as :func:`_convert_value`, testing the common case first."""
+    if value.isdigit():
+        return int(value)
+    if value == "":
+        return None
+    return value
+
+
+def _compile_plan(header_fields: Iterable[str]) -> List[Callable[[str], Any]]:
+    """Build the per-column converters for ``header_fields`` once."""
+    return [
+        _convert_numeric if name in NUMERIC_COLUMNS else _convert_value
+        for name in header_fields
+    ]
+
+
+def _convert_row(plan: List[Callable[[str], Any]], row: List[str]) -> List[Any]:
+    """Apply ``plan`` to ``row``; missing fields become ``None``."""
+    missing = len(plan) - len(row)
+    if missing > 0:
+        row = row + [""] * missing
+    return [convert(value) for convert, value in zip(plan, row)]
+
+
+def _row_to_object(row: List[str], header_fields: List[str]) -> Dict[str, Any]:
+    obj: Dict[str, Any] = {}
+    for i, header in enumerate(header_fields):
+        obj[header] = _convert_value(row[i]) if i < len(row) else None
+    return obj
+
+
+def _iter_objects(
+    rows: Iterator[List[str]], header_fields: List[str], compact: bool = False
+) -> Iterator[Any]:
+    plan = _compile_plan(header_fields)
+    if compact:
+        row_class = make_row_class(header_fields)
+        for row in rows:
+            yield row_class(_convert_row(plan, row))
+    else:
+        for row in rows:
+            yield dict(zip(header_fields, _convert_row(plan, row)))
+
+
+# Rows converted per timed batch when collecting statistics.
+_STATS_BATCH = 4096
+
+
+def _iter_objects_stats(
+    rows: Iterator[List[str]], header_fields: List[str], compact: bool, stats: EfuStats
+) -> Iterator[Any]:
+    """Instrumented :func:`_iter_objects` timing the ``convert`` phase.
+
+    Rows are pulled in batches before the timer starts, so the time spent
+    parsing them is not counted as conversion.
+    """
+    while True:
+        batch = list(islice(rows, _STATS_BATCH))
+        if not batch:
+            return
+        with stats.phase("convert"):
+            objects = list(_iter_objects(iter(batch), header_fields, compact))
+        yield from objects
+
+
+def iter_efu_objects(
+    file_path: EfuFile,
+    encoding: str = "utf-8",
+    engine: str = "fast",
+    compact: bool = False,
+    stats: Optional[EfuStats] = None,
+) -> Tuple[Iterator[Any], List[str], str]:
+    """Stream an EFU file and return an object iterator, header fields, and newline.
+
+    Objects are dictionaries, or :class:`EfuRow` tuples when ``compact`` is true.
+    ``stats`` also times the conversion of field strings to values.
+    """
+    rows, header_fields, newline = iter_efu_rows(
+        file_path, encoding=encoding, engine=engine, stats=stats
+    )
+    if stats is not None:
+        return _iter_objects_stats(rows, header_fields, compact, stats), header_fields, newline
+    return _iter_objects(rows, header_fields, compact), header_fields, newline
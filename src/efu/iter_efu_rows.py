@@ -0,0 +1,340 @@
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, List, Optional, Tuple
+import codecs
+import gc
+
+from .efu_stats import EfuStats
+from .open_efu import EfuFile, _open_input
+
+# Number of bytes decoded per read while streaming rows.
+_CHUNK_SIZE = 1 << 20
+# First-generation collection threshold while a parse builds its result.
+_GC_THRESHOLD = 1_000_000
+
+
+def _split_line_python(line: str) -> List[str]:
+    """Split one EFU line into fields walking it character by character."""
+    row: List[str] = []
+    field: List[str] = []
+    in_quote = False
+    i = 0
+    length = len(line)
+    while i < length:
+        ch = line[i]
+        if ch == '"':
+            if in_quote and i + 1 < length and line[i + 1] == '"':
+                field.append('"')
+                i += 2
+            else:
+                in_quote = not in_quote
+                i += 1
+        elif ch == ',' and not in_quote:
+            row.append(''.join(field))
+            field = []
+            i += 1
+        else:
+            field.append(ch)
+            i += 1
+    row.append(''.join(field))
+    return row
+
+
+def _split_line_fast(line: str) -> List[str]:
+    """Split one EFU line into fields using ``str.split``.
+
+    Produces exactly the same fields as :func:`_split_line_python`, including
+    for malformed quoting, but only loops in Python over quote-delimited
+    segments rather than over every character.
+    """
+    parts = line.split('"')
+    count = len(parts)
+    if count == 1:
+        return line.split(',')
+    if count == 3 and not parts[0]:
+        # Common EFU shape: a quoted Filename followed by unquoted fields.
+        rest = parts[2]
+        if not rest:
+            return [parts[1]]
+        if rest[0] == ',':
+            row = rest.split(',')
+            row[0] = parts[1]
+            return row
+    row: List[str] = []
+    field: List[str] = []
+    in_quote = False
+    i = 0
+    while i < count:
+        part = parts[i]
+        if in_quote:
+            field.append(part)
+            if i + 2 < count and parts[i + 1] == '':
+                # A doubled quote inside a quoted section is a literal quote.
+                field.append('"')
+                i += 2
+                continue
+            in_quote = False
+        else:
+            pieces = part.split(',')
+            field.append(pieces[0])
+            for piece in pieces[1:]:
+                row.append(''.join(field))
+                field = [piece]
+            in_quote = True
+        i += 1
+    row.append(''.join(field))
+    return row
+
+
+def _count_quoted(line: str) -> int:
+    """Return how many fields of ``line`` are enclosed in quotes.
+
+    Walks the quote-delimited segments like :func:`_split_line_fast`, so
+    doubled quotes and malformed quoting are treated the same way.
+    """
+    if '"' not in line:
+        return 0
+    parts = line.split('"')
+    count = len(parts)
+    quoted = 0
+    in_quote = False
+    i = 0
+    while i < count - 1:
+        part = parts[i]
+        if in_quote:
+            if i + 2 < count and parts[i + 1] == '':
+                i += 2
+                continue
+            in_quote = False
+        else:
+            if (i == 0 and part == '') or part.endswith(','):
+                quoted += 1
+            in_quote = True
+        i += 1
+    return quoted
+
+
+_ENGINES = {
+    "python": _split_line_python,
+    "fast": _split_line_fast,
+}
+
+
+def _get_engine(engine: str) -> Callable[[str], List[str]]:
+    try:
+        return _ENGINES[engine]
+    except KeyError:
+        raise ValueError(
+            f"unknown engine {engine!r}; expected one of {sorted(_ENGINES)}"
+        ) from None
+
+
+@lru_cache(maxsize=None)
+def _ascii_compatible(encoding: str) -> bool:
+    """Return whether ``encoding`` stores ASCII text as single ASCII bytes.
+
+    Only then can line breaks and commas be found in the raw bytes, as the
+    header reader, the parallel parser and :class:`MappedEfu` do. UTF-16
+    and UTF-32 are not; UTF-8, ``utf-8-sig`` and the 8-bit code pages are.
+    """
+    sample = b'\r\n,"Az09'
+    try:
+        return sample.decode(encoding) == sample.decode('ascii')
+    except UnicodeDecodeError:
+        return False
+
+
+# Incremental decoder and the text it produced past the header line.
+_Resume = Tuple[Any, str]
+
+
+def _read_header(f: BinaryIO, encoding: str) -> Tuple[str, int, Optional[_Resume]]:
+    """Read the header line of ``f``, including its line break.
+
+    Returns the decoded line, the number of bytes read and, for encodings
+    that are not ASCII-compatible, where the row reader has to resume:
+    those are decoded before the line break is searched for, so more than
+    the header is read.
+    """
+    if _ascii_compatible(encoding):
+        raw = f.readline()
+        return raw.decode(encoding), len(raw), None
+    decoder = codecs.getincrementaldecoder(encoding)()
+    text = ''
+    size = 0
+    end = -1
+    while end == -1:
+        chunk = f.read(_CHUNK_SIZE)
+        size += len(chunk)
+        text += decoder.decode(chunk, final=not chunk)
+        end = text.find('\n')
+        if not chunk:
+            break
+    end = len(text) if end == -1 else end + 1
+    return text[:end], size, (decoder, text[end:])
+
+
+def _iter_line_batches(
+    f: BinaryIO, newline: str, encoding: str, resume: Optional[_Resume] = None
+) -> Iterator[List[str]]:
+    """Yield lists of complete lines decoded from ``f`` split on ``newline``.
+
+    Lines may be empty; callers are expected to skip them. ``resume``
+    continues from :func:`_read_header`.
+    """
+    if resume is None:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        pending = ''
+    else:
+        decoder, text = resume
+        lines = text.split(newline)
+        pending = lines.pop()
+        yield lines
+    while True:
+        chunk = f.read(_CHUNK_SIZE)
+        text = decoder.decode(chunk, final=not chunk)
+        if text:
+            lines = (pending + text).split(newline)
+            pending = lines.pop()
+            yield lines
+        if not chunk:
+            break
+    if pending:
+        yield [pending]
+
+
+@contextmanager
+def _fewer_collections() -> Iterator[None]:
+    """Raise the collector's first threshold while a parse builds a list of rows.
+
+    Every new row counts towards that threshold, and the collections it
+    triggers traverse the rows built so far, although lists of strings
+    cannot form cycles. Only the threshold is changed, and it is restored
+    afterwards; a threshold of zero (collection disabled) is left alone.
+    """
+    thresholds = gc.get_threshold()
+    if not thresholds[0]:
+        yield
+        return
+    gc.set_threshold(max(thresholds[0], _GC_THRESHOLD), *thresholds[1:])
+    try:
+        yield
+    finally:
+        gc.set_threshold(*thresholds)
+
+
+def _split_lines(split_line: Callable[[str], List[str]], lines: Iterable[str]) -> List[List[str]]:
+    """Split the non-empty ``lines`` of one chunk into rows."""
+    return list(map(split_line, filter(None, lines)))
+
+
+def _iter_rows(
+    f: BinaryIO,
+    newline: str,
+    encoding: str,
+    split_line: Callable[[str], List[str]],
+    close: bool = True,
+    resume: Optional[_Resume] = None,
+) -> Iterator[List[str]]:
+    try:
+        for lines in _iter_line_batches(f, newline, encoding, resume):
+            yield from _split_lines(split_line, lines)
+    finally:
+        if close:
+            f.close()
+
+
+def _iter_rows_stats(
+    f: BinaryIO,
+    newline: str,
+    encoding: str,
+    split_line: Callable[[str], List[str]],
+    close: bool,
+    stats: EfuStats,
+    resume: Optional[_Resume] = None,
+) -> Iterator[List[str]]:
+    """Instrumented :func:`_iter_rows`, timing and counting one chunk at a time."""
+    if resume is None:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        pending = ''
+    else:
+        # Text decoded with the header is counted with the first chunk.
+        decoder, pending = resume
+    phase = stats.phase
+    try:
+        while True:
+            with phase("read"):
+                chunk = f.read(_CHUNK_SIZE)
+            stats.add("reads")
+            stats.add("bytes_read", len(chunk))
+            with phase("decode"):
+                text = decoder.decode(chunk, final=not chunk)
+                lines = []
+                if text or not chunk:
+                    lines = (pending + text).split(newline)
+                    pending = lines.pop()
+                if not chunk and pending:
+                    lines.append(pending)
+            if lines:
+                present = [line for line in lines if line]
+                with phase("split"):
+                    rows = _split_lines(split_line, present)
+                quoted = sum(map(_count_quoted, present))
+                stats.add("rows_read", len(rows))
+                stats.add("rows_skipped", len(lines) - len(present))
+                stats.add("quoted_fields", quoted)
+                stats.add("unquoted_fields", sum(map(len, rows)) - quoted)
+                stats.tick()
+                yield from rows
+            if not chunk:
+                break
+    finally:
+        if close:
+            f.close()
+
+
+def iter_efu_rows(
+    file_path: EfuFile,
+    encoding: str = "utf-8",
+    engine: str = "fast",
+    stats: Optional[EfuStats] = None,
+) -> Tuple[Iterator[List[str]], List[str], str]:
+    """Stream an EFU file and return a row iterator, header fields, and newline.
+
+    The header line is read immediately; data rows are parsed lazily as the
+    returned iterator is consumed, so memory use does not grow with the file.
+    The newline style is taken from the end of the header line, and rows
+    are split on it: in a file with an LF header and CRLF rows the last
+    field of each row keeps its ``'\\r'``.
+
+    Encodings that are not ASCII-compatible, such as UTF-16, are supported;
+    for them the header is found after decoding.
+
+    ``engine`` selects the line splitter: ``"fast"`` (default) or the
+    character-by-character ``"python"`` reference implementation. Both
+    produce identical rows.
+
+    ``file_path`` may end in ``.gz``, ``.bz2`` or ``.xz`` to decompress while
+    parsing, or be a binary file object, which is read from its current
+    position and left open.
+
+    With an :class:`EfuStats` as ``stats``, rows are parsed one chunk at a
+    time while I/O, decoding and splitting are timed and rows, bytes and
+    quoted fields are counted.
+    """
+    split_line = _get_engine(engine)
+    f, close = _open_input(file_path)
+    try:
+        header, size, resume = _read_header(f, encoding)
+    except BaseException:
+        if close:
+            f.close()
+        raise
+    newline = '\r\n' if header.endswith('\r\n') else '\n'
+    header_fields = header.rstrip('\r\n').split(',')
+    if stats is not None:
+        stats.add("reads")
+        stats.add("bytes_read", size)
+        rows = _iter_rows_stats(f, newline, encoding, split_line, close, stats, resume)
+        return rows, header_fields, newline
+    return _iter_rows(f, newline, encoding, split_line, close, resume), header_fields, newline
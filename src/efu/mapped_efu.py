@@ -0,0 +1,140 @@
+from array import array
+from typing import Any, Iterator, List, Optional, Sequence, Union, overload
+import mmap
+
+from .efu_record import EfuRecord
+from .efu_records import EfuRecords
+from .iter_efu_objects import _row_to_object
+from .iter_efu_rows import _ascii_compatible, _get_engine
+from .open_efu import compression_for
+
+
+class MappedEfu(Sequence[List[str]]):
+    """Read-only, lazily parsed view of an EFU file backed by ``mmap``.
+
+    Opening the file only scans for line breaks and records the byte offset
+    of every non-empty data row in an ``array('Q')``. A row is decoded and
+    split into fields when it is accessed.
+    """
+
+    def __init__(self, file_path: str, encoding: str = "utf-8", engine: str = "fast") -> None:
+        if compression_for(file_path) is not None:
+            raise ValueError("compressed EFU files cannot be memory-mapped")
+        if not _ascii_compatible(encoding):
+            raise ValueError(
+                f"{encoding!r} is not ASCII-compatible; EFU files in it cannot be memory-mapped"
+            )
+        self.encoding = encoding
+        self._split_line = _get_engine(engine)
+        self._file = open(file_path, "rb")
+        self._mm: Optional[mmap.mmap] = None
+        try:
+            size = self._file.seek(0, 2)
+            if size:
+                self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._build_index(size)
+        except BaseException:
+            self.close()
+            raise
+
+    def _build_index(self, size: int) -> None:
+        mm = self._mm
+        data = mm if mm is not None else b""
+        header_end = data.find(b"\n")
+        start = size if header_end == -1 else header_end + 1
+        header_raw = data[:start]
+        self.newline = "\r\n" if header_raw.endswith(b"\r\n") else "\n"
+        self.header_fields = header_raw.decode(self.encoding).rstrip("\r\n").split(",")
+
+        nl = self._nl = self.newline.encode(self.encoding)
+        nl_len = len(nl)
+        offsets = array("Q")
+        append = offsets.append
+        find = data.find
+        while start < size:
+            end = find(nl, start)
+            if end == -1:
+                end = size
+            if end > start:
+                append(start)
+            start = end + nl_len
+        self._offsets = offsets
+
+    def _row_at(self, offset: int) -> List[str]:
+        mm = self._mm
+        end = mm.find(self._nl, offset)
+        if end == -1:
+            end = len(mm)
+        return self._split_line(mm[offset:end].decode(self.encoding))
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    @overload
+    def __getitem__(self, index: int) -> List[str]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[List[str]]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self._row_at(offset) for offset in self._offsets[index]]
+        return self._row_at(self._offsets[index])
+
+    def __iter__(self) -> Iterator[List[str]]:
+        for offset in self._offsets:
+            yield self._row_at(offset)
+
+    def records(self) -> "MappedEfuRecords":
+        """Return a lazy :class:`EfuRecord` view over this file."""
+        return MappedEfuRecords(self)
+
+    def close(self) -> None:
+        """Release the memory map and the underlying file."""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def __enter__(self) -> "MappedEfu":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class MappedEfuRecords(Sequence[EfuRecord]):
+    """Lazy, read-only :class:`EfuRecords` counterpart over a :class:`MappedEfu`.
+
+    Records are built on access with the same value conversion as
+    :func:`efu_to_objects`; use :meth:`to_records` to materialize them.
+    """
+
+    def __init__(self, mapped: MappedEfu) -> None:
+        self.mapped = mapped
+
+    def _record(self, row: List[str]) -> EfuRecord:
+        headers = self.mapped.header_fields
+        return EfuRecord(headers, _row_to_object(row, headers))
+
+    def __len__(self) -> int:
+        return len(self.mapped)
+
+    @overload
+    def __getitem__(self, index: int) -> EfuRecord: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> EfuRecords: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return EfuRecords(self._record(row) for row in self.mapped[index])
+        return self._record(self.mapped[index])
+
+    def __iter__(self) -> Iterator[EfuRecord]:
+        for row in self.mapped:
+            yield self._record(row)
+
+    def to_records(self) -> EfuRecords:
+        """Materialize every record into an :class:`EfuRecords` list."""
+        return EfuRecords(self)
@@ -1,28 +1,34 @@
-from typing import Any, Dict, List, Optional
+from itertools import chain
+from typing import Any, Iterable, Mapping, Optional
 
-from .array_to_efu import array_to_efu
+from .efu_stats import EfuStats
+from .efu_writer import EfuWriter
+from .open_efu import EfuFile
 
 
 def objects_to_efu(
-    objects: List[Dict[str, Any]],
-    file_path: str,
+    objects: Iterable[Mapping[str, Any]],
+    file_path: EfuFile,
     newline: Optional[str] = None,
     encoding: str = "utf-8",
+    headers: Optional[Iterable[str]] = None,
+    stats: Optional[EfuStats] = None,
 ) -> None:
-    """Serialize a list of dictionaries to an EFU CSV file."""
-    if not objects:
-        raise ValueError("objects list must not be empty")
+    """Serialize dictionaries or :class:`EfuRecord` objects to an EFU CSV file.
 
-    header_fields = list(objects[0].keys())
-    rows: List[List[str]] = []
-    for obj in objects:
-        row: List[str] = []
-        for key in header_fields:
-            value = obj.get(key)
-            if value is None:
-                row.append("")
-            else:
-                row.append(str(value))
-        rows.append(row)
+    ``objects`` may be any iterable, including a generator; rows are written
+    as they are produced. Header fields default to the keys of the first
+    object unless ``headers`` is given, in which case ``objects`` may be empty.
+    ``stats`` collects counters and phase timings, see :class:`EfuStats`.
+    """
+    iterator = iter(objects)
+    if headers is None:
+        first = next(iterator, None)
+        if first is None:
+            raise ValueError("objects list must not be empty")
+        headers = list(first.keys())
+        iterator = chain([first], iterator)
 
-    array_to_efu(rows, header_fields, file_path, newline=newline, encoding=encoding)
+    with EfuWriter(file_path, newline=newline, encoding=encoding, stats=stats) as writer:
+        writer.write_header(headers)
+        writer.write_objects(iterator)
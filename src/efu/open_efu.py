@@ -0,0 +1,57 @@
+from typing import IO, Any, BinaryIO, Callable, Dict, Optional, Tuple, Union
+import bz2
+import gzip
+import io
+import lzma
+import os
+
+# Paths, or already open file objects (binary for reading).
+EfuFile = Union[str, "os.PathLike[str]", IO[Any]]
+
+_OPENERS: Dict[str, Callable[..., Any]] = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+    ".lzma": lzma.open,
+}
+
+
+def compression_for(file_path: Union[str, "os.PathLike[str]"]) -> Optional[str]:
+    """Return the compression suffix of ``file_path`` (``".gz"`` etc.) or ``None``."""
+    suffix = os.path.splitext(os.fspath(file_path))[1].lower()
+    return suffix if suffix in _OPENERS else None
+
+
+def open_efu(file_path: Union[str, "os.PathLike[str]"], mode: str = "rb") -> BinaryIO:
+    """Open ``file_path`` in binary ``mode``, decompressing by extension.
+
+    ``.gz``, ``.bz2`` and ``.xz``/``.lzma`` files are opened with the
+    matching standard library module, so data is (de)compressed while it
+    streams; any other path is opened as is.
+    """
+    if mode not in ("rb", "wb"):
+        raise ValueError(f"invalid mode: {mode!r}")
+    suffix = compression_for(file_path)
+    opener = _OPENERS[suffix] if suffix is not None else open
+    return opener(file_path, mode)
+
+
+def _is_plain_path(file: Any) -> bool:
+    """Return whether ``file`` names an uncompressed file that can be seeked and mapped."""
+    return isinstance(file, (str, os.PathLike)) and compression_for(file) is None
+
+
+def _open_input(file: EfuFile) -> Tuple[BinaryIO, bool]:
+    """Return a binary stream for ``file`` and whether the caller should close it."""
+    if isinstance(file, (str, os.PathLike)):
+        return open_efu(file, "rb"), True
+    if isinstance(file, io.TextIOBase):
+        raise TypeError("EFU input streams must be opened in binary mode")
+    return file, False  # type: ignore[return-value]
+
+
+def _open_output(file: EfuFile) -> Tuple[IO[Any], bool]:
+    """Return a binary or text stream for ``file`` and whether the caller should close it."""
+    if isinstance(file, (str, os.PathLike)):
+        return open_efu(file, "wb"), True
+    return file, False
@@ -0,0 +1,72 @@
+from array import array
+from typing import Any, Iterable, Iterator, Sequence, Union, overload
+
+
+class PackedStrings(Sequence[str]):
+    """Append-only sequence of strings stored in one UTF-8 buffer.
+
+    Each string costs its encoded length plus one 8-byte end offset instead
+    of a full Python ``str`` object.
+    """
+
+    __slots__ = ("_data", "_offsets")
+
+    def __init__(self, values: Iterable[str] = ()) -> None:
+        self._data = bytearray()
+        self._offsets = array("Q", [0])
+        self.extend(values)
+
+    @classmethod
+    def _from_buffers(cls, data: Any, offsets: Any) -> "PackedStrings":
+        """Wrap existing buffers without copying.
+
+        ``data`` can be any buffer whose slices are ``bytes``, such as an
+        ``mmap``; ``offsets`` must start with 0 and hold one end offset per
+        string. The result is read-only unless both buffers support the
+        ``bytearray``/``array`` operations used by :meth:`append`.
+        """
+        strings = cls.__new__(cls)
+        strings._data = data
+        strings._offsets = offsets
+        return strings
+
+    def append(self, value: str) -> None:
+        self._data += value.encode("utf-8")
+        self._offsets.append(len(self._data))
+
+    def extend(self, values: Iterable[str]) -> None:
+        for value in values:
+            self.append(value)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def _get(self, index: int) -> str:
+        offsets = self._offsets
+        return self._data[offsets[index]:offsets[index + 1]].decode("utf-8")
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[str]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self)))]
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("PackedStrings index out of range")
+        return self._get(index)
+
+    def __iter__(self) -> Iterator[str]:
+        data = self._data
+        offsets = self._offsets
+        for i in range(len(offsets) - 1):
+            yield data[offsets[i]:offsets[i + 1]].decode("utf-8")
+
+    def nbytes(self) -> int:
+        """Return the number of bytes used by the buffer and offsets."""
+        return len(self._data) + self._offsets.itemsize * len(self._offsets)
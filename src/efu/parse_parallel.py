@@ -0,0 +1,118 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, BinaryIO, List, Optional, Tuple
+
+from .efu_row import make_row_class
+from .iter_efu_objects import _compile_plan, _convert_row
+from .iter_efu_rows import _ascii_compatible, _get_engine, _split_lines
+from .open_efu import EfuFile, _is_plain_path
+
+# Files are cut into ranges of about this many bytes so that work is spread
+# evenly and no single worker has to hold a huge slice in memory.
+_RANGE_SIZE = 16 << 20
+
+
+def _next_row_start(f: BinaryIO, pos: int, nl: bytes, size: int) -> int:
+    """Return the offset just past the first ``nl`` ending at or after ``pos``."""
+    # Step back so a newline sequence straddling ``pos`` is still found.
+    offset = max(pos - len(nl) + 1, 0)
+    f.seek(offset)
+    tail = b""
+    while offset < size:
+        block = f.read(1 << 16)
+        if not block:
+            break
+        data = tail + block
+        idx = data.find(nl)
+        if idx != -1:
+            return offset - len(tail) + idx + len(nl)
+        tail = data[-(len(nl) - 1):] if len(nl) > 1 else b""
+        offset += len(block)
+    return size
+
+
+def _split_ranges(
+    f: BinaryIO, start: int, size: int, parts: int, nl: bytes
+) -> List[Tuple[int, int]]:
+    """Cut ``[start, size)`` into about ``parts`` ranges ending on row boundaries.
+
+    Rows never contain the newline sequence (quoted fields cannot span
+    lines), so every newline is a safe cut point.
+    """
+    bounds = [start]
+    for k in range(1, parts):
+        target = start + (size - start) * k // parts
+        if target <= bounds[-1]:
+            continue
+        cut = _next_row_start(f, target, nl, size)
+        if cut >= size:
+            break
+        if cut > bounds[-1]:
+            bounds.append(cut)
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _parse_range(
+    args: Tuple[str, int, int, str, str, str, Optional[List[str]]]
+) -> List[Any]:
+    file_path, start, end, newline, encoding, engine, header_fields = args
+    split_line = _get_engine(engine)
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode(encoding)
+    rows = _split_lines(split_line, text.split(newline))
+    if header_fields is None:
+        return rows
+    plan = _compile_plan(header_fields)
+    return [_convert_row(plan, row) for row in rows]
+
+
+def _can_parse_parallel(file_path: EfuFile, encoding: str) -> bool:
+    """Return whether ``file_path`` can be cut into byte ranges at line breaks.
+
+    Compressed files and file objects cannot, nor can text in an encoding
+    that is not ASCII-compatible, whose line breaks are not single bytes.
+    """
+    return _is_plain_path(file_path) and _ascii_compatible(encoding)
+
+
+def _parse_parallel(
+    file_path: str,
+    encoding: str,
+    engine: str,
+    workers: int,
+    objects: bool = False,
+    compact: bool = False,
+) -> Tuple[List[Any], List[str], str]:
+    """Parse ``file_path`` in a process pool and return rows in file order.
+
+    When ``objects`` is true the workers also convert the values as
+    :func:`efu_to_objects` does, and the results are returned as
+    dictionaries or, with ``compact``, as :class:`EfuRow` tuples.
+    """
+    _get_engine(engine)
+    with open(file_path, "rb") as f:
+        header_raw = f.readline()
+        start = f.tell()
+        size = f.seek(0, 2)
+        newline = "\r\n" if header_raw.endswith(b"\r\n") else "\n"
+        header_fields = header_raw.decode(encoding).rstrip("\r\n").split(",")
+        parts = max(workers, -(-(size - start) // _RANGE_SIZE))
+        ranges = _split_ranges(f, start, size, parts, newline.encode(encoding))
+
+    tasks = [
+        (file_path, lo, hi, newline, encoding, engine, header_fields if objects else None)
+        for lo, hi in ranges
+        if hi > lo
+    ]
+    results: List[Any] = []
+    row_class = make_row_class(header_fields) if compact else None
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in executor.map(_parse_range, tasks):
+            if not objects:
+                results.extend(chunk)
+            elif row_class is not None:
+                results.extend(map(row_class, chunk))
+            else:
+                results.extend(dict(zip(header_fields, values)) for values in chunk)
+    return results, header_fields, newline
@@ -0,0 +1,102 @@
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple, Union, overload
+
+from .packed_strings import PackedStrings
+
+
+def _last_separator(path: str, end: int) -> int:
+    """Return the index of the last ``\\`` or ``/`` before ``end`` or ``-1``."""
+    return max(path.rfind("\\", 0, end), path.rfind("/", 0, end))
+
+
+class PathStore(Sequence[str]):
+    """Prefix-compressed, append-only sequence of file paths.
+
+    Every directory prefix is interned once as a ``(parent id, segment)``
+    node, where a segment keeps its trailing separator so Windows ``\\``,
+    POSIX ``/`` and mixed paths are rebuilt exactly. Each stored path is a
+    directory node id plus a basename kept in a :class:`PackedStrings`
+    buffer. Full paths are reassembled on access.
+    """
+
+    def __init__(self, paths: Iterable[str] = ()) -> None:
+        self._node_parent = array("l")
+        self._node_names: List[str] = []
+        self._node_ids: Dict[Tuple[int, str], int] = {}
+        self._entry_dir = array("l")
+        self._entry_names = PackedStrings()
+        self._last_prefix = ""
+        self._last_node = -1
+        self.extend(paths)
+
+    def _intern(self, prefix: str) -> int:
+        """Return the node id for ``prefix``, which ends with a separator."""
+        if prefix == self._last_prefix:
+            return self._last_node
+        cut = _last_separator(prefix, len(prefix) - 1)
+        parent = self._intern(prefix[:cut + 1]) if cut != -1 else -1
+        key = (parent, prefix[cut + 1:])
+        node = self._node_ids.get(key)
+        if node is None:
+            node = len(self._node_names)
+            self._node_ids[key] = node
+            self._node_parent.append(parent)
+            self._node_names.append(key[1])
+        return node
+
+    def append(self, path: str) -> None:
+        cut = _last_separator(path, len(path))
+        if cut == -1:
+            node = -1
+        else:
+            prefix = path[:cut + 1]
+            node = self._intern(prefix)
+            self._last_prefix = prefix
+            self._last_node = node
+        self._entry_dir.append(node)
+        self._entry_names.append(path[cut + 1:])
+
+    def extend(self, paths: Iterable[str]) -> None:
+        for path in paths:
+            self.append(path)
+
+    def directory(self, node: int) -> str:
+        """Return the full prefix, including trailing separator, of ``node``."""
+        parts: List[str] = []
+        parent = self._node_parent
+        names = self._node_names
+        while node != -1:
+            parts.append(names[node])
+            node = parent[node]
+        return "".join(reversed(parts))
+
+    def __len__(self) -> int:
+        return len(self._entry_dir)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[str]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        node = self._entry_dir[index]
+        name = self._entry_names[index]
+        return name if node == -1 else self.directory(node) + name
+
+    def __iter__(self) -> Iterator[str]:
+        cached_node = -1
+        cached_prefix = ""
+        names = self._entry_names
+        for i, node in enumerate(self._entry_dir):
+            if node != cached_node:
+                cached_node = node
+                cached_prefix = self.directory(node)
+            yield cached_prefix + names[i]
+
+    @property
+    def directory_count(self) -> int:
+        """Number of distinct directory prefixes interned so far."""
+        return len(self._node_names)
@@ -0,0 +1,246 @@
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+import fnmatch
+import re
+
+from .efu_record import FILETIME_EPOCH
+from .efu_stats import EfuStats
+from .efu_writer import EfuWriter
+from .iter_efu_objects import _iter_objects
+from .iter_efu_rows import iter_efu_rows
+
+# Attribute letters shown by Everything, see docs/attribute-flags.md.
+ATTRIBUTE_LETTERS = {"R": 1, "H": 2, "S": 4, "D": 16, "A": 32, "N": 128}
+
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+Test = Callable[[str], bool]
+
+
+def datetime_to_filetime(value: datetime) -> int:
+    """Convert ``value`` to a Windows FILETIME; naive values are taken as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - _UNIX_EPOCH
+    ticks = (delta.days * 86400 + delta.seconds) * 10_000_000 + delta.microseconds * 10
+    return ticks + FILETIME_EPOCH
+
+
+def parse_attributes(value: Union[int, str]) -> int:
+    """Return the attribute bitmask for an ``int`` or letters such as ``"HA"``."""
+    if isinstance(value, int):
+        return value
+    mask = 0
+    for letter in value.upper():
+        try:
+            mask |= ATTRIBUTE_LETTERS[letter]
+        except KeyError:
+            raise ValueError(f"unknown attribute letter: {letter!r}") from None
+    return mask
+
+
+def _filetime(value: Union[int, datetime, None]) -> Optional[int]:
+    return datetime_to_filetime(value) if isinstance(value, datetime) else value
+
+
+def _int_range(low: Optional[int], high: Optional[int]) -> Test:
+    def test(text: str) -> bool:
+        if not text.isdigit():
+            return False
+        value = int(text)
+        return (low is None or value >= low) and (high is None or value <= high)
+
+    return test
+
+
+def _bitmask(required: int, excluded: int) -> Test:
+    def test(text: str) -> bool:
+        if not text.isdigit():
+            return False
+        value = int(text)
+        return value & required == required and not value & excluded
+
+    return test
+
+
+def _prefix(prefix: str, case_sensitive: bool) -> Test:
+    if case_sensitive:
+        return lambda text: text.startswith(prefix)
+    folded = prefix.casefold()
+    return lambda text: text.casefold().startswith(folded)
+
+
+class EfuQuery:
+    """Row filter on Size, dates, Attributes and Filename.
+
+    All given conditions must hold. Size and date bounds are inclusive and
+    dates are FILETIME integers or :class:`datetime` objects (naive ones are
+    UTC). ``attributes`` lists bits that must all be set and
+    ``not_attributes`` bits that must all be clear, either as an ``int`` or
+    as letters from ``RHSDAN``. Filename conditions are a ``prefix``, an
+    :mod:`fnmatch` ``glob`` matched against the full path (``*`` also
+    matches separators) and a ``regex`` searched anywhere in the path; they
+    ignore case unless ``case_sensitive`` is true.
+
+    Rows with an empty or non-numeric value in a filtered numeric column do
+    not match.
+    """
+
+    def __init__(
+        self,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        min_modified: Union[int, datetime, None] = None,
+        max_modified: Union[int, datetime, None] = None,
+        min_created: Union[int, datetime, None] = None,
+        max_created: Union[int, datetime, None] = None,
+        attributes: Union[int, str] = 0,
+        not_attributes: Union[int, str] = 0,
+        prefix: Optional[str] = None,
+        glob: Optional[str] = None,
+        regex: Optional[str] = None,
+        case_sensitive: bool = False,
+    ) -> None:
+        self.min_size = min_size
+        self.max_size = max_size
+        self.min_modified = _filetime(min_modified)
+        self.max_modified = _filetime(max_modified)
+        self.min_created = _filetime(min_created)
+        self.max_created = _filetime(max_created)
+        self.attributes = parse_attributes(attributes)
+        self.not_attributes = parse_attributes(not_attributes)
+        self.prefix = prefix
+        self.glob = glob
+        self.regex = regex
+        self.case_sensitive = case_sensitive
+
+    def _tests(self) -> List[Tuple[str, Test]]:
+        """Return ``(column, test)`` pairs, cheapest first."""
+        tests: List[Tuple[str, Test]] = []
+        if self.min_size is not None or self.max_size is not None:
+            tests.append(("Size", _int_range(self.min_size, self.max_size)))
+        if self.attributes or self.not_attributes:
+            tests.append(("Attributes", _bitmask(self.attributes, self.not_attributes)))
+        if self.min_modified is not None or self.max_modified is not None:
+            tests.append(("Date Modified", _int_range(self.min_modified, self.max_modified)))
+        if self.min_created is not None or self.max_created is not None:
+            tests.append(("Date Created", _int_range(self.min_created, self.max_created)))
+        flags = 0 if self.case_sensitive else re.IGNORECASE
+        if self.prefix is not None:
+            tests.append(("Filename", _prefix(self.prefix, self.case_sensitive)))
+        if self.glob is not None:
+            pattern = re.compile(fnmatch.translate(self.glob), flags)
+            tests.append(("Filename", lambda text: pattern.match(text) is not None))
+        if self.regex is not None:
+            regex = re.compile(self.regex, flags)
+            tests.append(("Filename", lambda text: regex.search(text) is not None))
+        return tests
+
+    def compile(self, header_fields: Sequence[str]) -> Callable[[Sequence[str]], bool]:
+        """Return a predicate over parsed string rows with ``header_fields``.
+
+        Only the columns the query refers to are looked at, and evaluation
+        stops at the first failing condition. Raises ``ValueError`` if a
+        needed column is missing.
+        """
+        fields = list(header_fields)
+        checks: List[Tuple[int, Test]] = []
+        for name, test in self._tests():
+            if name not in fields:
+                raise ValueError(f"query needs the {name!r} column")
+            checks.append((fields.index(name), test))
+
+        def match(row: Sequence[str]) -> bool:
+            count = len(row)
+            for index, test in checks:
+                if not test(row[index] if index < count else ""):
+                    return False
+            return True
+
+        return match
+
+    def filter_rows(
+        self, rows: Iterable[Sequence[str]], header_fields: Sequence[str]
+    ) -> Iterator[Sequence[str]]:
+        """Yield the rows that match."""
+        return filter(self.compile(header_fields), rows)
+
+
+def _projection(
+    header_fields: List[str], columns: Optional[Iterable[str]]
+) -> Tuple[List[str], Optional[Callable[[Sequence[str]], List[str]]]]:
+    if columns is None:
+        return header_fields, None
+    selected = list(columns)
+    missing = [name for name in selected if name not in header_fields]
+    if missing:
+        raise ValueError(f"unknown columns: {', '.join(missing)}")
+    positions = [header_fields.index(name) for name in selected]
+
+    def project(row: Sequence[str]) -> List[str]:
+        count = len(row)
+        return [row[i] if i < count else "" for i in positions]
+
+    return selected, project
+
+
+def query_efu(
+    file_path: str,
+    query: EfuQuery,
+    columns: Optional[Iterable[str]] = None,
+    objects: bool = False,
+    encoding: str = "utf-8",
+    engine: str = "fast",
+    stats: Optional[EfuStats] = None,
+) -> Tuple[Iterator[Any], List[str], str]:
+    """Stream the rows of ``file_path`` that match ``query``.
+
+    Returns an iterator, the output header fields and the newline, like
+    :func:`iter_efu_rows`. ``columns`` restricts the output to those
+    columns, in that order. Rows are rejected on their raw field strings;
+    with ``objects`` only the matching rows are converted to dictionaries.
+    ``stats`` collects parse counters and timings, see :class:`EfuStats`.
+    """
+    rows, header_fields, newline = iter_efu_rows(
+        file_path, encoding=encoding, engine=engine, stats=stats
+    )
+    try:
+        match = query.compile(header_fields)
+        out_fields, project = _projection(header_fields, columns)
+    except ValueError:
+        rows.close()  # type: ignore[attr-defined]
+        raise
+    matches: Iterator[Any] = filter(match, rows)
+    if project is not None:
+        matches = map(project, matches)
+    if objects:
+        matches = _iter_objects(matches, out_fields)
+    return matches, out_fields, newline
+
+
+def filter_efu(
+    file_path: str,
+    out_path: str,
+    query: EfuQuery,
+    columns: Optional[Iterable[str]] = None,
+    newline: Optional[str] = None,
+    encoding: str = "utf-8",
+    engine: str = "fast",
+    stats: Optional[EfuStats] = None,
+) -> int:
+    """Write the rows of ``file_path`` matching ``query`` to ``out_path``.
+
+    Matching rows are written as they are found, keeping their field text
+    and, unless ``newline`` is given, the input's newline style. Returns the
+    number of rows written. ``stats`` collects parse and write counters and
+    timings.
+    """
+    rows, header_fields, file_newline = query_efu(
+        file_path, query, columns=columns, encoding=encoding, engine=engine, stats=stats
+    )
+    with EfuWriter(
+        out_path, newline=newline or file_newline, encoding=encoding, stats=stats
+    ) as writer:
+        writer.write_header(header_fields)
+        writer.write_rows(rows)
+        return writer.rows_written
@@ -0,0 +1,178 @@
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
+import os
+import stat
+import time
+
+from .efu_record import DEFAULT_HEADERS, EfuRecord, _fill_from_stat, _to_filetime
+from .efu_records import EfuRecords
+from .iter_efu_objects import iter_efu_objects
+from .scan_directory import _attributes, _list_directory
+
+
+def _load_previous(
+    previous: Union[str, Iterable[Mapping[str, Any]]], encoding: str
+) -> List[Any]:
+    if isinstance(previous, str):
+        objects, header_fields, _ = iter_efu_objects(previous, encoding=encoding)
+        return [EfuRecord(header_fields, obj) for obj in objects]
+    return [
+        record if hasattr(record, "last_seen") else EfuRecord(record.keys(), record)
+        for record in previous
+    ]
+
+
+def _is_directory(record: Mapping[str, Any]) -> Optional[bool]:
+    """Return whether ``record`` is a directory, or ``None`` if unknown."""
+    attributes = record.get("Attributes")
+    if not isinstance(attributes, int):
+        return None
+    return bool(attributes & 16)
+
+
+def _under(path: str, root: str) -> bool:
+    return path == root or path.startswith(root.rstrip(os.sep) + os.sep)
+
+
+def _is_lost(record: Any) -> bool:
+    """Return whether ``record`` was marked lost and not seen since."""
+    last_lost = record.last_lost
+    return last_lost is not None and (record.last_seen is None or last_lost >= record.last_seen)
+
+
+class _Rescan:
+    """State of one :func:`rescan_directory` run."""
+
+    def __init__(self, records: List[Any], dir_path: str, headers: List[str]) -> None:
+        self.headers = headers
+        self.now = int(time.time())
+        self.result = EfuRecords()
+        self.visited: Set[str] = set()
+        self.by_path: Dict[str, Any] = {}
+        self.children: Dict[str, List[str]] = {}
+        self.outside: List[Any] = []
+        for record in records:
+            path = record.get("Filename")
+            if isinstance(path, str) and _under(path, dir_path):
+                self.by_path[path] = record
+                if path != dir_path:
+                    self.children.setdefault(os.path.dirname(path), []).append(path)
+            else:
+                self.outside.append(record)
+
+    def keep(self, path: str, record: Any) -> None:
+        """Add ``record`` to the result as seen in this scan."""
+        if record.first_seen is None:
+            record.first_seen = self.now
+        record.last_seen = self.now
+        self.result.append(record)
+        self.visited.add(path)
+
+    def visit(self, path: str, st: os.stat_result) -> None:
+        record = self.by_path.get(path)
+        if record is None:
+            record = EfuRecord(self.headers)
+        _fill_from_stat(record, path, st, _attributes(st))
+        self.keep(path, record)
+
+    def unchanged(self, path: str, st: os.stat_result) -> bool:
+        """Return whether directory ``path`` has the entries of the previous scan."""
+        old = self.by_path.get(path)
+        return (
+            old is not None
+            and old.get("Date Modified") == _to_filetime(st.st_mtime)
+            and _is_directory(old) is not False
+        )
+
+    def carry_over(self, path: str) -> List[Tuple[str, os.stat_result]]:
+        """Keep the previous entries of unchanged directory ``path``.
+
+        Files are carried over without a ``stat``; records already lost stay
+        lost. Returns the subdirectories to descend into.
+        """
+        subdirs: List[Tuple[str, os.stat_result]] = []
+        for child_path in self.children.get(path, ()):
+            child = self.by_path[child_path]
+            if _is_lost(child):
+                continue
+            if _is_directory(child) is False:
+                self.keep(child_path, child)
+                continue
+            try:
+                child_stat = os.stat(child_path)
+            except OSError:
+                continue
+            if stat.S_ISDIR(child_stat.st_mode):
+                subdirs.append((child_path, child_stat))
+            else:
+                self.visit(child_path, child_stat)
+        return subdirs
+
+    def mark_lost(self) -> None:
+        """Append the records not seen in this scan, marking them lost."""
+        for path, record in self.by_path.items():
+            if path in self.visited:
+                continue
+            if not _is_lost(record):
+                record.last_lost = self.now
+            self.result.append(record)
+
+
+def rescan_directory(
+    previous: Union[str, Iterable[Mapping[str, Any]]],
+    dir_path: str,
+    headers: Optional[Iterable[str]] = None,
+    encoding: str = "utf-8",
+) -> EfuRecords:
+    """Incrementally refresh a previous scan of ``dir_path``.
+
+    ``previous`` is an :class:`EfuRecords` collection, any iterable of
+    record mappings, or the path of an EFU file. A new :class:`EfuRecords`
+    is returned; records passed in are reused and updated, but ``previous``
+    itself is not modified.
+
+    A directory whose Date Modified is unchanged since the previous scan
+    still has the same entries, so its files are not listed or stat-ed
+    again: their records are carried over and only ``last_seen`` is
+    refreshed. Its subdirectories are still stat-ed to decide whether to
+    descend. Note that a file whose content changed without any entry of
+    its directory being added, removed or renamed keeps its previous Size
+    and dates until its directory changes.
+
+    Surviving entries get ``last_seen`` set to the scan time, new entries
+    also get ``first_seen``, and vanished entries get ``last_lost`` (they are
+    kept at the end of the result and stay lost in later rescans). Records
+    outside ``dir_path`` are passed through unchanged.
+    """
+    records = _load_previous(previous, encoding)
+    if headers is None:
+        headers = list(records[0].keys()) if records else list(DEFAULT_HEADERS)
+    else:
+        headers = list(headers)
+    scan = _Rescan(records, dir_path, headers)
+
+    try:
+        root_stat = os.stat(dir_path)
+    except OSError:
+        root_stat = None
+    stack: List[Tuple[str, os.stat_result]] = []
+    if root_stat is not None and stat.S_ISDIR(root_stat.st_mode):
+        stack.append((dir_path, root_stat))
+
+    while stack:
+        path, st = stack.pop()
+        unchanged = scan.unchanged(path, st)
+        scan.visit(path, st)
+        if unchanged:
+            subdirs = scan.carry_over(path)
+        else:
+            try:
+                files, subdirs, _ = _list_directory(path)
+            except OSError:
+                continue
+            for file_path, file_stat in files:
+                scan.visit(file_path, file_stat)
+        stack.extend(reversed(subdirs))
+
+    scan.mark_lost()
+    scan.result.extend(scan.outside)
+    return scan.result
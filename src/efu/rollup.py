@@ -0,0 +1,183 @@
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+import re
+import struct
+import tempfile
+
+from .efu_writer import EfuWriter
+from .iter_efu_rows import iter_efu_rows
+
+# Spilled per-folder totals: size, file count, latest Date Modified (0 = none).
+_TOTALS = struct.Struct("<QQQ")
+_SEPARATOR = re.compile(r"[\\/]")
+
+
+class FolderTotals(NamedTuple):
+    """Recursive totals of one folder."""
+
+    path: str
+    size: int
+    files: int
+    date_modified: Optional[int]
+
+
+def _number(text: str) -> int:
+    return int(text) if text.isascii() and text.isdigit() else 0
+
+
+def _columns(header_fields: Sequence[str]) -> Tuple[int, int, Optional[int], Optional[int]]:
+    fields = list(header_fields)
+    if "Filename" not in fields or "Attributes" not in fields:
+        raise ValueError("folder rollup needs the Filename and Attributes columns")
+    size = fields.index("Size") if "Size" in fields else None
+    date = fields.index("Date Modified") if "Date Modified" in fields else None
+    return fields.index("Filename"), fields.index("Attributes"), size, date
+
+
+def _field(row: Sequence[str], column: Optional[int]) -> str:
+    return row[column] if column is not None and column < len(row) else ""
+
+
+def _is_folder(row: Sequence[str], attributes: int) -> bool:
+    return bool(_number(_field(row, attributes)) & 16)
+
+
+def _is_inside(path: str, folder: str) -> bool:
+    if not path.startswith(folder) or len(path) == len(folder):
+        return False
+    return folder[-1] in "\\/" or path[len(folder)] in "\\/"
+
+
+def _check_open(path: str, start: int, closed: Set[str]) -> None:
+    """Raise ``ValueError`` if a folder in ``closed`` encloses ``path``.
+
+    Only the prefixes of ``path`` ending at a separator at or after
+    ``start`` are looked up.
+    """
+    if not closed:
+        return
+    for match in _SEPARATOR.finditer(path, start):
+        folder = path[:match.start()]
+        if folder in closed:
+            raise ValueError(
+                f"{path!r} comes after the subtree of {folder!r} ended; "
+                "rows must be in path order; sort them with sort_efu(..., key='path')"
+            )
+
+
+def _iter_totals(
+    rows: Iterable[Sequence[str]], header_fields: Sequence[str]
+) -> Iterator[Tuple[int, FolderTotals]]:
+    """Yield ``(folder sequence number, totals)`` as each folder is closed.
+
+    Folders are numbered in the order their rows appear. Raises
+    ``ValueError`` for a row inside a folder whose subtree already ended.
+    """
+    name_col, attr_col, size_col, date_col = _columns(header_fields)
+    # [path, sequence number, size, files, latest Date Modified,
+    #  closed subfolders]
+    stack: List[List[object]] = []
+    # Closed folders outside every open folder, looked up through ``root``.
+    closed_top: Set[str] = set()
+    root: List[object] = ["", -1, 0, 0, 0, closed_top]
+    count = 0
+
+    def close() -> Tuple[int, FolderTotals]:
+        path, seq, size, files, latest, _ = stack.pop()
+        if stack:
+            parent = stack[-1]
+            parent[2] += size  # type: ignore[operator]
+            parent[3] += files  # type: ignore[operator]
+            if latest > parent[4]:  # type: ignore[operator]
+                parent[4] = latest
+            parent[5].add(path)  # type: ignore[attr-defined]
+        else:
+            closed_top.add(path)  # type: ignore[arg-type]
+        return seq, FolderTotals(path, size, files, latest or None)  # type: ignore[arg-type]
+
+    for row in rows:
+        path = row[name_col]
+        while stack and not _is_inside(path, stack[-1][0]):  # type: ignore[arg-type]
+            yield close()
+        top = stack[-1] if stack else root
+        _check_open(path, len(top[0]) + 1, top[5])  # type: ignore[arg-type]
+        date = _number(_field(row, date_col))
+        if _is_folder(row, attr_col):
+            stack.append([path, count, 0, 0, date, set()])
+            count += 1
+        elif stack:
+            top = stack[-1]
+            top[2] += _number(_field(row, size_col))  # type: ignore[operator]
+            top[3] += 1  # type: ignore[operator]
+            if date > top[4]:  # type: ignore[operator]
+                top[4] = date
+    while stack:
+        yield close()
+
+
+def iter_folder_totals(
+    rows: Iterable[Sequence[str]], header_fields: Sequence[str]
+) -> Iterator[FolderTotals]:
+    """Compute recursive size, file count and latest Date Modified per folder.
+
+    ``rows`` are parsed string rows, for example from :func:`iter_efu_rows`,
+    in path order: every folder comes before its contents and each subtree
+    is contiguous, as in Everything exports and :func:`scan_directory`
+    output. Folders are those with the directory bit (16) in Attributes.
+    Only the folders enclosing the current row and the names of their
+    finished subfolders are kept in memory, and each folder's totals are
+    yielded as soon as its subtree ends. A row that turns up after the
+    subtree of its folder ended raises ``ValueError``. Plain string order,
+    the default of :func:`sort_efu`, is not path order because ``-`` sorts
+    before ``\\``; sort other input with ``sort_efu(..., key="path")``.
+
+    The latest Date Modified includes the folder's own value; it is ``None``
+    if no entry in the subtree has one.
+    """
+    for _, totals in _iter_totals(rows, header_fields):
+        yield totals
+
+
+def rollup_efu(
+    file_path: str,
+    out_path: str,
+    encoding: str = "utf-8",
+    engine: str = "fast",
+    overwrite: bool = False,
+) -> int:
+    """Write ``file_path`` to ``out_path`` with recursive folder sizes filled in.
+
+    Only the Size of folder rows changes, and only where it is empty unless
+    ``overwrite`` is true; every other field and the newline style are kept
+    byte for byte. The file is read twice: the first pass spills the totals
+    of each folder to a fixed-width temporary file, the second reads them
+    back in order while writing. Returns the number of folders filled.
+    """
+    rows, header_fields, newline = iter_efu_rows(file_path, encoding=encoding, engine=engine)
+    _, attr_col, size_col, _ = _columns(header_fields)
+    if size_col is None:
+        rows.close()  # type: ignore[attr-defined]
+        raise ValueError("folder rollup needs the Size column")
+
+    filled = 0
+    with tempfile.TemporaryFile() as spill:
+        try:
+            for seq, totals in _iter_totals(rows, header_fields):
+                spill.seek(seq * _TOTALS.size)
+                spill.write(_TOTALS.pack(totals.size, totals.files, totals.date_modified or 0))
+        finally:
+            rows.close()  # type: ignore[attr-defined]
+        spill.seek(0)
+
+        rows, _, _ = iter_efu_rows(file_path, encoding=encoding, engine=engine)
+        with EfuWriter(out_path, newline=newline, encoding=encoding) as writer:
+            writer.write_header(header_fields)
+            for row in rows:
+                if _is_folder(row, attr_col):
+                    size, _, _ = _TOTALS.unpack(spill.read(_TOTALS.size))
+                    if overwrite or _field(row, size_col) == "":
+                        row = list(row)
+                        row.extend([""] * (size_col + 1 - len(row)))
+                        row[size_col] = str(size)
+                        filled += 1
+                writer.write_row(row)
+    return filled
@@ -0,0 +1,146 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+import os
+import time
+
+from .compact_efu_record import CompactEfuRecord, EfuSchema
+from .efu_record import EfuRecord, _attributes, _fill_from_stat
+from .efu_stats import EfuStats
+
+# (path, stat result, scan timestamp) for one directory entry.
+ScanEntry = Tuple[str, os.stat_result, int]
+_Listing = Tuple[List[Tuple[str, os.stat_result]], List[Tuple[str, os.stat_result]], int]
+
+
+def _list_directory(dir_path: str) -> _Listing:
+    """Return ``(files, subdirectories, timestamp)`` for one directory.
+
+    Mirrors ``os.walk``: symbolic links to directories are neither reported
+    nor descended into. Entries that cannot be stat-ed, for example because
+    they vanished during the scan, are skipped.
+    """
+    files: List[Tuple[str, os.stat_result]] = []
+    dirs: List[Tuple[str, os.stat_result]] = []
+    with os.scandir(dir_path) as it:
+        now = int(time.time())
+        for entry in it:
+            try:
+                is_dir = entry.is_dir()
+                if is_dir and entry.is_symlink():
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            (dirs if is_dir else files).append((entry.path, st))
+    return files, dirs, now
+
+
+def _take_listing(
+    path: str, pending: Optional["Future[_Listing]"], stats: Optional[EfuStats]
+) -> Optional[_Listing]:
+    """Return the listing of ``path``, from ``pending`` if it was prefetched.
+
+    Returns ``None`` when the directory cannot be listed.
+    """
+    start = time.perf_counter() if stats is not None else 0.0
+    try:
+        listing: Optional[_Listing] = (
+            pending.result() if pending is not None else _list_directory(path)
+        )
+    except OSError:
+        listing = None
+    if stats is not None:
+        stats.add_time("list", time.perf_counter() - start)
+        if listing is None:
+            stats.add("unreadable_dirs")
+        else:
+            files, dirs, _ = listing
+            stats.add("scandir_calls")
+            stats.add("stat_calls", len(files) + len(dirs))
+            stats.add("entries", 1 + len(files))
+            stats.tick()
+    return listing
+
+
+def iter_scan(
+    dir_path: str, workers: int = 1, stats: Optional[EfuStats] = None
+) -> Iterator[ScanEntry]:
+    """Yield ``(path, stat, timestamp)`` for ``dir_path`` and everything below it.
+
+    Entries come out in ``os.walk`` top-down order: a directory, then its
+    files, then each subdirectory in turn. A directory is listed only when
+    the scan reaches it, so memory holds the listings along the current
+    path rather than the whole tree. With ``workers`` greater than one the
+    next ``workers`` directories to visit are listed ahead in a thread
+    pool, which hides per-call latency on network file systems.
+    Directories that cannot be listed are skipped, as ``os.walk`` does.
+
+    ``stats`` counts entries, ``scandir`` and ``stat`` calls and unreadable
+    directories, and times waiting for listings as the ``list`` phase.
+    """
+    try:
+        root_stat = os.stat(dir_path)
+    except OSError:
+        return
+    finally:
+        if stats is not None:
+            stats.add("stat_calls")
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    # [path, stat, prefetched listing or None]; the next directory is last.
+    stack: List[List[Any]] = [[dir_path, root_stat, None]]
+    try:
+        while stack:
+            path, st, pending = stack.pop()
+            listing = _take_listing(path, pending, stats)
+            if listing is None:
+                continue
+            files, dirs, now = listing
+            yield path, st, now
+            for file_path, file_stat in files:
+                yield file_path, file_stat, now
+            stack.extend([p, s, None] for p, s in reversed(dirs))
+            if executor is not None:
+                for entry in stack[-workers:]:
+                    if entry[2] is None:
+                        entry[2] = executor.submit(_list_directory, entry[0])
+    finally:
+        if executor is not None:
+            # Drop listings that were prefetched but will never be consumed.
+            for entry in stack:
+                if entry[2] is not None:
+                    entry[2].cancel()
+            executor.shutdown(wait=True)
+
+
+def _record_from_entry(
+    headers: Union[Iterable[str], EfuSchema], entry: ScanEntry
+) -> Union[EfuRecord, CompactEfuRecord]:
+    path, st, now = entry
+    if isinstance(headers, EfuSchema):
+        record: Any = CompactEfuRecord(headers)
+    else:
+        record = EfuRecord(headers)
+    record.last_seen = now
+    record.first_seen = now
+    _fill_from_stat(record, path, st, _attributes(st))
+    return record
+
+
+def scan_directory(
+    dir_path: str,
+    headers: Union[Iterable[str], EfuSchema],
+    workers: int = 1,
+    stats: Optional[EfuStats] = None,
+) -> Iterator[Union[EfuRecord, CompactEfuRecord]]:
+    """Yield records for ``dir_path`` and all entries below it.
+
+    Uses the stat data gathered by ``os.scandir`` rather than a separate
+    ``os.stat``/``os.access`` per file, and takes one timestamp per
+    directory listing for ``first_seen``/``last_seen``. An
+    :class:`EfuSchema` produces :class:`CompactEfuRecord` objects.
+    ``stats`` collects scan counters and timings as in :func:`iter_scan`.
+    """
+    if not isinstance(headers, EfuSchema):
+        headers = list(headers)
+    for entry in iter_scan(dir_path, workers=workers, stats=stats):
+        yield _record_from_entry(headers, entry)
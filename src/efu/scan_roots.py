@@ -0,0 +1,188 @@
+from contextlib import ExitStack
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+import os
+import queue
+import re
+import threading
+import time
+
+from .compact_efu_record import CompactEfuRecord, EfuSchema
+from .efu_record import DEFAULT_HEADERS, EfuRecord
+from .efu_stats import EfuStats
+from .efu_writer import EfuWriter
+from .scan_directory import ScanEntry, _record_from_entry, iter_scan
+from .scan_to_efu import _DONE, _build_rows, _produce, _row_builder
+
+
+class RootStats:
+    """Scan statistics for one root of a multi-root scan."""
+
+    __slots__ = ("root", "entries", "seconds", "file_path")
+
+    def __init__(self, root: str, file_path: Optional[str] = None) -> None:
+        self.root = root
+        self.entries = 0
+        self.seconds = 0.0
+        self.file_path = file_path
+
+    @property
+    def entries_per_second(self) -> float:
+        return self.entries / self.seconds if self.seconds > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"RootStats(root={self.root!r}, entries={self.entries}, "
+            f"seconds={self.seconds:.3f}, entries_per_second={self.entries_per_second:.0f})"
+        )
+
+
+def _counted(entries: Iterator[ScanEntry], stats: RootStats) -> Iterator[ScanEntry]:
+    start = time.perf_counter()
+    try:
+        for entry in entries:
+            stats.entries += 1
+            yield entry
+    finally:
+        stats.seconds = time.perf_counter() - start
+        entries.close()  # type: ignore[attr-defined]
+
+
+def _iter_batches(
+    roots: Sequence[str],
+    stats: Sequence[RootStats],
+    workers_per_root: int,
+    queue_size: int,
+    batch_size: int,
+    efu_stats: Optional[EfuStats],
+) -> Iterator[Tuple[int, List[ScanEntry]]]:
+    """Scan every root in its own thread and yield ``(root index, batch)``."""
+    batches: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    threads = [
+        threading.Thread(
+            target=_produce,
+            args=(
+                _counted(iter_scan(root, workers=workers_per_root, stats=efu_stats), stats[i]),
+                batches,
+                stop,
+                batch_size,
+                i,
+            ),
+            name=f"efu-scan-{i}",
+            daemon=True,
+        )
+        for i, root in enumerate(roots)
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        remaining = len(threads)
+        while remaining:
+            index, item = batches.get()
+            if item is _DONE:
+                remaining -= 1
+            elif isinstance(item, BaseException):
+                raise item
+            else:
+                yield index, item
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+
+def iter_scan_roots(
+    roots: Iterable[str],
+    headers: Union[Iterable[str], EfuSchema],
+    workers_per_root: int = 1,
+    queue_size: int = 16,
+    batch_size: int = 1024,
+    stats: Optional[EfuStats] = None,
+) -> Iterator[Union[EfuRecord, CompactEfuRecord]]:
+    """Scan several roots concurrently and yield their records.
+
+    Each root is walked by its own thread (plus ``workers_per_root``
+    listing threads), so independent devices are read in parallel. Every
+    record has ``root`` set to the root it was found under. Entries of one
+    root keep ``os.walk`` order, but batches of different roots interleave.
+    ``stats`` collects the counters and timings of all roots together.
+    """
+    roots = list(roots)
+    if not isinstance(headers, EfuSchema):
+        headers = list(headers)
+    root_stats = [RootStats(root) for root in roots]
+    for index, batch in _iter_batches(
+        roots, root_stats, workers_per_root, queue_size, batch_size, stats
+    ):
+        root = roots[index]
+        for entry in batch:
+            record = _record_from_entry(headers, entry)
+            record.root = root
+            yield record
+
+
+def _shard_names(roots: Sequence[str]) -> List[str]:
+    """Return a distinct ``.efu`` file name for every root."""
+    names: List[str] = []
+    used: Dict[str, int] = {}
+    for root in roots:
+        base = os.path.basename(os.path.normpath(root)) or root
+        base = re.sub(r"[^\w.-]+", "_", base).strip("_.") or "root"
+        count = used.get(base, 0) + 1
+        used[base] = count
+        names.append(f"{base}.efu" if count == 1 else f"{base}-{count}.efu")
+    return names
+
+
+def scan_roots_to_efu(
+    roots: Iterable[str],
+    file_path: Optional[str] = None,
+    out_dir: Optional[str] = None,
+    headers: Optional[Iterable[str]] = None,
+    newline: Optional[str] = None,
+    encoding: str = "utf-8",
+    workers_per_root: int = 1,
+    queue_size: int = 16,
+    batch_size: int = 1024,
+    stats: Optional[EfuStats] = None,
+) -> List[RootStats]:
+    """Scan several roots concurrently into EFU output.
+
+    With ``file_path`` all roots are merged into one EFU file. With
+    ``out_dir`` one shard is written per root, named after the root's last
+    path component. Exactly one of the two must be given.
+
+    Returns one :class:`RootStats` per root, in the order of ``roots``,
+    with the entry count, scan time and throughput. ``stats`` collects
+    detailed counters and timings of all roots together, see
+    :class:`EfuStats`.
+    """
+    if (file_path is None) == (out_dir is None):
+        raise ValueError("exactly one of file_path and out_dir must be given")
+    roots = list(roots)
+    header_fields = list(headers) if headers is not None else list(DEFAULT_HEADERS)
+    build = _row_builder(header_fields)
+    if out_dir is not None:
+        paths = [os.path.join(out_dir, name) for name in _shard_names(roots)]
+    else:
+        paths = [file_path] * len(roots)  # type: ignore[list-item]
+    root_stats = [RootStats(root, path) for root, path in zip(roots, paths)]
+
+    def open_writer(path: str) -> EfuWriter:
+        writer = stack.enter_context(
+            EfuWriter(path, newline=newline, encoding=encoding, stats=stats)
+        )
+        writer.write_header(header_fields)
+        return writer
+
+    with ExitStack() as stack:
+        if out_dir is None:
+            writers = [open_writer(file_path)] * len(roots)  # type: ignore[arg-type]
+        else:
+            os.makedirs(out_dir, exist_ok=True)
+            writers = [open_writer(path) for path in paths]
+        for index, batch in _iter_batches(
+            roots, root_stats, workers_per_root, queue_size, batch_size, stats
+        ):
+            writers[index].write_rows(_build_rows(build, batch, stats))
+    return root_stats
@@ -0,0 +1,140 @@
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence
+import queue
+import threading
+
+from .efu_record import DEFAULT_HEADERS, _to_filetime
+from .efu_stats import EfuStats
+from .efu_writer import EfuWriter
+from .scan_directory import ScanEntry, _attributes, iter_scan
+
+_DONE = object()
+
+
+def _row_builder(headers: Sequence[str]) -> Callable[[ScanEntry], List[str]]:
+    """Return a function turning a scan entry into EFU field strings."""
+    getters = {
+        "Filename": lambda path, st: path,
+        "Size": lambda path, st: str(st.st_size),
+        "Date Modified": lambda path, st: str(_to_filetime(st.st_mtime)),
+        "Date Created": lambda path, st: str(_to_filetime(st.st_ctime)),
+        "Attributes": lambda path, st: str(_attributes(st)),
+    }
+    plan = [getters.get(name, lambda path, st: "") for name in headers]
+
+    def build(entry: ScanEntry) -> List[str]:
+        path, st, _ = entry
+        return [get(path, st) for get in plan]
+
+    return build
+
+
+def _put(out: "queue.Queue[Any]", stop: threading.Event, item: Any) -> bool:
+    """Put ``item`` on ``out``, giving up and returning False once ``stop`` is set."""
+    while not stop.is_set():
+        try:
+            out.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _batches(entries: Iterable[ScanEntry], batch_size: int) -> Iterator[List[ScanEntry]]:
+    """Yield ``entries`` in lists of ``batch_size``; the last one may be shorter."""
+    batch: List[ScanEntry] = []
+    for entry in entries:
+        batch.append(entry)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _produce(
+    entries: Iterable[ScanEntry],
+    out: "queue.Queue[Any]",
+    stop: threading.Event,
+    batch_size: int,
+    key: Any = None,
+) -> None:
+    """Put ``(key, batch)`` items on ``out``, then ``(key, _DONE)``.
+
+    An exception raised by ``entries`` is put as ``(key, exc)`` instead of
+    the end marker. Gives up quietly once ``stop`` is set.
+    """
+    try:
+        for batch in _batches(entries, batch_size):
+            if not _put(out, stop, (key, batch)):
+                return
+        _put(out, stop, (key, _DONE))
+    except BaseException as exc:
+        _put(out, stop, (key, exc))
+    finally:
+        # Release the scanner's thread pool even when abandoned early.
+        close = getattr(entries, "close", None)
+        if close is not None:
+            close()
+
+
+def _build_rows(
+    build: Callable[[ScanEntry], List[str]],
+    batch: List[ScanEntry],
+    stats: Optional[EfuStats],
+) -> Iterable[List[str]]:
+    """Return the rows of ``batch``, built eagerly under the ``convert`` timer with ``stats``."""
+    if stats is None:
+        return map(build, batch)
+    with stats.phase("convert"):
+        return list(map(build, batch))
+
+
+def scan_to_efu(
+    dir_path: str,
+    file_path: str,
+    headers: Optional[Iterable[str]] = None,
+    newline: Optional[str] = None,
+    encoding: str = "utf-8",
+    workers: int = 1,
+    queue_size: int = 16,
+    batch_size: int = 1024,
+    stats: Optional[EfuStats] = None,
+) -> int:
+    """Scan ``dir_path`` and stream the entries into the EFU file ``file_path``.
+
+    Directory traversal runs in a background thread and hands batches of
+    ``batch_size`` entries to the writer through a queue bounded at
+    ``queue_size`` batches. Memory use therefore does not grow with the
+    number of files written; what remains is the :func:`iter_scan` state,
+    which holds the listings of the directories along the current path.
+    Returns the number of rows written.
+
+    ``stats`` collects scan and write counters and timings, see
+    :class:`EfuStats`; building rows from stat results is the ``convert``
+    phase.
+    """
+    header_fields = list(headers) if headers is not None else list(DEFAULT_HEADERS)
+    build = _row_builder(header_fields)
+    batches: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    producer = threading.Thread(
+        target=_produce,
+        args=(iter_scan(dir_path, workers=workers, stats=stats), batches, stop, batch_size),
+        name="efu-scan",
+        daemon=True,
+    )
+    producer.start()
+    try:
+        with EfuWriter(file_path, newline=newline, encoding=encoding, stats=stats) as writer:
+            writer.write_header(header_fields)
+            while True:
+                _, item = batches.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                writer.write_rows(_build_rows(build, item, stats))
+            return writer.rows_written
+    finally:
+        stop.set()
+        producer.join()
@@ -0,0 +1,190 @@
+from typing import Any, BinaryIO, NamedTuple, Optional, Union
+import hashlib
+import os
+
+from .efu_stats import EfuStats
+from .efu_to_array import efu_to_array
+from .efu_writer import EfuWriter
+from .iter_efu_rows import iter_efu_rows
+from .open_efu import EfuFile, _open_output, open_efu
+
+
+class VerifyResult(NamedTuple):
+    """Outcome of :func:`verify_efu`.
+
+    ``offset`` is the first byte at which the written data departs from the
+    input and ``row`` the line it falls on, ``0`` being the header; both
+    are ``None`` when the data is identical or when digests were compared.
+    ``digest`` is the hex digest of the written data in hash mode.
+    """
+
+    identical: bool
+    rows: int
+    offset: Optional[int] = None
+    row: Optional[int] = None
+    digest: Optional[str] = None
+
+
+class _Mismatch(Exception):
+    """Raised by the sink to stop serializing once the outcome is known."""
+
+
+class _HashingReader:
+    """Binary reader that feeds everything read from ``raw`` into ``digest``."""
+
+    def __init__(self, raw: BinaryIO, digest: Any) -> None:
+        self._raw = raw
+        self._digest = digest
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._raw.read(size)
+        self._digest.update(data)
+        return data
+
+    def readline(self, size: int = -1) -> bytes:
+        data = self._raw.readline(size)
+        self._digest.update(data)
+        return data
+
+
+class _VerifySink:
+    """Binary sink for :class:`EfuWriter` comparing, hashing and copying the data.
+
+    Written bytes are compared with the next bytes of ``reference``, fed to
+    ``digest`` and copied to ``output``; each of them is optional. Once a
+    difference is found it stops comparing and, with ``stop_early``, raises
+    :class:`_Mismatch`.
+    """
+
+    def __init__(
+        self,
+        reference: Optional[BinaryIO],
+        digest: Any,
+        output: Optional[Any],
+        stop_early: bool,
+    ) -> None:
+        self.reference = reference
+        self.digest = digest
+        self.output = output
+        self.stop_early = stop_early
+        self.offset = 0
+        self.lines = 0
+        self.mismatch: Optional[int] = None
+        self.mismatch_row: Optional[int] = None
+
+    def _differ(self, index: int, data: bytes) -> None:
+        self.mismatch = self.offset + index
+        self.mismatch_row = self.lines + data.count(b"\n", 0, index)
+
+    def write(self, data: bytes) -> int:
+        if self.output is not None:
+            self.output.write(data)
+        if self.digest is not None:
+            self.digest.update(data)
+        if self.reference is not None and self.mismatch is None:
+            expected = self.reference.read(len(data))
+            if expected == data:
+                self.lines += data.count(b"\n")
+            else:
+                index = next(
+                    (i for i, (a, b) in enumerate(zip(data, expected)) if a != b),
+                    min(len(data), len(expected)),
+                )
+                self._differ(index, data)
+        self.offset += len(data)
+        if self.mismatch is not None and self.stop_early:
+            raise _Mismatch
+        return len(data)
+
+    def flush(self) -> None:
+        if self.output is not None:
+            self.output.flush()
+
+    def finish(self) -> None:
+        """Record a difference if ``reference`` has bytes left over."""
+        if self.reference is not None and self.mismatch is None and self.reference.read(1):
+            self._differ(0, b"")
+
+
+def verify_efu(
+    file_path: Union[str, "os.PathLike[str]"],
+    out_path: Optional[EfuFile] = None,
+    hash_name: Optional[str] = None,
+    encoding: str = "utf-8",
+    engine: str = "fast",
+    workers: Optional[int] = None,
+    stats: Optional[EfuStats] = None,
+) -> VerifyResult:
+    """Check that parsing and re-writing ``file_path`` reproduces it exactly.
+
+    Rows are streamed from the parser into an :class:`EfuWriter` whose file
+    object checks each written batch, so memory use does not depend on the
+    file size. The written data is also copied to ``out_path`` if given.
+
+    By default the written bytes are compared with a second reader of the
+    input as they are produced; without ``out_path`` serializing stops at
+    the first difference. With ``hash_name`` (any :mod:`hashlib` algorithm)
+    the input is hashed while it is parsed and compared with the digest of
+    the written data instead, so the input is read only once but the
+    position of a difference is not known. Compressed inputs are compared
+    after decompression.
+
+    With ``workers`` greater than one the input is parsed in parallel by
+    :func:`efu_to_array`, which holds all rows in memory.
+    """
+    input_digest = hashlib.new(hash_name) if hash_name is not None else None
+    output_digest = hashlib.new(hash_name) if hash_name is not None else None
+    output, owns_output = (None, False)
+    if out_path is not None:
+        output, owns_output = _open_output(out_path)
+    reference: Optional[BinaryIO] = None
+    raw: Optional[BinaryIO] = None
+    rows_iter: Any = None
+    try:
+        if input_digest is None:
+            reference = open_efu(file_path)
+        if workers is not None and workers > 1:
+            rows, header_fields, newline = efu_to_array(
+                file_path, encoding=encoding, engine=engine, workers=workers, stats=stats
+            )
+            if input_digest is not None:
+                with open_efu(file_path) as f:
+                    for chunk in iter(lambda: f.read(1 << 20), b""):
+                        input_digest.update(chunk)
+            rows_iter = iter(rows)
+        else:
+            raw = open_efu(file_path)
+            source: Any = raw if input_digest is None else _HashingReader(raw, input_digest)
+            rows_iter, header_fields, newline = iter_efu_rows(
+                source, encoding=encoding, engine=engine, stats=stats
+            )
+
+        sink = _VerifySink(reference, output_digest, output, stop_early=output is None)
+        writer = EfuWriter(sink, newline=newline, encoding=encoding, stats=stats)
+        try:
+            with writer:
+                writer.write_header(header_fields)
+                writer.write_rows(rows_iter)
+        except _Mismatch:
+            pass
+        sink.finish()
+    finally:
+        close_rows = getattr(rows_iter, "close", None)
+        if close_rows is not None:
+            close_rows()
+        for stream in (reference, raw):
+            if stream is not None:
+                stream.close()
+        if owns_output:
+            output.close()  # type: ignore[union-attr]
+
+    if output_digest is not None:
+        digest = output_digest.hexdigest()
+        return VerifyResult(
+            digest == input_digest.hexdigest(),  # type: ignore[union-attr]
+            writer.rows_written,
+            digest=digest,
+        )
+    return VerifyResult(
+        sink.mismatch is None, writer.rows_written, sink.mismatch, sink.mismatch_row
+    )
@@ -0,0 +1,72 @@
+import os
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'src'))
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.run import BENCHMARKS, run
+from benchmarks.synthetic import HEADER_FIELDS, generate_efu, generate_tree, iter_synthetic_rows
+from efu import array_to_efu, efu_to_array
+
+
+def test_generator_is_deterministic(tmp_path):
+    first = tmp_path / 'a.efu'
+    second = tmp_path / 'b.efu'
+    other = tmp_path / 'c.efu'
+    assert generate_efu(str(first), 2000, seed=7) == 2000
+    generate_efu(str(second), 2000, seed=7)
+    generate_efu(str(other), 2000, seed=8)
+    assert first.read_bytes() == second.read_bytes()
+    assert first.read_bytes() != other.read_bytes()
+
+
+def test_generated_rows_cover_special_cases():
+    rows = list(iter_synthetic_rows(20000, quote_rate=0.01, comma_rate=0.01))
+    assert len(rows) == 20000
+    assert all(len(row) == len(HEADER_FIELDS) for row in rows)
+    assert any('"' in row[0] for row in rows)
+    assert any(',' in row[0] for row in rows)
+    assert any(row[1] == '' for row in rows)
+    folders = {row[0] for row in rows if row[4] == '16'}
+    # Pre-order: every folder is listed before its contents.
+    seen = set()
+    for path, *_ in rows:
+        parent = path.rsplit('\\', 1)[0]
+        assert parent == 'C:' or parent in seen
+        if path in folders:
+            seen.add(path)
+    depths = sorted(row[0].count('\\') for row in rows)
+    assert 4 <= depths[len(depths) // 2] <= 8
+
+
+def test_generated_file_round_trips(tmp_path):
+    for newline in ('\r\n', '\n'):
+        path = tmp_path / 'synthetic.efu'
+        copy = tmp_path / 'copy.efu'
+        generate_efu(str(path), 3000, newline=newline)
+        rows, header_fields, nl = efu_to_array(str(path))
+        assert header_fields == HEADER_FIELDS
+        assert nl == newline
+        assert len(rows) == 3000
+        array_to_efu(rows, header_fields, str(copy), newline=nl)
+        assert copy.read_bytes() == path.read_bytes()
+
+
+def test_generate_tree(tmp_path):
+    assert generate_tree(str(tmp_path / 'tree'), 200, seed=3) == 200
+    entries = sum(len(dirs) + len(files) for _, dirs, files in os.walk(tmp_path / 'tree'))
+    assert entries == 200
+
+
+def test_run_reports_every_benchmark(tmp_path):
+    report = run(rows=500, files=50, repeat=1, record_count=100, tmp_dir=str(tmp_path))
+    assert report['rows'] == 500
+    assert report['input_bytes'] > 0
+    assert set(report['results']) == set(BENCHMARKS) | {'record_memory'}
+    for name in BENCHMARKS:
+        result = report['results'][name]
+        assert result['rows_per_second'] > 0
+        assert result['peak_memory'] > 0
+    assert report['results']['record_memory']['count'] == 100
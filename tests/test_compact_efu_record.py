@@ -0,0 +1,88 @@
+import pathlib
+import pickle
+import sys
+from collections.abc import ValuesView
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
+
+from efu import CompactEfuRecord, EfuRecord, EfuRecords, EfuSchema, objects_to_efu
+
+
+HEADER = [
+    "Filename",
+    "Size",
+    "Date Modified",
+    "Date Created",
+    "Attributes",
+]
+
+
+def test_compact_record_mapping():
+    schema = EfuSchema(HEADER)
+    rec = CompactEfuRecord(schema, {"Filename": "foo"}, Size=100, root="C:")
+
+    assert isinstance(rec, CompactEfuRecord)
+    assert rec.schema is schema
+    assert list(rec.keys()) == HEADER
+    assert isinstance(rec.values(), ValuesView)
+    assert list(rec.values()) == ["foo", 100, None, None, None]
+    assert None in rec.values()
+    assert rec["Filename"] == "foo"
+    assert rec["Size"] == 100
+    assert rec.get("Attributes") is None
+    assert rec.get("Missing", 1) == 1
+    assert rec == EfuRecord(HEADER, {"Filename": "foo", "Size": 100})
+    assert rec.root == "C:"
+    assert rec.last_seen is None
+
+    with pytest.raises(KeyError):
+        rec["Missing"] = 1
+    with pytest.raises(KeyError):
+        rec["Missing"]
+    with pytest.raises(AttributeError):
+        rec.other = 1
+
+
+def test_compact_record_shares_schema():
+    a = CompactEfuRecord(HEADER)
+    b = CompactEfuRecord(HEADER)
+
+    assert a.schema is b.schema is EfuSchema.for_headers(HEADER)
+    assert not hasattr(a, "__dict__")
+
+
+def test_compact_record_pickle():
+    rec = CompactEfuRecord(HEADER, {"Filename": "x", "Size": 3}, last_seen=5, root=2)
+    copy = pickle.loads(pickle.dumps(rec))
+
+    assert copy == rec
+    assert (copy.last_seen, copy.root) == (5, 2)
+
+
+def test_compact_records_from_directory(tmp_path):
+    (tmp_path / "file.txt").write_text("hello")
+    schema = EfuSchema(HEADER)
+
+    records = EfuRecords()
+    records.extend_from_directory(str(tmp_path), schema)
+
+    assert len(records) == 2
+    assert all(isinstance(rec, CompactEfuRecord) for rec in records)
+    rec = next(r for r in records if r["Filename"].endswith("file.txt"))
+    assert rec["Size"] == 5
+    assert rec["Attributes"] == 32
+    assert rec.first_seen == rec.last_seen
+
+    out_file = tmp_path / "out.efu"
+    objects_to_efu(records, str(out_file))
+    assert out_file.read_text().startswith(",".join(HEADER))
+
+
+def test_compact_record_is_smaller():
+    sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+    from benchmarks.record_memory import run
+
+    results = run(2000)
+    assert results["CompactEfuRecord"] < results["EfuRecord"]
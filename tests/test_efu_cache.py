@@ -0,0 +1,129 @@
+import os
+import pathlib
+import shutil
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
+
+from efu import (
+    EfuTable,
+    cache_path_for,
+    efu_to_array,
+    load_efu_table,
+    read_efu_cache,
+    write_efu_cache,
+)
+
+SAMPLE = pathlib.Path(__file__).resolve().parents[1] / 'samples' / 'sample1.efu'
+
+
+def _copy_sample(tmp_path):
+    path = tmp_path / 'sample.efu'
+    shutil.copyfile(SAMPLE, path)
+    return str(path)
+
+
+def test_load_writes_and_reuses_cache(tmp_path):
+    path = _copy_sample(tmp_path)
+    assert read_efu_cache(path) is None
+
+    parsed = load_efu_table(path)
+    assert os.path.exists(cache_path_for(path))
+
+    cached = read_efu_cache(path)
+    assert cached is not None
+    rows, headers, nl = efu_to_array(path)
+    assert cached.header_fields == headers
+    assert cached.newline == nl
+    assert list(cached.iter_rows()) == rows
+    assert cached.column('Size') == parsed.column('Size')
+    assert dict(cached[0]) == dict(parsed[0])
+    assert isinstance(cached._columns[1].values, memoryview)
+
+    out = tmp_path / 'out.efu'
+    load_efu_table(path).to_efu(str(out))
+    assert out.read_bytes() == SAMPLE.read_bytes()
+
+
+def test_stale_or_damaged_cache_falls_back(tmp_path):
+    path = _copy_sample(tmp_path)
+    load_efu_table(path)
+    cache = cache_path_for(path)
+
+    with open(path, 'ab') as f:
+        f.write(b'"C:\\new.txt",1,2,3,32\r\n')
+    assert read_efu_cache(path) is None
+    table = load_efu_table(path)
+    assert table[len(table) - 1]['Filename'] == 'C:\\new.txt'
+    assert len(read_efu_cache(path)) == len(table)
+
+    with open(cache, 'r+b') as f:
+        f.write(b'garbage!')
+    assert read_efu_cache(path) is None
+    with open(cache, 'r+b') as f:
+        f.truncate(100)
+    assert read_efu_cache(path) is None
+    assert len(load_efu_table(path, write_cache=False)) == len(table)
+    assert read_efu_cache(path) is None
+
+
+def test_cache_keeps_text_columns_and_compressed_paths(tmp_path):
+    path = tmp_path / 'odd.efu'
+    path.write_bytes(
+        'Filename,Size,Owner,Attributes\n'
+        '"/r/é",007,"bob",32\n'
+        '/r/x,,,\n'.encode('utf-8')
+    )
+    table = EfuTable.from_file(str(path), compress_paths=True)
+    cache = str(tmp_path / 'odd.cache')
+    write_efu_cache(table, str(path), cache)
+
+    cached = read_efu_cache(str(path), cache)
+    assert list(cached.iter_rows()) == list(table.iter_rows())
+    # '007' cannot be stored in the typed array, so Size is a text column.
+    assert cached.column('Size') == table.column('Size')
+    assert not isinstance(cached._columns[1].values, memoryview)
+    assert cached.column('Attributes') == [32, None]
+
+    # A mapped table can be cached again, e.g. under another name.
+    again = str(tmp_path / 'again.cache')
+    write_efu_cache(cached, str(path), again)
+    assert list(read_efu_cache(str(path), again).iter_rows()) == list(table.iter_rows())
+    assert read_efu_cache(str(path), again, encoding='latin-1') is None
+
+
+def test_unreadable_or_inconsistent_cache_falls_back(tmp_path):
+    import json
+    import struct
+
+    path = _copy_sample(tmp_path)
+    rows = len(efu_to_array(path)[0])
+
+    unopenable = tmp_path / 'dir.cache'
+    unopenable.mkdir()
+    assert read_efu_cache(path, str(unopenable)) is None
+    assert len(load_efu_table(path, str(unopenable))) == rows
+
+    cache = cache_path_for(path)
+    write_efu_cache(EfuTable.from_file(path), path)
+    data = pathlib.Path(cache).read_bytes()
+    prefix = struct.Struct('<8sIQ')
+    magic, version, length = prefix.unpack_from(data)
+    meta = json.loads(data[prefix.size:prefix.size + length])
+
+    def damage(**changes):
+        # Same-length metadata keeps the data offsets valid.
+        text = json.dumps(dict(meta, **changes), separators=(',', ':')).encode()
+        text = text.ljust(length)
+        assert len(text) == length
+        with open(cache, 'wb') as f:
+            f.write(data[:prefix.size] + text + data[prefix.size + length:])
+        return read_efu_cache(path)
+
+    assert damage() is not None
+    assert damage(columns=None) is None
+    assert damage(rows='many') is None
+    assert damage(rows=meta['rows'] + 1) is None
+    assert damage(columns=[dict(meta['columns'][0], kind='float')] + meta['columns'][1:]) is None
+    assert damage(columns=[dict(meta['columns'][1], typecode='x')] + meta['columns'][1:]) is None
+    assert len(load_efu_table(path, write_cache=False)) == rows
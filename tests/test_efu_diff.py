@@ -0,0 +1,82 @@
+import pathlib
+import sys
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
+
+from efu import (
+    DeltaCounts,
+    apply_delta,
+    array_to_efu,
+    diff_efu,
+    efu_to_array,
+    iter_efu_diff,
+)
+
+SAMPLE = pathlib.Path(__file__).resolve().parents[1] / 'samples' / 'sample1.efu'
+
+
+def _snapshots(tmp_path):
+    rows, headers, nl = efu_to_array(str(SAMPLE))
+    rows.sort(key=lambda row: row[0])
+    old = tmp_path / 'old.efu'
+    array_to_efu(rows, headers, str(old), newline=nl)
+
+    new_rows = [list(row) for row in rows]
+    del new_rows[10:15]
+    new_rows[100][1] = str(int(new_rows[100][1] or 0) + 1)
+    new_rows[200][2] = '133999999999999999'
+    new_rows.append(['C:\\zzz\\new "quoted", file.txt', '7', '1', '1', '32'])
+    new_rows.insert(0, ['C:\\000.txt', '', '', '', '32'])
+    new = tmp_path / 'new.efu'
+    array_to_efu(new_rows, headers, str(new), newline=nl)
+    return old, new, rows
+
+
+def test_diff_and_apply_roundtrip(tmp_path):
+    old, new, rows = _snapshots(tmp_path)
+    delta = tmp_path / 'delta.efu'
+
+    counts = diff_efu(str(old), str(new), str(delta))
+
+    assert counts == DeltaCounts(added=2, removed=5, changed=2)
+    lines = delta.read_bytes().split(b'\r\n')
+    assert lines[0] == b'Delta,Filename,Size,Date Modified,Date Created,Attributes'
+    removed = [line for line in lines if line.startswith(b'"-"')]
+    assert removed[0] == b'"-","' + rows[10][0].encode() + b'"'
+    assert delta.stat().st_size < new.stat().st_size // 100
+
+    out = tmp_path / 'rebuilt.efu'
+    assert apply_delta(str(old), str(delta), str(out)) == len(rows) - 5 + 2
+    assert out.read_bytes() == new.read_bytes()
+
+
+def test_iter_efu_diff(tmp_path):
+    old, new, rows = _snapshots(tmp_path)
+    changes, headers, nl = iter_efu_diff(str(old), str(new))
+    changes = list(changes)
+    assert headers[0] == 'Filename' and nl == '\r\n'
+    assert changes[0] == ('+', ['C:\\000.txt', '', '', '', '32'])
+    assert [op for op, _ in changes].count('-') == 5
+    # Rows 100 and 200 of the new snapshot, after the five removed rows.
+    assert [row[0] for op, row in changes if op == '~'] == [rows[105][0], rows[205][0]]
+
+    same, _, _ = iter_efu_diff(str(old), str(old))
+    assert list(same) == []
+
+
+def test_diff_requires_sorted_input(tmp_path):
+    delta = tmp_path / 'delta.efu'
+    with pytest.raises(ValueError, match='sorted by Filename'):
+        diff_efu(str(SAMPLE), str(SAMPLE), str(delta))
+
+
+def test_apply_delta_rejects_mismatch(tmp_path):
+    old, new, _ = _snapshots(tmp_path)
+    delta = tmp_path / 'delta.efu'
+    diff_efu(str(old), str(new), str(delta))
+    with pytest.raises(ValueError, match='cannot apply'):
+        apply_delta(str(new), str(delta), str(tmp_path / 'out.efu'))
+    with pytest.raises(ValueError, match='header'):
+        apply_delta(str(old), str(old), str(tmp_path / 'out.efu'))
@@ -6,7 +6,7 @@ import pytest
 
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
 
-from efu import EfuRecord
+from efu import EfuRecord, EfuRecords
 
 
 def test_efu_record_initialization():
@@ -132,3 +132,21 @@ def test_populate_keeps_first_seen_if_set(tmp_path):
     assert rec.last_lost is None
     assert rec.last_seen is not None
     assert before <= rec.last_seen <= after
+
+
+def test_read_only_attribute_matches_directory_scan(tmp_path):
+    header = ["Filename", "Attributes"]
+    locked = tmp_path / "locked.txt"
+    locked.write_text("x")
+    locked.chmod(0o444)
+    try:
+        rec = EfuRecord(header)
+        rec.populate_from_path(str(locked))
+        records = EfuRecords()
+        records.append_from_path(str(locked), header)
+        records.extend_from_directory(str(tmp_path), header)
+        scanned = [r for r in records if r["Filename"] == str(locked)]
+        assert rec["Attributes"] == 33
+        assert [r["Attributes"] for r in scanned] == [33, 33]
+    finally:
+        locked.chmod(0o644)
@@ -0,0 +1,57 @@
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
+
+from efu import EfuRow, efu_to_objects, make_row_class, objects_to_efu
+
+
+def test_efu_to_objects_compact(tmp_path):
+    root = pathlib.Path(__file__).resolve().parents[1]
+    sample = root / 'samples' / 'sample1.efu'
+
+    objects = efu_to_objects(str(sample))
+    rows = efu_to_objects(str(sample), compact=True)
+
+    assert len(rows) == len(objects)
+    assert all(isinstance(row, EfuRow) for row in rows)
+    assert [dict(row) for row in rows] == objects
+    first = rows[0]
+    assert first.filename == "C:\\msys64"
+    assert first.size is None
+    assert first["Date Modified"] == first.date_modified == 133876022280081366
+    assert first[4] == 16
+    assert first.get("Missing", "x") == "x"
+
+    out_file = tmp_path / "out.efu"
+    objects_to_efu(rows, str(out_file), newline="\r\n")
+    assert out_file.read_bytes() == sample.read_bytes()
+
+
+def test_efu_to_objects_compact_workers():
+    root = pathlib.Path(__file__).resolve().parents[1]
+    sample = root / 'samples' / 'sample1.efu'
+
+    assert efu_to_objects(str(sample), workers=2, compact=True) == efu_to_objects(
+        str(sample), compact=True
+    )
+
+
+def test_make_row_class_names():
+    cls = make_row_class(["Filename", "class", "1st", "a-b", "A B", "keys"])
+
+    assert make_row_class(["Filename", "class", "1st", "a-b", "A B", "keys"]) is cls
+    row = cls(["f", 1, 2, 3, 4, 5])
+    assert (row.filename, row.f_class, row.f_1st, row.a_b, row.a_b_2, row.keys_2) == (
+        "f", 1, 2, 3, 4, 5,
+    )
+    assert row.to_dict()["keys"] == 5
+
+
+def test_short_rows_are_padded(tmp_path):
+    sample_file = tmp_path / "short.efu"
+    sample_file.write_text("Filename,Size,Attributes\n\"a\",5\n", newline="")
+
+    (row,) = efu_to_objects(str(sample_file), compact=True)
+    assert tuple(row) == ("a", 5, None)
+    assert efu_to_objects(str(sample_file)) == [{"Filename": "a", "Size": 5, "Attributes": None}]
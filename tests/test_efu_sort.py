@@ -0,0 +1,146 @@
+import importlib
+import pathlib
+import sys
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
+
+from efu import (
+    apply_delta,
+    array_to_efu,
+    diff_efu,
+    efu_to_array,
+    merge_efu,
+    sort_efu,
+)
+
+SAMPLE = pathlib.Path(__file__).resolve().parents[1] / 'samples' / 'sample1.efu'
+HEADERS = ['Filename', 'Size', 'Date Modified', 'Date Created', 'Attributes']
+
+
+@pytest.mark.parametrize('memory_limit', [1 << 30, 200_000, 20_000])
+def test_sort_by_filename(tmp_path, memory_limit, monkeypatch):
+    # A tiny fan-in forces several intermediate merge passes.
+    monkeypatch.setattr(importlib.import_module('efu.efu_sort'), '_FAN_IN', 3)
+    out = tmp_path / 'sorted.efu'
+    count = sort_efu(str(SAMPLE), str(out), memory_limit=memory_limit, tmp_dir=str(tmp_path))
+
+    rows, headers, nl = efu_to_array(str(SAMPLE))
+    expected = tmp_path / 'expected.efu'
+    array_to_efu(sorted(rows, key=lambda row: row[0]), headers, str(expected), newline=nl)
+    assert count == len(rows)
+    assert out.read_bytes() == expected.read_bytes()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['expected.efu', 'sorted.efu']
+
+
+def test_sort_numeric_column_is_stable(tmp_path):
+    src = tmp_path / 'in.efu'
+    rows = [['c', '10'], ['a', ''], ['b', '9'], ['d', '10'], ['e', 'x1'], ['f', '100']]
+    array_to_efu(rows, ['Filename', 'Size'], str(src))
+    out = tmp_path / 'out.efu'
+
+    sort_efu(str(src), str(out), key='Size', memory_limit=1)
+    assert [row[0] for row in efu_to_array(str(out))[0]] == ['a', 'b', 'c', 'd', 'f', 'e']
+
+    sort_efu(str(src), str(out), key='Size', reverse=True)
+    assert [row[0] for row in efu_to_array(str(out))[0]] == ['e', 'f', 'c', 'd', 'b', 'a']
+
+    with pytest.raises(ValueError):
+        sort_efu(str(src), str(out), key='Nope')
+
+
+def test_merge_dedupe_policies(tmp_path):
+    one = tmp_path / 'one.efu'
+    two = tmp_path / 'two.efu'
+    array_to_efu(
+        [['C:\\b', '1', '200', '1', '32'], ['C:\\a', '1', '100', '1', '32'],
+         ['C:\\c', '1', '100', '1', '32']],
+        HEADERS, str(one), newline='\r\n',
+    )
+    array_to_efu(
+        [['C:\\b', '2', '100', '1', '32'], ['C:\\a', '2', '300', '1', '32'],
+         ['C:\\c', '2', '100', '1', '32'], ['C:\\d', '2', '', '1', '32']],
+        HEADERS, str(two),
+    )
+    out = tmp_path / 'merged.efu'
+
+    def sizes(**kwargs):
+        merge_efu([str(one), str(two)], str(out), memory_limit=300, **kwargs)
+        rows, _, nl = efu_to_array(str(out))
+        assert nl == '\r\n'
+        return [(row[0], row[1]) for row in rows]
+
+    assert sizes() == [('C:\\a', '2'), ('C:\\b', '1'), ('C:\\c', '2'), ('C:\\d', '2')]
+    assert sizes(policy='first') == [('C:\\a', '1'), ('C:\\b', '1'), ('C:\\c', '1'), ('C:\\d', '2')]
+    assert sizes(policy='last') == [('C:\\a', '2'), ('C:\\b', '2'), ('C:\\c', '2'), ('C:\\d', '2')]
+    assert len(sizes(dedupe=False)) == 7
+
+    with pytest.raises(ValueError):
+        merge_efu([str(one)], str(out), policy='oldest')
+    bad = tmp_path / 'bad.efu'
+    array_to_efu([['x']], ['Filename'], str(bad))
+    with pytest.raises(ValueError):
+        merge_efu([str(one), str(bad)], str(out))
+
+
+def test_diff_with_sort(tmp_path):
+    rows, headers, nl = efu_to_array(str(SAMPLE))
+    new = tmp_path / 'new.efu'
+    array_to_efu(rows[:-3], headers, str(new), newline=nl)
+    delta = tmp_path / 'delta.efu'
+
+    counts = diff_efu(str(SAMPLE), str(new), str(delta), sort=True)
+    assert (counts.added, counts.removed, counts.changed) == (0, 3, 0)
+
+    out = tmp_path / 'out.efu'
+    apply_delta(str(SAMPLE), str(delta), str(out), sort=True)
+    expected = tmp_path / 'expected.efu'
+    sort_efu(str(new), str(expected))
+    assert out.read_bytes() == expected.read_bytes()
+
+
+def test_spilled_runs_keep_crlf_newline(tmp_path, monkeypatch):
+    # A quoted LF inside a CRLF file must survive being spilled to a run.
+    rows = [['c', '3'], ['b\nx', '1'], ['a', '2'], ['d\ny', '4']]
+    src = tmp_path / 'in.efu'
+    array_to_efu(rows, ['Filename', 'Size'], str(src), newline='\r\n')
+    out = tmp_path / 'out.efu'
+
+    sort_efu(str(src), str(out), memory_limit=100)
+    assert efu_to_array(str(out)) == (sorted(rows), ['Filename', 'Size'], '\r\n')
+
+    merge_efu([str(src), str(src)], str(out), memory_limit=100)
+    assert efu_to_array(str(out))[0] == sorted(rows)
+
+    module = importlib.import_module('efu.efu_diff')
+    monkeypatch.setattr(
+        module, 'sort_efu', lambda *args, **kwargs: sort_efu(*args, memory_limit=100, **kwargs)
+    )
+    new = tmp_path / 'new.efu'
+    array_to_efu(rows[:-1], ['Filename', 'Size'], str(new), newline='\r\n')
+    delta = tmp_path / 'delta.efu'
+    counts = diff_efu(str(src), str(new), str(delta), sort=True)
+    assert (counts.added, counts.removed, counts.changed) == (0, 1, 0)
+    apply_delta(str(src), str(delta), str(out), sort=True)
+    assert efu_to_array(str(out))[0] == sorted(rows[:-1])
+
+
+def test_sort_in_path_order(tmp_path):
+    rows = [['C:\\a\\x.txt', '1'], ['C:\\a-b.txt', '2'], ['C:\\a', ''], ['C:\\a\\b\\y', '3'],
+            ['C:\\a\\b', ''], ['C:\\a\\b-c', '4']]
+    src = tmp_path / 'in.efu'
+    array_to_efu(rows, ['Filename', 'Size'], str(src))
+    out = tmp_path / 'out.efu'
+
+    for memory_limit in (1 << 20, 100):
+        sort_efu(str(src), str(out), key='path', memory_limit=memory_limit)
+        assert [row[0] for row in efu_to_array(str(out))[0]] == [
+            'C:\\a', 'C:\\a\\b', 'C:\\a\\b\\y', 'C:\\a\\b-c', 'C:\\a\\x.txt', 'C:\\a-b.txt',
+        ]
+
+    # Without a Filename column there is nothing to order by path.
+    sizes = tmp_path / 'sizes.efu'
+    array_to_efu([['1']], ['Size'], str(sizes))
+    with pytest.raises(ValueError):
+        sort_efu(str(sizes), str(tmp_path / 'x.efu'), key='path')
@@ -0,0 +1,105 @@
+import os
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
+
+from efu import (
+    EfuRecords,
+    EfuStats,
+    array_to_efu,
+    efu_to_array,
+    efu_to_objects,
+    iter_efu_rows,
+    main as cli_main,
+    objects_to_efu,
+    scan_to_efu,
+)
+from efu.iter_efu_rows import _count_quoted, _split_line_python
+
+SAMPLE = pathlib.Path(__file__).resolve().parents[1] / 'samples' / 'sample1.efu'
+
+
+def test_parse_and_write_counters(tmp_path):
+    stats = EfuStats()
+    rows, header_fields, newline = efu_to_array(str(SAMPLE), stats=stats)
+    assert (rows, header_fields, newline) == efu_to_array(str(SAMPLE))
+    assert stats['rows_read'] == len(rows)
+    assert stats['bytes_read'] == SAMPLE.stat().st_size
+    assert stats['reads'] >= 2
+    assert stats['quoted_fields'] + stats['unquoted_fields'] == sum(map(len, rows))
+    assert set(stats.timings) >= {'read', 'decode', 'split'}
+
+    out = tmp_path / 'out.efu'
+    array_to_efu(rows, header_fields, str(out), newline=newline, stats=stats)
+    assert out.read_bytes() == SAMPLE.read_bytes()
+    assert stats['rows_written'] == len(rows)
+    assert stats['bytes_written'] == SAMPLE.stat().st_size
+    assert stats['writes'] >= 1
+    assert set(stats.timings) >= {'format', 'encode', 'write'}
+
+
+def test_objects_and_quoting_counters(tmp_path):
+    path = tmp_path / 'q.efu'
+    path.write_bytes(
+        b'Filename,Size\r\n"a,""b""",1\r\n\r\nplain,\r\n"x",""\r\n'
+    )
+    stats = EfuStats()
+    objects = efu_to_objects(str(path), stats=stats)
+    assert objects == efu_to_objects(str(path))
+    assert stats['rows_read'] == 3
+    assert stats['rows_skipped'] == 1
+    assert stats['quoted_fields'] == 3
+    assert stats['unquoted_fields'] == 3
+    assert 'convert' in stats.timings
+
+    out = tmp_path / 'out.efu'
+    objects_to_efu(objects, str(out), newline='\r\n', stats=stats)
+    assert stats['rows_written'] == 3
+
+
+def test_count_quoted_follows_the_parser():
+    lines = ['a,b', '"a",b', '"a,""b""",c', '"","x"', 'a"b",c', '"a""",""""', ',"x",']
+    for line in lines:
+        fields = _split_line_python(line)
+        assert 0 <= _count_quoted(line) <= len(fields)
+    assert [_count_quoted(line) for line in lines] == [0, 1, 1, 2, 0, 2, 1]
+
+
+def test_progress_callback(tmp_path):
+    calls = []
+    stats = EfuStats(progress=lambda s: calls.append(s['rows_read']), interval=0)
+    rows, _, _ = iter_efu_rows(str(SAMPLE), stats=stats)
+    assert sum(1 for _ in rows) == stats['rows_read']
+    assert calls and calls[-1] == stats['rows_read']
+
+
+def test_scan_counters(tmp_path):
+    root = tmp_path / 'tree'
+    (root / 'a' / 'b').mkdir(parents=True)
+    for i in range(5):
+        (root / 'a' / f'f{i}.txt').write_text('x')
+    stats = EfuStats()
+    count = scan_to_efu(str(root), str(tmp_path / 'out.efu'), stats=stats)
+    assert count == 8
+    assert stats['entries'] == 8
+    assert stats['rows_written'] == 8
+    assert stats['scandir_calls'] == 3
+    assert stats['stat_calls'] == 8
+
+    records = EfuRecords()
+    records.extend_from_directory(str(root), ['Filename'], stats=stats)
+    assert len(records) == 8
+    assert stats['entries'] == 16
+    assert 'list' in stats.as_dict()['timings']
+
+
+def test_cli_stats_and_profile(tmp_path, capsys):
+    out = tmp_path / 'out.efu'
+    profile = tmp_path / 'run.prof'
+    cli_main([str(SAMPLE), str(out), '--stats', '--profile', str(profile)])
+    captured = capsys.readouterr()
+    assert captured.out.strip() == "Round-trip successful: files are identical"
+    assert 'rows_read' in captured.err
+    assert 'split' in captured.err
+    assert os.path.getsize(profile) > 0
@@ -0,0 +1,88 @@
+import pathlib
+import sys
+from array import array
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
+
+from efu import (
+    EfuRecord,
+    EfuRecords,
+    EfuTable,
+    efu_to_array,
+    efu_to_objects,
+    objects_to_efu,
+)
+
+
+HEADER = [
+    "Filename",
+    "Size",
+    "Date Modified",
+    "Date Created",
+    "Attributes",
+]
+
+
+def test_efu_table_from_file_roundtrip(tmp_path):
+    root = pathlib.Path(__file__).resolve().parents[1]
+    sample = root / 'samples' / 'sample1.efu'
+
+    table = EfuTable.from_file(str(sample))
+    rows, header, nl = efu_to_array(str(sample))
+
+    assert table.header_fields == header
+    assert table.newline == nl
+    assert len(table) == len(rows)
+    assert list(table.iter_rows()) == rows
+
+    out_file = tmp_path / 'out.efu'
+    table.to_efu(str(out_file))
+    assert out_file.read_bytes() == sample.read_bytes()
+
+
+def test_efu_table_columns_and_rows():
+    rows = [
+        ["C:\\msys64", "", "133876022280081366", "133739602603410395", "16"],
+        ["C:\\msys64\\autorebase.bat", "82", "133262362720000000", "133739602600000000", "32"],
+    ]
+    table = EfuTable.from_rows(rows, HEADER, "\r\n")
+
+    assert isinstance(table._columns[1].values, array)
+    assert table.column("Size") == [None, 82]
+    assert table.column("Filename") == ["C:\\msys64", "C:\\msys64\\autorebase.bat"]
+    row = table[-1]
+    assert row["Attributes"] == 32
+    assert dict(row) == {
+        "Filename": "C:\\msys64\\autorebase.bat",
+        "Size": 82,
+        "Date Modified": 133262362720000000,
+        "Date Created": 133739602600000000,
+        "Attributes": 32,
+    }
+    assert [r["Size"] for r in table[0:2]] == [None, 82]
+
+
+def test_efu_table_keeps_non_canonical_numbers():
+    rows = [["a", "1", "", "", "16"], ["b", "007", "", "", "-1"]]
+    table = EfuTable.from_rows(rows, HEADER)
+
+    assert list(table.iter_rows()) == rows
+    assert table.column("Size") == [1, 7]
+
+
+def test_efu_table_records_and_objects(tmp_path):
+    root = pathlib.Path(__file__).resolve().parents[1]
+    sample = root / 'samples' / 'sample1.efu'
+    objects = efu_to_objects(str(sample))
+
+    records = EfuRecords(EfuRecord(HEADER, obj) for obj in objects[:50])
+    table = EfuTable.from_records(records, newline="\r\n")
+
+    assert list(table.iter_objects()) == objects[:50]
+    converted = table.to_records()
+    assert isinstance(converted, EfuRecords)
+    assert converted.data == objects[:50]
+
+    out_file = tmp_path / "objects.efu"
+    objects_to_efu(list(table.iter_objects()), str(out_file), newline="\r\n")
+    assert EfuTable.from_file(str(out_file)).column("Filename") == table.column("Filename")
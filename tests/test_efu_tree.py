@@ -0,0 +1,65 @@
+import pathlib
+import sys
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
+
+from efu import EfuRecord, EfuRecords, EfuTree, efu_to_array
+
+SAMPLE = pathlib.Path(__file__).resolve().parents[1] / 'samples' / 'sample1.efu'
+
+
+def test_tree_from_sample_rows():
+    rows, header_fields, _ = efu_to_array(str(SAMPLE))
+    tree = EfuTree.from_rows(rows, header_fields)
+    paths = [row[0] for row in rows]
+
+    assert len(tree) == len(set(paths))
+    assert tree.roots() == ['C:\\msys64']
+    assert tree['C:\\msys64\\autorebase.bat'] is rows[1]
+    assert tree.parent('C:\\msys64\\clang64\\bin') == 'C:\\msys64\\clang64'
+    assert tree.parent('C:\\msys64') is None
+    expected = [p for p in paths if p.rsplit('\\', 1)[0] == 'C:\\msys64\\clang64']
+    assert tree.children('C:\\msys64\\clang64') == expected
+    subtree = [p for p in paths if p.startswith('C:\\msys64\\clang64\\')]
+    walked = list(tree.walk('C:\\msys64\\clang64'))
+    assert walked[0] == 'C:\\msys64\\clang64'
+    assert sorted(walked[1:]) == sorted(subtree)
+    assert sorted(tree.walk()) == sorted(paths)
+
+
+def test_tree_case_insensitive_and_separators():
+    paths = ['C:\\Data\\', 'C:\\Data\\Sub', 'C:\\data\\sub\\File.TXT', '/srv', '/srv/a/b', '/']
+    tree = EfuTree(paths, case_sensitive=False)
+
+    assert 'c:\\DATA\\SUB\\file.txt' in tree
+    assert tree['c:\\data\\sub\\file.txt'] == 'C:\\data\\sub\\File.TXT'
+    assert tree.parent('C:\\data\\sub\\file.txt') == 'C:\\Data\\Sub'
+    assert tree.children('c:\\data') == ['C:\\Data\\Sub']
+    # Missing intermediate directories attach to the nearest ancestor.
+    assert tree.parent('/srv/a/b') == '/srv'
+    assert tree.parent('/srv') == '/'
+    assert tree.roots() == ['C:\\Data\\', '/']
+    assert list(tree.walk('/')) == ['/', '/srv', '/srv/a/b']
+
+    strict = EfuTree(paths)
+    assert 'c:\\data\\sub' not in strict
+    assert strict.parent('C:\\data\\sub\\File.TXT') is None
+
+
+def test_tree_from_records_and_duplicates():
+    records = EfuRecords(
+        EfuRecord(['Filename', 'Size'], {'Filename': name, 'Size': size})
+        for name, size in [('/r', None), ('/r/x', 1), ('/r/y', 2), ('/r/x', 3)]
+    )
+    tree = EfuTree.from_records(records)
+
+    assert len(tree) == 3
+    assert tree['/r/x']['Size'] == 3
+    assert tree.index('/r/x') == 3
+    assert tree.children('/r') == ['/r/y', '/r/x']
+    assert dict(tree)['/r/y'] is records[2]
+    with pytest.raises(KeyError):
+        tree.children('/missing')
+    assert tree.get('/missing') is None
@@ -0,0 +1,171 @@
+import os
+import pathlib
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
+
+from efu import EfuWatcher, efu_to_objects
+from efu.efu_record import _to_filetime
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+
+
+def _by_name(watcher):
+    return {rec["Filename"]: rec for rec in watcher.records}
+
+
+def _poll_until(watcher, predicate):
+    for _ in range(20):
+        watcher.poll(timeout=0.5)
+        if predicate():
+            return
+    raise AssertionError("watcher did not observe the change")
+
+
+def test_watcher_create_modify_delete(tmp_path):
+    (tmp_path / "old.txt").write_text("old")
+    with EfuWatcher(str(tmp_path)) as watcher:
+        assert set(_by_name(watcher)) == {str(tmp_path), str(tmp_path / "old.txt")}
+
+        new_file = tmp_path / "new.txt"
+        with open(new_file, "w") as f:
+            for _ in range(200):
+                f.write("x")
+                f.flush()
+        _poll_until(watcher, lambda: _by_name(watcher).get(str(new_file), {}).get("Size") == 200)
+        rec = _by_name(watcher)[str(new_file)]
+        assert rec.first_seen is not None and rec.last_seen is not None
+
+        (tmp_path / "old.txt").unlink()
+        _poll_until(watcher, lambda: _by_name(watcher)[str(tmp_path / "old.txt")].last_lost is not None)
+        live = {rec["Filename"] for rec in watcher.live_records()}
+        assert str(tmp_path / "old.txt") not in live
+        assert str(new_file) in live
+
+
+def test_watcher_directories_and_moves(tmp_path):
+    with EfuWatcher(str(tmp_path)) as watcher:
+        sub = tmp_path / "sub"
+        sub.mkdir()
+        _poll_until(watcher, lambda: str(sub) in _by_name(watcher))
+
+        inner = sub / "inner.txt"
+        inner.write_text("abc")
+        _poll_until(watcher, lambda: str(inner) in _by_name(watcher))
+
+        moved = tmp_path / "moved"
+        sub.rename(moved)
+        _poll_until(watcher, lambda: str(moved / "inner.txt") in _by_name(watcher))
+        records = _by_name(watcher)
+        assert records[str(inner)].last_lost is not None
+        assert records[str(sub)].last_lost is not None
+        assert {rec["Filename"] for rec in watcher.live_records()} == {
+            str(tmp_path), str(moved), str(moved / "inner.txt"),
+        }
+
+
+def test_watcher_run_flushes_snapshot(tmp_path):
+    root = tmp_path / "root"
+    root.mkdir()
+    snapshot = tmp_path / "snap.efu"
+    stop = threading.Event()
+    with EfuWatcher(str(root)) as watcher:
+        thread = threading.Thread(
+            target=watcher.run, args=(stop,), kwargs={"snapshot_path": str(snapshot), "flush_interval": 0.1}
+        )
+        thread.start()
+        try:
+            (root / "a.txt").write_text("a")
+            for _ in range(40):
+                if snapshot.exists() and len(efu_to_objects(str(snapshot))) == 2:
+                    break
+                stop.wait(0.1)
+        finally:
+            stop.set()
+            thread.join()
+
+    assert {obj["Filename"] for obj in efu_to_objects(str(snapshot))} == {str(root), str(root / "a.txt")}
+
+
+def test_watcher_flush_compressed_snapshot(tmp_path):
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "a.txt").write_text("a")
+    snapshot = tmp_path / "snap.efu.gz"
+    with EfuWatcher(str(root)) as watcher:
+        watcher.flush(str(snapshot))
+
+    assert snapshot.read_bytes()[:2] == b"\x1f\x8b"
+    assert {obj["Filename"] for obj in efu_to_objects(str(snapshot))} == {str(root), str(root / "a.txt")}
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["root", "snap.efu.gz"]
+
+
+def test_watcher_removed_tree_stays_lost_after_resync(tmp_path):
+    keep = tmp_path / "keep"
+    keep.mkdir()
+    (keep / "k.txt").write_text("k")
+    gone = tmp_path / "gone"
+    (gone / "deep").mkdir(parents=True)
+    (gone / "deep" / "x.txt").write_text("x")
+    (tmp_path / "f.txt").write_text("f")
+    with EfuWatcher(str(tmp_path)) as watcher:
+        (gone / "deep" / "x.txt").unlink()
+        (gone / "deep").rmdir()
+        gone.rmdir()
+        (tmp_path / "f.txt").unlink()
+        _poll_until(watcher, lambda: _by_name(watcher)[str(tmp_path / "f.txt")].last_lost is not None)
+        _poll_until(watcher, lambda: _by_name(watcher)[str(gone)].last_lost is not None)
+        lost = {str(gone), str(gone / "deep"), str(gone / "deep" / "x.txt"), str(tmp_path / "f.txt")}
+        assert all(_by_name(watcher)[path].last_lost is not None for path in lost)
+
+        # Two resyncs in a row, as after repeated queue overflows.
+        for _ in range(2):
+            watcher._overflow = True
+            watcher.apply_pending()
+            live = {rec["Filename"] for rec in watcher.live_records()}
+            assert live == {str(tmp_path), str(keep), str(keep / "k.txt")}
+            assert all(_by_name(watcher)[path].last_lost is not None for path in lost)
+
+
+def test_watcher_refreshes_parent_directory(tmp_path):
+    sub = tmp_path / "d"
+    sub.mkdir()
+    os.utime(sub, (1_600_000_000, 1_600_000_000))
+    with EfuWatcher(str(tmp_path)) as watcher:
+        def parent_current():
+            return _by_name(watcher)[str(sub)]["Date Modified"] == _to_filetime(os.stat(sub).st_mtime)
+
+        new = sub / "new.txt"
+        new.write_text("n")
+        _poll_until(watcher, lambda: str(new) in _by_name(watcher) and parent_current())
+
+        # Reset the directory date so the delete has to move it again.
+        os.utime(sub, (1_600_000_000, 1_600_000_000))
+        _poll_until(watcher, parent_current)
+        new.unlink()
+        _poll_until(watcher, lambda: _by_name(watcher)[str(new)].last_lost is not None and parent_current())
+        assert _by_name(watcher)[str(sub)]["Date Modified"] != _to_filetime(1_600_000_000)
+
+
+def test_watcher_forgets_lost_records(tmp_path):
+    root = tmp_path / "root"
+    (root / "d").mkdir(parents=True)
+    (root / "d" / "x.txt").write_text("x")
+    (root / "keep.txt").write_text("k")
+    with EfuWatcher(str(root), forget_lost_after=0) as watcher:
+        (root / "d" / "x.txt").unlink()
+        (root / "d").rmdir()
+        _poll_until(watcher, lambda: _by_name(watcher)[str(root / "d")].last_lost is not None)
+        assert len(watcher.records) == 4
+
+        watcher.flush(str(tmp_path / "snap.efu"))
+        assert set(_by_name(watcher)) == {str(root), str(root / "keep.txt")}
+        assert watcher.forget_lost() == 0
+
+        # A re-created path is tracked as a new entry.
+        (root / "d").mkdir()
+        _poll_until(watcher, lambda: str(root / "d") in _by_name(watcher))
+        assert _by_name(watcher)[str(root / "d")].last_lost is None
@@ -0,0 +1,69 @@
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
+
+from efu import EfuWriter, iter_efu_rows
+
+
+HEADER = [
+    "Filename",
+    "Size",
+    "Date Modified",
+    "Date Created",
+    "Attributes",
+]
+
+
+def test_efu_writer_rows(tmp_path):
+    out_file = tmp_path / "out.efu"
+    with EfuWriter(str(out_file), newline="\r\n", batch_size=2) as writer:
+        writer.write_header(HEADER)
+        writer.write_row(["C:\\msys64", "", "133876022280081366", "133739602603410395", "16"])
+        writer.write_rows(
+            [name, "82", "1", "2", "32"] for name in ("a\"b", "c,d", "e")
+        )
+        assert writer.rows_written == 4
+
+    expected = (
+        "Filename,Size,Date Modified,Date Created,Attributes\r\n"
+        "\"C:\\msys64\",,133876022280081366,133739602603410395,16\r\n"
+        "\"a\"\"b\",82,1,2,32\r\n"
+        "\"c,d\",82,1,2,32\r\n"
+        "\"e\",82,1,2,32\r\n"
+    )
+    with open(out_file, "r", newline="") as f:
+        assert f.read() == expected
+
+
+def test_efu_writer_streams_generator(tmp_path):
+    root = pathlib.Path(__file__).resolve().parents[1]
+    sample = root / 'samples' / 'sample1.efu'
+    rows, header, nl = iter_efu_rows(str(sample))
+
+    out_file = tmp_path / "copy.efu"
+    with EfuWriter(str(out_file), newline=nl) as writer:
+        writer.write_header(header)
+        writer.write_rows(rows)
+
+    assert out_file.read_bytes() == sample.read_bytes()
+
+
+def test_efu_writer_default_newline(tmp_path):
+    out_file = tmp_path / "lf.efu"
+    writer = EfuWriter(str(out_file))
+    writer.write_header(["Filename"])
+    writer.write_row(["x"])
+    writer.close()
+    writer.close()
+
+    assert out_file.read_bytes() == b"Filename\n\"x\"\n"
+
+
+def test_efu_writer_byte_order_mark_once(tmp_path):
+    out = tmp_path / "utf16.efu"
+    with EfuWriter(str(out), encoding="utf-16", batch_size=1) as writer:
+        writer.write_header(["Filename", "Size"])
+        writer.write_rows([["a", "1"], ["b", "2"]])
+
+    assert out.read_bytes().decode("utf-16") == 'Filename,Size\n"a",1\n"b",2\n'
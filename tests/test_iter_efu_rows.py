@@ -0,0 +1,133 @@
+import importlib
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
+
+from efu import efu_to_array, iter_efu_objects, iter_efu_rows
+
+iter_module = importlib.import_module('efu.iter_efu_rows')
+
+
+CSV_CONTENT = (
+    "Filename,Size,Date Modified,Date Created,Attributes\r\n"
+    "\"C:\\msys64\",,133876022280081366,133739602603410395,16\r\n"
+    "\"C:\\msys64\\autorebase.bat\",82,133262362720000000,133739602600000000,32\r\n"
+    "\"C:\\msys64\\clang64\",0,133665511886007850,133665511886007850,16\r\n"
+)
+
+
+def test_iter_efu_rows_simple(tmp_path):
+    sample_file = tmp_path / "sample.efu"
+    sample_file.write_text(CSV_CONTENT, newline="")
+
+    rows, header, nl = iter_efu_rows(str(sample_file))
+
+    assert header == [
+        "Filename",
+        "Size",
+        "Date Modified",
+        "Date Created",
+        "Attributes",
+    ]
+    assert nl == "\r\n"
+    assert next(rows) == [
+        "C:\\msys64", "", "133876022280081366", "133739602603410395", "16",
+    ]
+    assert len(list(rows)) == 2
+
+
+def test_iter_efu_rows_small_chunks(tmp_path, monkeypatch):
+    root = pathlib.Path(__file__).resolve().parents[1]
+    sample = root / 'samples' / 'sample1.efu'
+    expected, _, _ = efu_to_array(str(sample))
+
+    # Force chunk boundaries inside "\r\n" pairs and multi-byte characters.
+    monkeypatch.setattr(iter_module, "_CHUNK_SIZE", 7)
+    rows, _, nl = iter_efu_rows(str(sample))
+
+    assert list(rows) == expected
+    assert nl == "\r\n"
+
+
+def test_iter_efu_rows_multibyte_lf(tmp_path, monkeypatch):
+    content = "Filename,Size\n\"D:\\データ\\ファイル.txt\",5\n\"D:\\a,b\"\"c\",\n"
+    sample_file = tmp_path / "lf.efu"
+    sample_file.write_text(content, encoding="utf-8", newline="")
+
+    monkeypatch.setattr(iter_module, "_CHUNK_SIZE", 3)
+    rows, header, nl = iter_efu_rows(str(sample_file))
+
+    assert header == ["Filename", "Size"]
+    assert nl == "\n"
+    assert list(rows) == [
+        ["D:\\データ\\ファイル.txt", "5"],
+        ["D:\\a,b\"c", ""],
+    ]
+
+
+def test_iter_efu_objects(tmp_path):
+    sample_file = tmp_path / "sample.efu"
+    sample_file.write_text(CSV_CONTENT, newline="")
+
+    objects, header, nl = iter_efu_objects(str(sample_file))
+
+    assert nl == "\r\n"
+    first = next(objects)
+    assert first == {
+        "Filename": "C:\\msys64",
+        "Size": None,
+        "Date Modified": 133876022280081366,
+        "Date Created": 133739602603410395,
+        "Attributes": 16,
+    }
+    assert [obj["Size"] for obj in objects] == [82, 0]
+
+
+def test_utf16_encoding(tmp_path, monkeypatch):
+    import pytest
+
+    from efu import EfuStats, MappedEfu, array_to_efu
+
+    monkeypatch.setattr(iter_module, '_CHUNK_SIZE', 7)
+    rows = [['C:\\ü', '1'], ['C:\\"x", y', ''], ['C:\\日本', '3']]
+    path = tmp_path / 'utf16.efu'
+    array_to_efu(rows, ['Filename', 'Size'], str(path), newline='\r\n', encoding='utf-16')
+
+    expected = (rows, ['Filename', 'Size'], '\r\n')
+    assert efu_to_array(str(path), encoding='utf-16') == expected
+    assert efu_to_array(str(path), encoding='utf-16', workers=2) == expected
+    stats = EfuStats()
+    assert efu_to_array(str(path), encoding='utf-16', stats=stats) == expected
+    assert stats['rows_read'] == 3
+    assert stats['bytes_read'] == path.stat().st_size
+
+    header_only = tmp_path / 'header.efu'
+    array_to_efu([], ['Filename', 'Size'], str(header_only), encoding='utf-16')
+    assert efu_to_array(str(header_only), encoding='utf-16') == ([], ['Filename', 'Size'], '\n')
+
+    with pytest.raises(ValueError):
+        MappedEfu(str(path), encoding='utf-16')
+
+
+def test_newline_comes_from_header_line(tmp_path):
+    path = tmp_path / 'mixed.efu'
+    path.write_bytes(b'Filename,Size\n"C:\\a",1\r\n')
+    assert efu_to_array(str(path)) == ([['C:\\a', '1\r']], ['Filename', 'Size'], '\n')
+
+
+def test_parse_leaves_garbage_collector_state(tmp_path):
+    import gc
+
+    sample_file = tmp_path / "sample.efu"
+    sample_file.write_text(CSV_CONTENT, newline="")
+    thresholds = gc.get_threshold()
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        assert len(efu_to_array(str(sample_file))[0]) == 3
+        assert not gc.isenabled()
+        assert gc.get_threshold() == thresholds
+    finally:
+        if enabled:
+            gc.enable()
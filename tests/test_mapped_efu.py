@@ -0,0 +1,63 @@
+import pathlib
+import sys
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
+
+from efu import EfuRecord, MappedEfu, efu_to_array, efu_to_objects, objects_to_efu
+
+
+def test_mapped_efu_matches_efu_to_array():
+    root = pathlib.Path(__file__).resolve().parents[1]
+    sample = root / 'samples' / 'sample1.efu'
+    rows, header, nl = efu_to_array(str(sample))
+
+    with MappedEfu(str(sample)) as mapped:
+        assert mapped.header_fields == header
+        assert mapped.newline == nl
+        assert len(mapped) == len(rows)
+        assert mapped[0] == rows[0]
+        assert mapped[-1] == rows[-1]
+        assert mapped[100:110] == rows[100:110]
+        assert mapped[-1000:] == rows[-1000:]
+        assert list(mapped) == rows
+        with pytest.raises(IndexError):
+            mapped[len(rows)]
+
+
+def test_mapped_efu_lf_and_blank_lines(tmp_path):
+    sample_file = tmp_path / "lf.efu"
+    sample_file.write_text("Filename,Size\n\"a\",1\n\n\"b,c\",\n", newline="")
+
+    with MappedEfu(str(sample_file)) as mapped:
+        assert mapped.newline == "\n"
+        assert len(mapped) == 2
+        assert mapped[1] == ["b,c", ""]
+
+
+def test_mapped_efu_empty_file(tmp_path):
+    sample_file = tmp_path / "empty.efu"
+    sample_file.write_bytes(b"")
+
+    with MappedEfu(str(sample_file)) as mapped:
+        assert len(mapped) == 0
+        assert mapped.header_fields == [""]
+
+
+def test_mapped_efu_records(tmp_path):
+    root = pathlib.Path(__file__).resolve().parents[1]
+    sample = root / 'samples' / 'sample1.efu'
+    objects = efu_to_objects(str(sample))
+
+    with MappedEfu(str(sample)) as mapped:
+        records = mapped.records()
+        assert len(records) == len(objects)
+        assert isinstance(records[5], EfuRecord)
+        assert records[5] == objects[5]
+        assert records[-3:].data == objects[-3:]
+
+        out_file = tmp_path / "out.efu"
+        objects_to_efu(records, str(out_file), newline=mapped.newline)
+
+    assert out_file.read_bytes() == sample.read_bytes()
@@ -1,6 +1,8 @@
 import pathlib
 import sys
 
+import pytest
+
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
 
 from efu import EfuRecord, EfuRecords, objects_to_efu
@@ -100,3 +102,37 @@ def test_objects_to_efu_with_efu_records(tmp_path):
     with open(out_file, "r", newline="") as f:
         content = f.read()
     assert content == expected
+
+
+def test_objects_to_efu_generator(tmp_path):
+    header = ["Filename", "Size", "Attributes"]
+
+    def produce():
+        for i in range(3):
+            yield EfuRecord(header, {"Filename": f"f{i}.txt", "Size": i, "Attributes": 32})
+
+    out_file = tmp_path / "gen.efu"
+    objects_to_efu(produce(), str(out_file))
+
+    with open(out_file, "r", newline="") as f:
+        content = f.read()
+    assert content == (
+        "Filename,Size,Attributes\n"
+        "\"f0.txt\",0,32\n"
+        "\"f1.txt\",1,32\n"
+        "\"f2.txt\",2,32\n"
+    )
+
+
+def test_objects_to_efu_explicit_headers(tmp_path):
+    out_file = tmp_path / "empty.efu"
+    objects_to_efu([], str(out_file), newline="\r\n", headers=["Filename", "Size"])
+    assert out_file.read_bytes() == b"Filename,Size\r\n"
+
+    out_file = tmp_path / "subset.efu"
+    objs = [{"Size": -1, "Filename": "x", "Extra": 5}]
+    objects_to_efu(iter(objs), str(out_file), headers=["Filename", "Size"])
+    assert out_file.read_bytes() == b"Filename,Size\n\"x\",\"-1\"\n"
+
+    with pytest.raises(ValueError):
+        objects_to_efu(iter([]), str(tmp_path / "none.efu"))
@@ -0,0 +1,77 @@
+import bz2
+import gzip
+import io
+import lzma
+import pathlib
+import sys
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
+
+from efu import (
+    EfuWriter,
+    MappedEfu,
+    array_to_efu,
+    efu_to_array,
+    efu_to_objects,
+    iter_efu_rows,
+    main as cli_main,
+    open_efu,
+)
+
+SAMPLE = pathlib.Path(__file__).resolve().parents[1] / 'samples' / 'sample1.efu'
+MODULES = {'.gz': gzip, '.bz2': bz2, '.xz': lzma}
+
+
+@pytest.mark.parametrize('suffix', sorted(MODULES))
+def test_compressed_roundtrip(tmp_path, suffix):
+    original = SAMPLE.read_bytes()
+    src = tmp_path / f'in.efu{suffix}'
+    src.write_bytes(MODULES[suffix].compress(original))
+
+    rows, headers, nl = efu_to_array(str(src), workers=2)
+    assert (rows, headers, nl) == efu_to_array(str(SAMPLE))
+
+    out = tmp_path / f'out.efu{suffix}'
+    array_to_efu(rows, headers, out, newline=nl)
+    assert MODULES[suffix].decompress(out.read_bytes()) == original
+    with open_efu(out) as f:
+        assert f.read() == original
+
+
+def test_file_objects(tmp_path):
+    original = SAMPLE.read_bytes()
+    source = io.BytesIO(original)
+    rows, headers, nl = iter_efu_rows(source)
+    rows = list(rows)
+    assert not source.closed
+    assert len(rows) == len(efu_to_objects(io.BytesIO(original)))
+
+    sink = io.BytesIO()
+    array_to_efu(rows, headers, sink, newline=nl)
+    assert sink.getvalue() == original
+
+    text_sink = io.StringIO(newline='')
+    with EfuWriter(text_sink, newline=nl) as writer:
+        writer.write_header(headers)
+        writer.write_rows(rows[:2])
+    assert text_sink.getvalue().encode('utf-8') == b'\r\n'.join(original.split(b'\r\n')[:3]) + b'\r\n'
+    assert not text_sink.closed
+
+    with pytest.raises(TypeError):
+        iter_efu_rows(io.StringIO('Filename\n'))
+
+
+def test_mapped_efu_rejects_compressed(tmp_path):
+    src = tmp_path / 'in.efu.gz'
+    src.write_bytes(gzip.compress(SAMPLE.read_bytes()))
+    with pytest.raises(ValueError):
+        MappedEfu(str(src))
+
+
+def test_cli_roundtrip_compressed(tmp_path, capsys):
+    src = tmp_path / 'in.efu.xz'
+    src.write_bytes(lzma.compress(SAMPLE.read_bytes()))
+    cli_main([str(src), str(tmp_path / 'out.efu.gz')])
+    assert capsys.readouterr().out.strip() == 'Round-trip successful: files are identical'
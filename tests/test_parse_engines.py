@@ -0,0 +1,56 @@
+import pathlib
+import sys
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
+
+from efu import array_to_efu, efu_to_array
+
+
+TRICKY_LINES = [
+    'plain,1,2',
+    '"C:\\a",82,1,2,32',
+    '"C:\\a"',
+    '"a,b",1',
+    '"a""b",1',
+    '"a"""',
+    'a""b,1',
+    '"abc"def,2',
+    '"unterminated,3',
+    '"",,',
+    '"x""""y"',
+    ',"",""""',
+]
+
+
+@pytest.mark.parametrize("engine", ["python", "fast"])
+def test_roundtrip_with_engine(tmp_path, engine):
+    root = pathlib.Path(__file__).resolve().parents[1]
+    sample = root / 'samples' / 'sample1.efu'
+
+    rows, header_fields, nl = efu_to_array(str(sample), engine=engine)
+    out_file = tmp_path / 'out.efu'
+    array_to_efu(rows, header_fields, str(out_file), newline=nl)
+
+    assert out_file.read_bytes() == sample.read_bytes()
+
+
+def test_engines_agree(tmp_path):
+    sample_file = tmp_path / "tricky.efu"
+    sample_file.write_text("A,B,C\n" + "\n".join(TRICKY_LINES) + "\n", newline="")
+
+    python_rows, _, _ = efu_to_array(str(sample_file), engine="python")
+    fast_rows, _, _ = efu_to_array(str(sample_file), engine="fast")
+
+    assert fast_rows == python_rows
+    assert fast_rows[4] == ['a"b', '1']
+    assert fast_rows[6] == ['ab', '1']
+
+
+def test_unknown_engine(tmp_path):
+    sample_file = tmp_path / "sample.efu"
+    sample_file.write_text("Filename\n\"a\"\n", newline="")
+
+    with pytest.raises(ValueError):
+        efu_to_array(str(sample_file), engine="nope")
@@ -0,0 +1,54 @@
+import importlib
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
+
+from efu import efu_to_array, efu_to_objects, main as cli_main
+
+parallel = importlib.import_module('efu.parse_parallel')
+
+
+def test_efu_to_array_workers(monkeypatch):
+    root = pathlib.Path(__file__).resolve().parents[1]
+    sample = root / 'samples' / 'sample1.efu'
+    expected = efu_to_array(str(sample))
+
+    # Use many small ranges so the ordering of results is exercised.
+    monkeypatch.setattr(parallel, "_RANGE_SIZE", 4096)
+    assert efu_to_array(str(sample), workers=2) == expected
+
+
+def test_efu_to_objects_workers():
+    root = pathlib.Path(__file__).resolve().parents[1]
+    sample = root / 'samples' / 'sample1.efu'
+
+    assert efu_to_objects(str(sample), workers=2) == efu_to_objects(str(sample))
+
+
+def test_split_ranges_respects_newline(tmp_path):
+    # A lone "\n" inside a CRLF file is field content, not a row boundary.
+    content = b"A,B\r\n" + b"\"x\ny\",1\r\n" * 50
+    sample_file = tmp_path / "crlf.efu"
+    sample_file.write_bytes(content)
+
+    with open(sample_file, "rb") as f:
+        ranges = parallel._split_ranges(f, 5, len(content), 7, b"\r\n")
+
+    assert ranges[0][0] == 5
+    assert ranges[-1][1] == len(content)
+    for lo, hi in ranges:
+        assert content[lo - 2:lo] == b"\r\n"
+    rows, _, _ = efu_to_array(str(sample_file), workers=3)
+    assert rows == [["x\ny", "1"]] * 50
+
+
+def test_cli_jobs(tmp_path, capsys):
+    root = pathlib.Path(__file__).resolve().parents[1]
+    sample = root / 'samples' / 'sample1.efu'
+    out_file = tmp_path / 'out.efu'
+
+    cli_main([str(sample), str(out_file), '--jobs', '2'])
+
+    assert out_file.read_bytes() == sample.read_bytes()
+    assert capsys.readouterr().out.strip() == "Round-trip successful: files are identical"
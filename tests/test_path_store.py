@@ -0,0 +1,54 @@
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
+
+from efu import EfuTable, PathStore, efu_to_array
+
+
+def test_path_store_roundtrip_sample():
+    root = pathlib.Path(__file__).resolve().parents[1]
+    sample = root / 'samples' / 'sample1.efu'
+    rows, _, _ = efu_to_array(str(sample))
+    paths = [row[0] for row in rows]
+
+    store = PathStore(paths)
+
+    assert len(store) == len(paths)
+    assert list(store) == paths
+    assert store[0] == paths[0]
+    assert store[-1] == paths[-1]
+    assert store[10:20] == paths[10:20]
+    assert store.directory_count < len(paths) // 5
+
+
+def test_path_store_mixed_separators():
+    paths = [
+        "C:\\",
+        "C:\\a\\b.txt",
+        "/usr/lib/x.so",
+        "/usr/lib/",
+        "relative",
+        "\\\\server\\share\\f",
+        "D:/mixed\\path/file",
+        "",
+    ]
+    store = PathStore()
+    store.extend(paths)
+
+    assert list(store) == paths
+    assert [store[i] for i in range(len(paths))] == paths
+    assert store.directory(store._entry_dir[1]) == "C:\\a\\"
+
+
+def test_efu_table_compress_paths(tmp_path):
+    root = pathlib.Path(__file__).resolve().parents[1]
+    sample = root / 'samples' / 'sample1.efu'
+
+    table = EfuTable.from_file(str(sample), compress_paths=True)
+
+    assert isinstance(table._columns[0].values, PathStore)
+    assert table[3]["Filename"] == "C:\\msys64\\clang64\\bin"
+    out_file = tmp_path / "out.efu"
+    table.to_efu(str(out_file))
+    assert out_file.read_bytes() == sample.read_bytes()
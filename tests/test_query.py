@@ -0,0 +1,109 @@
+import pathlib
+import sys
+from datetime import datetime, timezone
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
+
+from efu import (
+    EfuQuery,
+    datetime_to_filetime,
+    efu_to_array,
+    filter_efu,
+    main as cli_main,
+    parse_attributes,
+    query_efu,
+)
+
+SAMPLE = pathlib.Path(__file__).resolve().parents[1] / 'samples' / 'sample1.efu'
+HEADERS = ['Filename', 'Size', 'Date Modified', 'Date Created', 'Attributes']
+ROWS = [
+    ['C:\\X\\big.iso', '2147483648', '200', '100', '34'],
+    ['C:\\X\\small.txt', '10', '300', '100', '32'],
+    ['C:\\X\\Sub', '', '250', '100', '18'],
+    ['C:\\Y\\big.ISO', '3221225472', '50', '40', '2'],
+    ['C:\\X\\short.bin'],
+]
+
+
+def _match(**kwargs):
+    return [row[0] for row in EfuQuery(**kwargs).filter_rows(ROWS, HEADERS)]
+
+
+def test_datetime_to_filetime():
+    # Documented in docs/filetime.md.
+    value = datetime(2025, 6, 5, 5, 28, 28, 452856, tzinfo=timezone.utc)
+    assert datetime_to_filetime(value) == 133935749084528560
+    assert datetime_to_filetime(value.replace(tzinfo=None)) == 133935749084528560
+
+
+def test_parse_attributes():
+    assert parse_attributes('rhsdan') == 1 | 2 | 4 | 16 | 32 | 128
+    assert parse_attributes(48) == 48
+    with pytest.raises(ValueError):
+        parse_attributes('Z')
+
+
+def test_predicates():
+    assert _match(min_size=1 << 30) == ['C:\\X\\big.iso', 'C:\\Y\\big.ISO']
+    assert _match(min_size=1 << 30, attributes='HA') == ['C:\\X\\big.iso']
+    assert _match(attributes='H', not_attributes='D') == ['C:\\X\\big.iso', 'C:\\Y\\big.ISO']
+    assert _match(min_modified=200, max_modified=250) == ['C:\\X\\big.iso', 'C:\\X\\Sub']
+    assert _match(max_created=40) == ['C:\\Y\\big.ISO']
+    assert _match(prefix='c:\\x\\') == [
+        'C:\\X\\big.iso', 'C:\\X\\small.txt', 'C:\\X\\Sub', 'C:\\X\\short.bin'
+    ]
+    assert _match(glob='*.iso') == ['C:\\X\\big.iso', 'C:\\Y\\big.ISO']
+    assert _match(glob='*.iso', case_sensitive=True) == ['C:\\X\\big.iso']
+    assert _match(regex=r'\\s[a-z]+\.') == ['C:\\X\\small.txt', 'C:\\X\\short.bin']
+    assert _match() == [row[0] for row in ROWS]
+
+
+def test_missing_column():
+    with pytest.raises(ValueError):
+        EfuQuery(min_size=1).compile(['Filename'])
+
+
+def test_query_efu_projection_and_objects():
+    rows, headers, nl = query_efu(
+        str(SAMPLE), EfuQuery(glob='*.dll', min_size=1 << 20), columns=['Size', 'Filename'],
+        objects=True,
+    )
+    found = list(rows)
+    all_rows, _, _ = efu_to_array(str(SAMPLE))
+    expected = [
+        {'Size': int(r[1]), 'Filename': r[0]}
+        for r in all_rows
+        if r[0].lower().endswith('.dll') and r[1].isdigit() and int(r[1]) >= 1 << 20
+    ]
+    assert headers == ['Size', 'Filename']
+    assert nl == '\r\n'
+    assert found == expected and found
+
+    with pytest.raises(ValueError):
+        query_efu(str(SAMPLE), EfuQuery(), columns=['Nope'])
+
+
+def test_filter_efu_keeps_rows_verbatim(tmp_path):
+    out = tmp_path / 'out.efu'
+    count = filter_efu(str(SAMPLE), str(out), EfuQuery(attributes='D'))
+
+    lines = SAMPLE.read_bytes().split(b'\r\n')
+    expected = [lines[0]] + [
+        line for line in lines[1:] if line and int(line.rsplit(b',', 1)[1]) & 16
+    ]
+    assert out.read_bytes() == b'\r\n'.join(expected) + b'\r\n'
+    assert count == len(expected) - 1
+
+
+def test_cli_filter(tmp_path, capsys):
+    out = tmp_path / 'out.efu'
+    cli_main([
+        'filter', str(SAMPLE), str(out), '--min-size', '1M', '--glob', '*.DLL',
+        '--modified-after', '2000-01-01', '--columns', 'Filename,Size',
+    ])
+    rows, headers, _ = efu_to_array(str(out))
+    assert headers == ['Filename', 'Size']
+    assert rows and all(int(size) >= 1 << 20 for _, size in rows)
+    assert capsys.readouterr().out.strip() == f'Wrote {len(rows)} matching rows to {out}'
@@ -0,0 +1,135 @@
+import os
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
+
+from efu import EfuRecords, objects_to_efu, rescan_directory
+
+
+HEADER = [
+    "Filename",
+    "Size",
+    "Date Modified",
+    "Date Created",
+    "Attributes",
+]
+OLD = 1_600_000_000
+
+
+def _make_tree(root):
+    for name in ("static", "grown", "shrunk"):
+        sub = root / name
+        sub.mkdir()
+        (sub / "a.txt").write_text("a")
+        (sub / "b.txt").write_text("bb")
+        os.utime(sub, (OLD, OLD))
+    os.utime(root, (OLD, OLD))
+
+
+def _by_name(records):
+    return {rec["Filename"]: rec for rec in records}
+
+
+def test_rescan_tracks_history(tmp_path):
+    _make_tree(tmp_path)
+    previous = EfuRecords()
+    previous.extend_from_directory(str(tmp_path), HEADER)
+    for rec in previous:
+        rec.first_seen = rec.last_seen = 100
+
+    (tmp_path / "grown" / "c.txt").write_text("ccc")
+    (tmp_path / "shrunk" / "b.txt").unlink()
+    # Content change without a directory change is not picked up.
+    static_a = tmp_path / "static" / "a.txt"
+    static_a.write_text("changed")
+    os.utime(tmp_path / "static", (OLD, OLD))
+
+    result = rescan_directory(previous, str(tmp_path))
+    records = _by_name(result)
+
+    new = records[str(tmp_path / "grown" / "c.txt")]
+    assert new["Size"] == 3
+    assert new.first_seen == new.last_seen > 100
+
+    lost = records[str(tmp_path / "shrunk" / "b.txt")]
+    assert lost.last_lost is not None and lost.last_lost > 100
+    assert lost.last_seen == 100
+    assert result[-1] is lost
+
+    kept = records[str(static_a)]
+    assert kept["Size"] == 1
+    assert kept.first_seen == 100
+    assert kept.last_seen > 100
+    assert kept.last_lost is None
+
+    assert len(result) == len(previous) + 1
+
+
+def test_rescan_from_efu_file(tmp_path):
+    root = tmp_path / "root"
+    root.mkdir()
+    _make_tree(root)
+    previous = EfuRecords()
+    previous.extend_from_directory(str(root), HEADER)
+    snapshot = tmp_path / "snapshot.efu"
+    objects_to_efu(previous, str(snapshot))
+
+    (root / "grown" / "c.txt").write_text("ccc")
+    result = rescan_directory(str(snapshot), str(root))
+
+    assert {rec["Filename"] for rec in result} == {
+        rec["Filename"] for rec in previous
+    } | {str(root / "grown" / "c.txt")}
+    assert all(rec.last_lost is None for rec in result)
+
+
+def test_rescan_missing_root(tmp_path):
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "f.txt").write_text("f")
+    previous = EfuRecords()
+    previous.extend_from_directory(str(root), HEADER)
+    (root / "f.txt").unlink()
+    root.rmdir()
+
+    result = rescan_directory(previous, str(root))
+
+    assert len(result) == 2
+    assert all(rec.last_lost is not None for rec in result)
+
+
+def test_rescan_twice_keeps_lost_entries_lost(tmp_path):
+    _make_tree(tmp_path)
+    previous = EfuRecords()
+    previous.extend_from_directory(str(tmp_path), HEADER)
+    for rec in previous:
+        rec.first_seen = rec.last_seen = 100
+    gone = str(tmp_path / "shrunk" / "a.txt")
+    os.unlink(gone)
+
+    first = rescan_directory(previous, str(tmp_path))
+    lost_at = _by_name(first)[gone].last_lost
+    assert lost_at is not None and lost_at > 100
+
+    second = rescan_directory(first, str(tmp_path))
+    lost = _by_name(second)[gone]
+    assert lost.last_seen == 100
+    assert lost.last_lost == lost_at
+    assert second[-1] is lost
+    assert len(second) == len(first)
+
+
+def test_rescan_from_efu_file_sets_first_seen(tmp_path):
+    root = tmp_path / "root"
+    root.mkdir()
+    _make_tree(root)
+    previous = EfuRecords()
+    previous.extend_from_directory(str(root), HEADER)
+    snapshot = tmp_path / "snapshot.efu"
+    objects_to_efu(previous, str(snapshot))
+
+    result = rescan_directory(str(snapshot), str(root))
+
+    assert all(rec.first_seen is not None for rec in result)
+    assert all(rec.first_seen == rec.last_seen for rec in result)
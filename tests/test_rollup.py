@@ -0,0 +1,119 @@
+import pathlib
+import sys
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
+
+from efu import FolderTotals, array_to_efu, efu_to_array, iter_folder_totals, rollup_efu
+
+SAMPLE = pathlib.Path(__file__).resolve().parents[1] / 'samples' / 'sample1.efu'
+HEADERS = ['Filename', 'Size', 'Date Modified', 'Date Created', 'Attributes']
+
+
+def test_iter_folder_totals_small_tree():
+    rows = [
+        ['/r', '', '5', '1', '16'],
+        ['/r/a', '4096', '7', '1', '16'],
+        ['/r/a/x', '10', '9', '1', '32'],
+        ['/r/a/y', '', '3', '1', '33'],
+        ['/r/a b', '1', '2', '1', '32'],
+        ['/r/c', '', '', '', '16'],
+        ['/top.txt', '100', '50', '1', '32'],
+    ]
+    totals = list(iter_folder_totals(rows, HEADERS))
+    assert totals == [
+        FolderTotals('/r/a', 10, 2, 9),
+        FolderTotals('/r/c', 0, 0, None),
+        FolderTotals('/r', 11, 3, 9),
+    ]
+
+
+def test_iter_folder_totals_requires_attributes():
+    with pytest.raises(ValueError):
+        list(iter_folder_totals([['/x', '1']], ['Filename', 'Size']))
+
+
+def test_rollup_sample(tmp_path):
+    out = tmp_path / 'filled.efu'
+    filled = rollup_efu(str(SAMPLE), str(out))
+
+    before, headers, nl = efu_to_array(str(SAMPLE))
+    after, headers_after, nl_after = efu_to_array(str(out))
+    assert (headers_after, nl_after) == (headers, nl)
+    assert len(after) == len(before)
+
+    changed = [(old, new) for old, new in zip(before, after) if old != new]
+    assert len(changed) == filled > 0
+    for old, new in changed:
+        assert int(old[4]) & 16 and old[1] == ''
+        assert old[:1] + old[2:] == new[:1] + new[2:]
+
+    root_size = sum(
+        int(row[1]) for row in before if not int(row[4]) & 16 and row[1]
+    )
+    assert after[0][0] == 'C:\\msys64'
+    assert after[0][1] == str(root_size)
+
+    # Rolling up the filled file again changes nothing.
+    again = tmp_path / 'again.efu'
+    assert rollup_efu(str(out), str(again)) == 0
+    assert again.read_bytes() == out.read_bytes()
+
+
+def test_rollup_overwrite(tmp_path):
+    src = tmp_path / 'in.efu'
+    src.write_bytes(
+        b'Filename,Size,Attributes\r\n"C:\\d",0,16\r\n"C:\\d\\f",12,32\r\n"C:\\d\\g",30,32\r\n'
+    )
+    keep = tmp_path / 'keep.efu'
+    assert rollup_efu(str(src), str(keep)) == 0
+    assert keep.read_bytes() == src.read_bytes()
+
+    out = tmp_path / 'out.efu'
+    assert rollup_efu(str(src), str(out), overwrite=True) == 1
+    assert out.read_bytes().splitlines()[1] == b'"C:\\d",42,16'
+
+
+def test_rollup_rejects_split_subtree(tmp_path):
+    # Plain string order puts 'C:\a-b.txt' between 'C:\a' and its contents.
+    rows = [
+        ['C:\\a', '', '1', '1', '16'],
+        ['C:\\a-b.txt', '5', '1', '1', '32'],
+        ['C:\\a\\x.txt', '100', '1', '1', '32'],
+    ]
+    with pytest.raises(ValueError, match='path order'):
+        list(iter_folder_totals(rows, HEADERS))
+    nested = [['C:\\r', '', '1', '1', '16']] + [
+        ['C:\\r' + row[0][2:]] + row[1:] for row in rows
+    ]
+    with pytest.raises(ValueError):
+        list(iter_folder_totals(nested, HEADERS))
+
+    src = tmp_path / 'in.efu'
+    array_to_efu(rows, HEADERS, str(src))
+    with pytest.raises(ValueError):
+        rollup_efu(str(src), str(tmp_path / 'out.efu'))
+
+    # In path order the file's size lands in its folder.
+    src.write_text('Filename,Size,Date Modified,Date Created,Attributes\n'
+                   '"C:\\a",,1,1,16\n"C:\\a\\x.txt",100,1,1,32\n"C:\\a-b.txt",5,1,1,32\n')
+    assert rollup_efu(str(src), str(tmp_path / 'out.efu')) == 1
+    assert efu_to_array(str(tmp_path / 'out.efu'))[0][0][1] == '100'
+
+
+def test_rollup_after_path_order_sort(tmp_path):
+    from efu import sort_efu
+
+    plain = tmp_path / 'plain.efu'
+    sort_efu(str(SAMPLE), str(plain))
+    with pytest.raises(ValueError, match="key='path'"):
+        rollup_efu(str(plain), str(tmp_path / 'fail.efu'))
+
+    tree = tmp_path / 'tree.efu'
+    sort_efu(str(SAMPLE), str(tree), key='path')
+    out = tmp_path / 'filled.efu'
+    expected = tmp_path / 'expected.efu'
+    assert rollup_efu(str(tree), str(out)) == rollup_efu(str(SAMPLE), str(expected)) > 0
+    totals = {row[0]: row[1] for row in efu_to_array(str(out))[0]}
+    assert totals == {row[0]: row[1] for row in efu_to_array(str(expected))[0]}
@@ -0,0 +1,106 @@
+import os
+import pathlib
+import sys
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
+
+from efu import EfuRecords, iter_scan, scan_directory
+
+
+HEADER = [
+    "Filename",
+    "Size",
+    "Date Modified",
+    "Date Created",
+    "Attributes",
+]
+
+
+def _make_tree(root):
+    for i in range(3):
+        sub = root / f"dir{i}"
+        sub.mkdir()
+        for j in range(4):
+            (sub / f"file{j}.txt").write_text("x" * j)
+        nested = sub / "nested"
+        nested.mkdir()
+        (nested / "deep.bin").write_bytes(b"\0" * 10)
+    (root / "top.txt").write_text("top")
+
+
+def _walk_paths(root):
+    paths = []
+    for dirpath, dirs, files in os.walk(root):
+        paths.append(dirpath)
+        paths.extend(os.path.join(dirpath, name) for name in files)
+    return paths
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_scan_matches_os_walk_order(tmp_path, workers):
+    _make_tree(tmp_path)
+
+    records = list(scan_directory(str(tmp_path), HEADER, workers=workers))
+
+    assert [rec["Filename"] for rec in records] == _walk_paths(str(tmp_path))
+    deep = next(r for r in records if r["Filename"].endswith("deep.bin"))
+    st = os.stat(deep["Filename"])
+    assert deep["Size"] == 10
+    assert deep["Date Modified"] == int(st.st_mtime * 10_000_000) + 116444736000000000
+    assert deep["Attributes"] == 32
+    assert deep.first_seen == deep.last_seen is not None
+    assert records[0]["Attributes"] == 16
+
+
+def test_extend_from_directory_workers(tmp_path):
+    _make_tree(tmp_path)
+
+    records = EfuRecords()
+    records.extend_from_directory(str(tmp_path), HEADER, workers=3)
+
+    assert {rec["Filename"] for rec in records} == set(_walk_paths(str(tmp_path)))
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink") or os.name == "nt", reason="needs POSIX symlinks")
+def test_scan_symlinks(tmp_path):
+    target = tmp_path / "target"
+    target.mkdir()
+    (target / "inner.txt").write_text("a")
+    (tmp_path / "link").symlink_to(target, target_is_directory=True)
+    (tmp_path / "broken").symlink_to(tmp_path / "missing")
+
+    paths = [entry[0] for entry in iter_scan(str(tmp_path), workers=2)]
+
+    # Linked directories are not followed and dangling links are skipped.
+    assert sorted(paths) == sorted([str(tmp_path), str(target), str(target / "inner.txt")])
+
+
+def test_scan_missing_root(tmp_path):
+    assert list(iter_scan(str(tmp_path / "missing"))) == []
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_scan_lists_directories_lazily(tmp_path, monkeypatch, workers):
+    module = sys.modules["efu.scan_directory"]
+
+    for i in range(50):
+        (tmp_path / f"d{i:02d}").mkdir()
+        (tmp_path / f"d{i:02d}" / "f.txt").write_text("x")
+    listed = []
+    list_directory = module._list_directory
+
+    def counting(path):
+        listed.append(path)
+        return list_directory(path)
+
+    monkeypatch.setattr(module, "_list_directory", counting)
+    entries = iter_scan(str(tmp_path), workers=workers)
+    for path, _, _ in entries:
+        if path.endswith("f.txt"):
+            break
+    entries.close()
+
+    # The root and the first subdirectory, plus at most ``workers`` ahead.
+    assert len(listed) <= 2 + (workers if workers > 1 else 0)
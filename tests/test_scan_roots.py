@@ -0,0 +1,110 @@
+import os
+import pathlib
+import sys
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
+
+from efu import (
+    EfuRecords,
+    EfuSchema,
+    iter_efu_objects,
+    iter_scan_roots,
+    main as cli_main,
+    scan_roots_to_efu,
+)
+from efu.efu_record import DEFAULT_HEADERS
+
+
+def _make_roots(tmp_path):
+    roots = []
+    for name, count in (('disk1', 5), ('disk2', 12), ('disk3', 0)):
+        root = tmp_path / 'mnt' / name
+        (root / 'sub').mkdir(parents=True)
+        for i in range(count):
+            (root / 'sub' / f'{i}.dat').write_bytes(b'x' * i)
+        roots.append(str(root))
+    return roots
+
+
+def _scan_one(root):
+    records = EfuRecords()
+    records.extend_from_directory(root, DEFAULT_HEADERS)
+    return [dict(rec) for rec in records]
+
+
+def test_iter_scan_roots_tags_records(tmp_path):
+    roots = _make_roots(tmp_path)
+
+    records = list(iter_scan_roots(roots, DEFAULT_HEADERS, batch_size=3))
+
+    for root in roots:
+        mine = [dict(rec) for rec in records if rec.root == root]
+        # Entries of one root keep their scan order.
+        assert mine == _scan_one(root)
+    assert len(records) == sum(len(_scan_one(root)) for root in roots)
+
+
+def test_extend_from_roots_compact(tmp_path):
+    roots = _make_roots(tmp_path)
+    records = EfuRecords()
+    records.extend_from_roots(roots, EfuSchema.for_headers(DEFAULT_HEADERS), workers_per_root=2)
+    assert {rec.root for rec in records} == set(roots)
+    assert sorted(rec['Filename'] for rec in records) == sorted(
+        obj['Filename'] for root in roots for obj in _scan_one(root)
+    )
+
+
+def test_scan_roots_merged(tmp_path):
+    roots = _make_roots(tmp_path)
+    out = tmp_path / 'all.efu'
+
+    stats = scan_roots_to_efu(roots, file_path=str(out), batch_size=4)
+
+    objects, headers, _ = iter_efu_objects(str(out))
+    objects = list(objects)
+    assert headers == DEFAULT_HEADERS
+    assert [s.root for s in stats] == roots
+    assert [s.entries for s in stats] == [len(_scan_one(root)) for root in roots]
+    assert all(s.file_path == str(out) for s in stats)
+    assert all(s.entries_per_second > 0 for s in stats)
+    assert sorted(obj['Filename'] for obj in objects) == sorted(
+        obj['Filename'] for root in roots for obj in _scan_one(root)
+    )
+
+
+def test_scan_roots_sharded(tmp_path):
+    roots = _make_roots(tmp_path)
+    twin = tmp_path / 'other' / 'disk1'
+    twin.mkdir(parents=True)
+    roots.append(str(twin))
+    out_dir = tmp_path / 'shards'
+
+    stats = scan_roots_to_efu(roots, out_dir=str(out_dir))
+
+    assert [os.path.basename(s.file_path) for s in stats] == [
+        'disk1.efu', 'disk2.efu', 'disk3.efu', 'disk1-2.efu'
+    ]
+    for s in stats:
+        objects, _, _ = iter_efu_objects(s.file_path)
+        assert list(objects) == _scan_one(s.root)
+
+
+def test_scan_roots_requires_one_destination(tmp_path):
+    with pytest.raises(ValueError):
+        scan_roots_to_efu([str(tmp_path)])
+    with pytest.raises(ValueError):
+        scan_roots_to_efu([str(tmp_path)], file_path='a.efu', out_dir='b')
+
+
+def test_cli_scan_multiple_roots(tmp_path, capsys):
+    roots = _make_roots(tmp_path)
+    out_dir = tmp_path / 'shards'
+
+    cli_main(['scan', *roots, str(out_dir), '--shard'])
+
+    lines = capsys.readouterr().out.strip().splitlines()
+    assert len(lines) == 3
+    assert lines[0].startswith(f'{roots[0]}: ')
+    assert sorted(os.listdir(out_dir)) == ['disk1.efu', 'disk2.efu', 'disk3.efu']
@@ -0,0 +1,79 @@
+import importlib
+import pathlib
+import sys
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
+
+from efu import EfuRecords, iter_efu_objects, main as cli_main, scan_to_efu
+from efu.efu_record import DEFAULT_HEADERS
+
+
+def _make_tree(root):
+    (root / 'a' / 'b').mkdir(parents=True)
+    (root / 'c').mkdir()
+    for i in range(30):
+        (root / 'a' / f'f{i}.txt').write_text('x' * i)
+    (root / 'a' / 'b' / 'deep.bin').write_bytes(b'\0' * 100)
+    (root / 'c' / 'q"uote, name.txt').write_text('q')
+
+
+def test_scan_to_efu_matches_scan_directory(tmp_path):
+    root = tmp_path / 'tree'
+    root.mkdir()
+    _make_tree(root)
+    out = tmp_path / 'out.efu'
+
+    count = scan_to_efu(str(root), str(out), newline='\r\n', queue_size=1, batch_size=4)
+
+    records = EfuRecords()
+    records.extend_from_directory(str(root), DEFAULT_HEADERS)
+    objects, headers, newline = iter_efu_objects(str(out))
+    objects = list(objects)
+    assert headers == DEFAULT_HEADERS
+    assert newline == '\r\n'
+    assert count == len(records) == len(objects)
+    assert objects == [dict(rec) for rec in records]
+
+
+def test_scan_to_efu_custom_headers(tmp_path):
+    root = tmp_path / 'tree'
+    root.mkdir()
+    (root / 'x.txt').write_text('hello')
+    out = tmp_path / 'out.efu'
+
+    scan_to_efu(str(root), str(out), headers=['Filename', 'Size', 'Owner'])
+
+    objects, headers, _ = iter_efu_objects(str(out))
+    assert headers == ['Filename', 'Size', 'Owner']
+    by_name = {obj['Filename']: obj for obj in objects}
+    assert by_name[str(root / 'x.txt')] == {
+        'Filename': str(root / 'x.txt'), 'Size': 5, 'Owner': None
+    }
+
+
+def test_scan_to_efu_propagates_scan_errors(tmp_path, monkeypatch):
+    module = importlib.import_module('efu.scan_to_efu')
+
+    def broken(dir_path, workers=1, stats=None):
+        yield from ()
+        raise RuntimeError('scan failed')
+
+    monkeypatch.setattr(module, 'iter_scan', broken)
+    with pytest.raises(RuntimeError, match='scan failed'):
+        scan_to_efu(str(tmp_path), str(tmp_path / 'out.efu'))
+
+
+def test_cli_scan(tmp_path, capsys):
+    root = tmp_path / 'tree'
+    root.mkdir()
+    _make_tree(root)
+    out = tmp_path / 'out.efu'
+
+    cli_main(['scan', str(root), str(out), '--jobs', '2', '--newline', 'lf'])
+
+    objects, _, newline = iter_efu_objects(str(out))
+    objects = list(objects)
+    assert newline == '\n'
+    assert capsys.readouterr().out.strip() == f'Wrote {len(objects)} entries to {out}'
@@ -0,0 +1,98 @@
+import gzip
+import pathlib
+import shutil
+import sys
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
+
+from efu import EfuStats, main as cli_main, verify_efu
+
+SAMPLE = pathlib.Path(__file__).resolve().parents[1] / 'samples' / 'sample1.efu'
+# Row 2 has an unquoted name, which the writer quotes.
+MISMATCH = b'Filename,Size\r\n"a",1\r\nb,2\r\n"c",3\r\n'
+
+
+def test_identical_without_output():
+    result = verify_efu(str(SAMPLE))
+    assert result.identical
+    assert result.rows == 17500
+    assert result.offset is None and result.row is None
+
+
+def test_output_copy(tmp_path):
+    out = tmp_path / 'out.efu'
+    assert verify_efu(str(SAMPLE), str(out)).identical
+    assert out.read_bytes() == SAMPLE.read_bytes()
+
+
+def test_reports_first_difference(tmp_path):
+    path = tmp_path / 'bad.efu'
+    path.write_bytes(MISMATCH)
+    result = verify_efu(str(path))
+    assert not result.identical
+    assert result.offset == MISMATCH.index(b'b,2')
+    assert result.row == 2
+
+    out = tmp_path / 'out.efu'
+    result = verify_efu(str(path), str(out))
+    assert (result.identical, result.offset, result.row) == (False, 22, 2)
+    assert out.read_bytes() == MISMATCH.replace(b'b,2', b'"b",2')
+
+
+def test_stops_at_first_difference(tmp_path):
+    path = tmp_path / 'big.efu'
+    lines = [b'Filename,Size\n', b'unquoted,1\n'] + [b'"x%d",%d\n' % (i, i) for i in range(100000)]
+    path.write_bytes(b''.join(lines))
+    result = verify_efu(str(path))
+    assert (result.identical, result.offset, result.row) == (False, 14, 1)
+    assert result.rows < 100000
+
+
+def test_length_differences(tmp_path):
+    path = tmp_path / 'trailing.efu'
+    path.write_bytes(b'Filename\r\n"a"\r\n\r\n')
+    result = verify_efu(str(path))
+    assert (result.identical, result.offset, result.row) == (False, 15, 2)
+
+
+def test_hash_mode(tmp_path):
+    result = verify_efu(str(SAMPLE), hash_name='sha256')
+    assert result.identical
+    assert len(result.digest) == 64
+    path = tmp_path / 'bad.efu'
+    path.write_bytes(MISMATCH)
+    result = verify_efu(str(path), hash_name='md5')
+    assert not result.identical
+    assert result.offset is None
+    with pytest.raises(ValueError):
+        verify_efu(str(SAMPLE), hash_name='no-such-hash')
+
+
+def test_compressed_and_parallel(tmp_path):
+    path = tmp_path / 'sample.efu.gz'
+    with open(SAMPLE, 'rb') as src, gzip.open(path, 'wb') as dst:
+        shutil.copyfileobj(src, dst)
+    assert verify_efu(str(path)).identical
+    stats = EfuStats()
+    assert verify_efu(str(SAMPLE), workers=2, hash_name='sha1', stats=stats).identical
+    assert stats['rows_written'] == 17500
+
+
+def test_cli_verification_modes(tmp_path, capsys):
+    cli_main([str(SAMPLE)])
+    assert capsys.readouterr().out.strip() == "Round-trip successful: files are identical"
+    cli_main([str(SAMPLE), '--no-output', '--hash', 'sha256'])
+    out = capsys.readouterr().out.splitlines()
+    assert out[0].startswith('sha256 ')
+    assert out[1] == "Round-trip successful: files are identical"
+
+    path = tmp_path / 'bad.efu'
+    path.write_bytes(MISMATCH)
+    cli_main([str(path)])
+    assert capsys.readouterr().out.strip() == (
+        "Round-trip failed: files differ at byte 22 (row 2)"
+    )
+    with pytest.raises(SystemExit):
+        cli_main([str(path), str(tmp_path / 'out.efu'), '--no-output'])